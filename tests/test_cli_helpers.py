@@ -0,0 +1,342 @@
+"""
+CLI helper tests.
+
+Copyright (c) 2024 Roach Labs. All rights reserved.
+Made by James Michael Roach Jr.
+Proprietary and confidential. Unauthorized use or distribution is prohibited.
+"""
+
+import datetime
+import json
+import logging
+import os
+import sys
+
+import pytest
+
+from void import cli
+
+
+def _touch(path, mtime, data="x"):
+    path.write_text(data)
+    os.utime(path, (mtime, mtime))
+
+
+def test_recent_entries_returns_newest_first(tmp_path):
+    for index in range(5):
+        _touch(tmp_path / f"file{index}.log", 1_000_000 + index, "x" * (index + 1))
+    (tmp_path / "folder").mkdir()
+    os.utime(tmp_path / "folder", (2_000_000, 2_000_000))
+
+    entries = cli._recent_entries(tmp_path, limit=3)
+
+    assert entries == [
+        ("folder", 0, True),
+        ("file4.log", 5, False),
+        ("file3.log", 4, False),
+    ]
+
+
+def test_recent_entries_filters_suffix_and_missing_dir(tmp_path):
+    _touch(tmp_path / "a.log", 1_000_000)
+    _touch(tmp_path / "b.txt", 2_000_000)
+
+    assert [name for name, _, _ in cli._recent_entries(tmp_path, suffix=".log")] == ["a.log"]
+    assert cli._recent_entries(tmp_path / "missing") == []
+
+
+def test_recent_entries_caches_empty_dir_until_mtime_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "_EMPTY_DIRS", {})
+    os.utime(tmp_path, (1_000_000, 1_000_000))
+
+    assert cli._recent_entries(tmp_path) == []
+    assert (str(tmp_path), None) in cli._EMPTY_DIRS
+
+    _touch(tmp_path / "new.log", 1_000_100)
+    assert [name for name, _, _ in cli._recent_entries(tmp_path)] == ["new.log"]
+    assert cli._EMPTY_DIRS == {}
+
+
+def test_recent_entries_parallel_stat_matches_serial(tmp_path, monkeypatch):
+    for index in range(20):
+        _touch(tmp_path / f"file{index:02}.bak", 1_000_000 + index, "x" * index)
+    serial = cli._recent_entries(tmp_path, limit=5)
+
+    monkeypatch.setattr(cli, "_PARALLEL_STAT_MIN", 1)
+
+    assert cli._recent_entries(tmp_path, limit=5) == serial
+    assert serial[0] == ("file19.bak", 19, False)
+
+
+def test_newest_picks_latest_matching_entry(tmp_path):
+    _touch(tmp_path / "old.log", 1_000_000)
+    _touch(tmp_path / "new.log", 1_000_200)
+    _touch(tmp_path / "newer.txt", 1_000_300)
+
+    assert cli._newest(tmp_path, suffix=".log") == tmp_path / "new.log"
+    assert cli._newest(tmp_path) == tmp_path / "newer.txt"
+    assert cli._newest(tmp_path, suffix=".bak") is None
+    assert cli._newest(tmp_path / "missing") is None
+
+
+@pytest.mark.parametrize("fd_cleanup", [True, False])
+def test_cleanup_dir_removes_only_stale_entries(tmp_path, monkeypatch, fd_cleanup):
+    monkeypatch.setattr(cli, "_FD_CLEANUP", cli._FD_CLEANUP and fd_cleanup)
+    stale = 1_000_000
+    _touch(tmp_path / "old.json", stale)
+    (tmp_path / "old_dir").mkdir()
+    _touch(tmp_path / "old_dir" / "nested.txt", stale)
+    os.utime(tmp_path / "old_dir", (stale, stale))
+    (tmp_path / "fresh.json").write_text("{}")
+
+    removed = cli._cleanup_dir(tmp_path, 7)
+
+    assert removed == 2
+    assert sorted(os.listdir(tmp_path)) == ["fresh.json"]
+    assert cli._cleanup_dir(tmp_path / "missing", 7) == 0
+
+
+def test_discard_dir_moves_tree_aside_and_sweeps_trash(tmp_path):
+    cache = tmp_path / "cache"
+    (cache / "nested").mkdir(parents=True)
+    (cache / "nested" / "blob.bin").write_text("x")
+    (tmp_path / "cache.trash-1-1").mkdir()
+
+    cli._discard_dir(cache).join(timeout=5)
+
+    assert not cache.exists()
+    assert os.listdir(tmp_path) == []
+    assert cli._discard_dir(tmp_path / "missing") is None
+
+
+def test_check_tools_reuses_result_within_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "_TOOL_CACHE", {})
+
+    def probe():
+        calls.append(1)
+        return ["adb"]
+
+    assert cli._check_tools("Android", probe) == ["adb"]
+    assert cli._check_tools("Android", probe) == ["adb"]
+    assert len(calls) == 1
+
+    monkeypatch.setattr(cli, "_TOOL_CACHE_TTL", 0)
+    cli._check_tools("Android", probe)
+    assert len(calls) == 2
+
+
+def test_cached_statistics_reuses_result_while_db_file_is_unchanged(tmp_path, monkeypatch):
+    db_path = tmp_path / "void.db"
+    db_path.write_bytes(b"x")
+    calls = []
+    monkeypatch.setattr(cli.Config, "DB_PATH", db_path)
+    monkeypatch.setattr(cli, "_STATS_CACHE", None)
+    monkeypatch.setattr(cli, "_STATS_TTL", 0)
+    monkeypatch.setattr(cli.db, "get_statistics", lambda: calls.append(1) or {"calls": len(calls)})
+
+    os.utime(db_path, (1_000_000, 1_000_000))
+
+    assert cli._cached_statistics() == {"calls": 1}
+    assert cli._cached_statistics() == {"calls": 1}
+
+    db_path.write_bytes(b"xy")
+    os.utime(db_path, (1_000_100, 1_000_100))
+    assert cli._cached_statistics() == {"calls": 2}
+
+
+def test_cached_statistics_ignores_unsettled_db_mtime(tmp_path, monkeypatch):
+    db_path = tmp_path / "void.db"
+    db_path.write_bytes(b"x")
+    calls = []
+    monkeypatch.setattr(cli.Config, "DB_PATH", db_path)
+    monkeypatch.setattr(cli, "_STATS_CACHE", None)
+    monkeypatch.setattr(cli, "_STATS_TTL", 0)
+    monkeypatch.setattr(cli.db, "get_statistics", lambda: calls.append(1) or {"calls": len(calls)})
+
+    # Just written: a same-tick, same-size write could still be hiding behind this mtime.
+    assert cli._cached_statistics() == {"calls": 1}
+    assert cli._cached_statistics() == {"calls": 2}
+
+
+def test_tail_lines_matches_forward_read(tmp_path):
+    log = tmp_path / "void.log"
+    log.write_text("".join(f"line {index}\n" for index in range(2000)) + "partial")
+
+    assert cli._tail_lines(log, 3, block=64) == ["line 1998", "line 1999", "partial"]
+    assert len(cli._tail_lines(log, 5000)) == 2001
+    (tmp_path / "empty.log").write_text("")
+    assert cli._tail_lines(tmp_path / "empty.log", 10) == []
+
+
+def test_str_view_stringifies_on_access():
+    view = cli._StrView({"mode": "edl", "usb_vid": 0x05C6, "serial": None})
+
+    assert view["usb_vid"] == "1478"
+    assert view.get("serial") == "None"
+    assert view.get("usb_pid", "-") == "-"
+    assert dict(view) == {"mode": "edl", "usb_vid": "1478", "serial": "None"}
+
+
+def test_search_commands_matches_per_blob_scan():
+    _, _, search_index = cli._build_command_catalog()
+    blobs = search_index.text.split("\n")
+    assert tuple(blobs) == search_index.blobs
+
+    for keyword in ("backup", "edl-sp", "e", "ba", "", "zzz", "help\nexit", "device id", "backupx"):
+        expected = [
+            command for blob, command in zip(blobs, search_index.commands) if keyword in blob
+        ]
+        assert cli._search_commands(search_index, keyword) == expected
+
+
+@pytest.mark.parametrize("line", ["help", "HELP", "plugins", "plugin system-info", "info  dev1\tx"])
+def test_split_command_matches_full_split(line):
+    parts = line.split()
+    assert cli._split_command(line) == (parts[0].lower(), parts[1:])
+
+
+def test_split_command_interns_only_short_command_words():
+    command, _ = cli._split_command("Logs-JSON now")
+    assert command is sys.intern("logs-json")
+
+    long_word = "x" * (cli._INTERN_MAX_LEN + 1)
+    assert cli._split_command(long_word + "y")[0] is not sys.intern(long_word + "y")
+
+
+@pytest.mark.parametrize(
+    "obj, default",
+    [
+        ({"steps": [1, 2.5, None, True], "nested": {"key": "value"}}, None),
+        ({"when": datetime.datetime(2024, 1, 1, 12, 30)}, str),
+        ({1: "int key"}, None),
+        ({"model": "Galaxy Ünïcode ✓"}, None),
+    ],
+)
+def test_json_text_matches_stdlib(obj, default):
+    assert cli._json_text(obj, default) == json.dumps(obj, indent=2, default=default)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        [{"level": "info", "message": "ok", "id": 1}],
+        {"counts": {1: 2, "3": 4}},
+        {"empty": []},
+        {"model": "Galaxy Ünïcode ✓"},
+    ],
+)
+def test_dump_json_matches_stdlib(tmp_path, obj):
+    path = tmp_path / "export.json"
+    cli._dump_json(path, obj)
+    assert path.read_text(encoding="utf-8") == json.dumps(obj, indent=2)
+
+
+@pytest.mark.parametrize(
+    "event_data, expected",
+    [
+        ('{"report_name": "R1"}', "R1"),
+        ("{}", "Unknown"),
+        ("not json", "Unknown"),
+        ("[1, 2]", "Unknown"),
+        (None, "Unknown"),
+    ],
+)
+def test_report_name_tolerates_bad_event_data(event_data, expected):
+    assert cli._report_name(event_data) == expected
+
+
+def test_buffered_emit_batches_until_flush(capsys, monkeypatch):
+    monkeypatch.setattr(cli, "_EMIT_BATCH", 3)
+    emit = cli._BufferedEmit()
+
+    emit("one")
+    emit("two")
+    assert capsys.readouterr().out == ""
+    emit("three")
+    assert capsys.readouterr().out == "one\ntwo\nthree\n"
+    emit("four")
+    emit.flush()
+    assert capsys.readouterr().out == "four\n"
+
+
+def test_write_help_uses_text_stream_when_captured(capsys):
+    cli._write_help()
+    assert capsys.readouterr().out == cli._HELP_TEXT + "\n"
+
+
+def test_write_help_writes_bytes_to_descriptor(capfd):
+    print("before")
+    cli._write_help()
+    assert capfd.readouterr().out == "before\n" + cli._HELP_TEXT + "\n"
+
+
+def test_names_with_prefix_matches_linear_scan():
+    names = tuple(
+        sorted(["edl-dump", "edl-status", "edl-sparse", "exports", "logs", "logs-json", "e"])
+    )
+
+    for prefix in ("edl-s", "e", "logs", "", "z", "edl-sparsex"):
+        assert cli._names_with_prefix(names, prefix) == [n for n in names if n.startswith(prefix)]
+
+
+def test_menu_shortcuts_match_first_entry_and_numbers():
+    menu = cli._menu(
+        cli.MenuItem("One", "first", "a", command="version"),
+        cli.MenuItem("Two", "second", "a", command="paths"),
+        cli.MenuItem("Three", "third", "", command="env"),
+    )
+    shell = cli.CLI.__new__(cli.CLI)
+
+    assert shell._match_menu_choice("a", menu).label == "One"
+    assert shell._match_menu_choice("3", menu).label == "Three"
+    assert shell._match_menu_choice("4", menu) is None
+    assert shell._match_menu_choice("", menu) is None
+
+
+def test_every_menu_entry_resolves():
+    shell = cli.CLI.__new__(cli.CLI)
+    shell.command_aliases = {}
+    dispatch = shell._build_dispatch()
+    pending = [cli._MAIN_MENU]
+    while pending:
+        for item in pending.pop().items:
+            if item.submenu:
+                pending.append(item.submenu)
+            elif item.command:
+                assert cli._split_command(item.command)[0] in dispatch, item.label
+            elif item.action:
+                assert getattr(cli.CLI, item.action.__name__) is item.action, item.label
+            else:
+                assert item.exit, item.label
+
+
+def test_repl_logs_usage_errors_without_traceback(monkeypatch, caplog):
+    shell = cli.CLI.__new__(cli.CLI)
+    shell.logger = logging.getLogger("test_cli_repl")
+    shell.command_aliases = {}
+    shell._start_monitor = False
+    shell._print_banner = shell._smart_startup = shell._setup_readline = lambda: None
+
+    def reject(args):
+        raise cli.CLIUsageError("bad value")
+
+    def broken(args):
+        raise KeyError("missing")
+
+    shell._dispatch = {"reject": reject, "broken": broken}
+    lines = iter(["reject", "broken"])
+
+    def fake_input(prompt):
+        try:
+            return next(lines)
+        except StopIteration:
+            raise SystemExit from None
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    with pytest.raises(SystemExit):
+        shell.run()
+
+    usage, bug = caplog.records
+    assert (usage.levelname, usage.exc_info) == ("WARNING", None)
+    assert bug.levelname == "ERROR" and bug.exc_info[0] is KeyError
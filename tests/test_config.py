@@ -51,3 +51,31 @@ def test_config_setup_creates_dirs(tmp_path, monkeypatch):
 
     for directory in expected_dirs:
         assert directory.exists()
+
+
+def test_read_config_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    config = load_config(tmp_path, monkeypatch)
+    config.Config.write_config({"settings": {"smart_enabled": True}})
+
+    first = config.Config.read_config()
+    first["settings"]["smart_enabled"] = False
+    assert config.Config.read_config() == {"settings": {"smart_enabled": True}}
+
+    config.Config.write_config({"settings": {"smart_enabled": False}})
+    assert config.Config.read_config() == {"settings": {"smart_enabled": False}}
+
+
+def test_read_config_ignores_cache_for_unsettled_mtime(tmp_path, monkeypatch):
+    import os
+
+    config = load_config(tmp_path, monkeypatch)
+    path = config.Config.CONFIG_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('{"a": true}')
+    stamp = path.stat().st_mtime_ns
+    assert config.Config.read_config() == {"a": True}
+
+    # Same size in the same mtime tick: only the settle window keeps this from going stale.
+    path.write_text('{"a": 1234}')
+    os.utime(path, ns=(stamp, stamp))
+    assert config.Config.read_config() == {"a": 1234}
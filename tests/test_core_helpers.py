@@ -249,3 +249,108 @@ def test_check_adb_ready(tmp_path, monkeypatch):
     )
 
     assert core.DeviceDetector._check_adb_ready("device-2") is False
+
+
+def test_verify_hash_matches_streamed_sha256(tmp_path, monkeypatch):
+    import hashlib
+
+    from void.core import edl_toolkit
+
+    image = tmp_path / "boot.img"
+    image.write_bytes(b"\x00\x01boot" * 50000)
+    expected = hashlib.sha256(image.read_bytes()).hexdigest()
+
+    result = edl_toolkit.verify_hash(image, expected.upper())
+    assert result.success
+    assert result.data["sha256"] == expected
+
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    assert edl_toolkit.verify_hash(image, expected).data["sha256"] == expected
+
+
+def test_copy_file_preserves_content_and_mtime(tmp_path):
+    import os
+
+    from void.core.utils import copy_file
+
+    src = tmp_path / "boot.img"
+    src.write_bytes(b"data" * 4096)
+    os.utime(src, (1_000_000, 1_000_000))
+    dst = tmp_path / "copy.img"
+
+    copy_file(src, dst)
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime == src.stat().st_mtime
+
+
+def test_copy_file_falls_back_when_copy_file_range_returns_zero(tmp_path, monkeypatch):
+    import os
+
+    from void.core.utils import copy_file
+
+    src = tmp_path / "void.db"
+    src.write_bytes(b"data" * 4096)
+    os.utime(src, (1_000_000, 1_000_000))
+    dst = tmp_path / "void.db.bak"
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+
+    copy_file(src, dst)
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime == src.stat().st_mtime
+
+
+def _logcat_viewer_for(script):
+    import sys
+
+    from void.core.logcat import LogcatViewer
+
+    viewer = LogcatViewer()
+    viewer.process = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE)
+    viewer.running = True
+    return viewer
+
+
+def test_logcat_read_lines_batches_a_pipe_burst():
+    viewer = _logcat_viewer_for(
+        "import sys\nsys.stdout.write(''.join(f'line {i}\\n' for i in range(20000)))"
+    )
+
+    batches = []
+    while (lines := viewer.read_lines()) is not None:
+        batches.append(lines)
+    viewer.process.wait()
+
+    assert [line for batch in batches for line in batch] == [f"line {i}" for i in range(20000)]
+    assert len(batches) < 100
+
+
+def test_logcat_read_lines_carries_partial_lines():
+    viewer = _logcat_viewer_for(
+        "import sys, time\n"
+        "sys.stdout.write('a\\nb'); sys.stdout.flush(); time.sleep(0.2)\n"
+        "sys.stdout.write('c\\nd'); sys.stdout.flush()"
+    )
+
+    assert viewer.read_lines() == ["a"]
+    assert viewer.read_lines() == ["bc"]
+    assert viewer.read_lines() == ["d"]
+    assert viewer.read_lines() is None
+    viewer.process.wait()
+
+
+def test_list_head_matches_full_listing(monkeypatch):
+    from void.core import files
+
+    listing = "total 48\n" + "\n".join(
+        f"-rw-r--r-- 1 root root {i} 2024-01-01 10:00 file {i}" for i in range(25)
+    )
+    monkeypatch.setattr(files.SafeSubprocess, "run", lambda cmd: (0, listing, ""))
+
+    entries = files.FileManager.list_files("dev1")
+    head, remaining = files.FileManager.list_head("dev1", limit=20)
+
+    assert head == entries[:20]
+    assert remaining == len(entries) - 20 == 5
+    assert files.FileManager.list_head("dev1", limit=30) == (entries, 0)
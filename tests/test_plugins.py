@@ -0,0 +1,78 @@
+"""
+Plugin registry tests.
+
+Copyright (c) 2024 Roach Labs. All rights reserved.
+Made by James Michael Roach Jr.
+Proprietary and confidential. Unauthorized use or distribution is prohibited.
+"""
+
+import sys
+
+import pytest
+
+from void.plugins import (
+    PluginContext,
+    PluginExecutionError,
+    PluginFeature,
+    PluginMetadata,
+    PluginResult,
+)
+from void.plugins.registry import PluginRegistry
+
+
+def _plugin(plugin_id, name):
+    class _Plugin(PluginFeature):
+        metadata = PluginMetadata(id=plugin_id, name=name, description="test")
+
+        def run(self, context, args):
+            return PluginResult(success=True, message=plugin_id)
+
+    return _Plugin()
+
+
+def test_list_metadata_cache_tracks_registrations():
+    registry = PluginRegistry()
+    assert registry.is_empty
+    registry.register(_plugin("b", "Bravo"))
+    assert not registry.is_empty
+    registry.register(_plugin("a", "alpha"))
+
+    first = registry.list_metadata()
+    assert [meta.id for meta in first] == ["a", "b"]
+    first.clear()
+    assert [meta.id for meta in registry.list_metadata()] == ["a", "b"]
+
+    version = registry.version
+    registry.register(_plugin("c", "Charlie"))
+    assert registry.version == version + 1
+    assert [meta.id for meta in registry.list_metadata()] == ["a", "b", "c"]
+
+
+def test_metadata_interns_ids_and_formats_tags():
+    meta = PluginMetadata(
+        id="".join(["sys", "tem"]), name="System", description="d", tags=["a", "b"]
+    )
+
+    assert meta.id is sys.intern("system")
+    assert meta.tags == ("a", "b")
+    assert meta.tags_display == "a, b"
+    assert PluginMetadata(id="x", name="X", description="d").tags_display == "-"
+    assert "tags_display" not in meta.to_dict()
+
+
+def test_run_wraps_plugin_failures():
+    class _Broken(PluginFeature):
+        metadata = PluginMetadata(id="broken", name="Broken", description="test")
+
+        def run(self, context, args):
+            raise ValueError("bad input")
+
+    registry = PluginRegistry()
+    registry.register(_Broken())
+    context = PluginContext(mode="cli")
+
+    with pytest.raises(PluginExecutionError, match="bad input") as info:
+        registry.run("broken", context, [])
+    assert isinstance(info.value.__cause__, ValueError)
+    with pytest.raises(KeyError):
+        registry.run("missing", context, [])
@@ -9,18 +9,38 @@ Unauthorized copying, modification, distribution, or disclosure is prohibited.
 
 from __future__ import annotations
 
-import csv
-import difflib
+import atexit
+import bisect
+import heapq
 import json
+import operator
+import os
 import platform
 import shutil
 import sys
-from collections import deque
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import abc
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import islice, takewhile
 from pathlib import Path
-import getpass
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from .config import Config
 from .core.apps import AppManager
@@ -29,34 +49,6 @@ from .core.data_recovery import DataRecovery
 from .core.database import db
 from .core.device import DeviceDetector
 from .core.display import DisplayAnalyzer
-from .core.edl import edl_dump, edl_flash
-from .core.edl_toolkit import (
-    ToolkitResult,
-    backup_partition,
-    capture_edl_log,
-    compatibility_matrix,
-    convert_sparse_image,
-    delete_profile,
-    detect_edl_devices,
-    device_notes,
-    edl_unbrick_plan,
-    extract_boot_image,
-    flash_recovery,
-    list_firehose_programmers,
-    list_partitions_via_adb,
-    load_profiles,
-    pull_magisk_patched,
-    read_partition_table,
-    reboot_device,
-    restore_partition,
-    rollback_flash,
-    safety_check,
-    save_profile,
-    stage_magisk_patch,
-    verify_hash,
-    verify_root,
-    verify_twrp_image,
-)
 from .core.files import FileManager
 from .core.frp import FRPEngine
 from .core.launcher import install_start_menu, launcher_status, uninstall_start_menu
@@ -75,19 +67,824 @@ from .core.tools import (
     check_qualcomm_tools,
     install_android_platform_tools,
 )
-from .core.utils import SafeSubprocess
+from .core.utils import SafeSubprocess, copy_file, resolve_tool_command
 from .core.workflows import RepairWorkflow
-from .logging import get_logger, log_edl_event
+from .logging import flush_logs, get_logger, log_edl_event
 from .core.chipsets.dispatcher import detect_chipset_for_device, enter_chipset_mode, enter_device_mode
-from .plugins import PluginContext, discover_plugins, get_registry
+from .plugins import (
+    PluginContext,
+    PluginExecutionError,
+    PluginResult,
+    discover_plugins,
+    get_registry,
+)
 
-try:
+if TYPE_CHECKING:
     from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    RICH_AVAILABLE = True
+
+    from .core.edl_toolkit import ToolkitResult
+
+# rich is only located here; CLI.console and the table renderers import it on first use.
+RICH_AVAILABLE = find_spec("rich") is not None
+
+try:
+    import orjson
 except ImportError:
-    RICH_AVAILABLE = False
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Host file-manager launcher used by the *-open commands.
+_OPEN_CMD = {"Darwin": "open", "Windows": "explorer"}.get(platform.system(), "xdg-open")
+
+# Filter keys accepted by `logs-export` (besides `limit`).
+_LOGS_EXPORT_KEYS = frozenset({"level", "category", "device_id", "method", "since", "until"})
+
+# Directory listings with at least this many entries stat them on a small thread pool.
+_PARALLEL_STAT_MIN = 256
+_PARALLEL_STAT_WORKERS = 8
+
+# Cleanup can scan and unlink relative to an open directory descriptor (POSIX).
+_FD_CLEANUP = (
+    hasattr(os, "O_DIRECTORY") and os.scandir in os.supports_fd and os.unlink in os.supports_dir_fd
+)
+
+# Listings known to be empty: (dir, suffix) -> directory st_mtime_ns when last scanned.
+_EMPTY_DIRS: Dict[Tuple[str, Optional[str]], int] = {}
+# An mtime younger than this may still hide a same-tick write on coarse-timestamp filesystems.
+_MTIME_SETTLE_NS = 2_000_000_000
+
+# Last db.get_statistics() result as (time.monotonic(), db file signature, stats);
+# see _cached_statistics().
+_STATS_CACHE: Optional[Tuple[float, Optional[Tuple[int, int]], Dict[str, Any]]] = None
+_STATS_TTL = 2.0
+
+# Seconds `monitor` blocks for a CPU sample when the background sampler is not running yet.
+_CPU_SAMPLE_INTERVAL = 0.1
+
+# Plugin emit() lines buffered before a stdout write.
+_EMIT_BATCH = 64
+
+# Seconds a DeviceDetector.detect_all() scan is reused across device commands.
+_DETECT_TTL = 2.0
+
+# usb-debug argument vocabularies.
+_USB_DEBUG_INFO_FLAGS = frozenset({"--help", "-h", "help", "methods", "info"})
+_USB_DEBUG_METHODS = frozenset(
+    {"all", "standard", "properties", "settings_db", "build_prop", "adb_keys", "recovery", "root"}
+)
+_USB_DEBUG_RISKY_METHODS = frozenset({"all", "settings_db", "build_prop", "adb_keys", "root"})
+_FORCE_FLAGS = frozenset({"force", "--force", "-f"})
+
+# Interactive prompt, and how many entered lines readline keeps (under BASE_DIR) for recall.
+_PROMPT = "\nvoid> "
+_HISTORY_LENGTH = 1000
+_HISTORY_FILE = "cli_history"
+
+# Frequent bare commands; a line equal to one of these needs no tokenizing.
+_ZERO_ARG_CMDS = frozenset(
+    {
+        "help", "exit", "quit", "q", "?", "version", "plugins", "devices", "summary", "stats",
+        "doctor", "menu", "logs", "backups", "reports", "exports", "advanced", "search",
+    }
+)
+
+# Longer command words are left un-interned so typed garbage does not pile up in the intern table.
+_INTERN_MAX_LEN = 32
+
+# Sub-command tables: operation -> CLI handler method name.
+_FILES_OPS = {
+    "list": "_files_list",
+    "pull": "_files_pull",
+    "push": "_files_push",
+    "delete": "_files_delete",
+}
+_EDL_PROFILE_OPS = {
+    "list": "_edl_profile_list",
+    "add": "_edl_profile_add",
+    "delete": "_edl_profile_delete",
+}
+
+# `plugins` table layout: (header, style); rich caches the parsed styles by string.
+_PLUGIN_COLUMNS = (
+    ("ID", "cyan"),
+    ("Name", "green"),
+    ("Description", "yellow"),
+    ("Version", "magenta"),
+    ("Tags", "blue"),
+)
+
+_DEVICE_COLUMNS = (
+    ("ID", "cyan"),
+    ("Modes", "green"),
+    ("Status", "white"),
+    ("Manufacturer", "yellow"),
+    ("Model", "blue"),
+    ("Android", "magenta"),
+)
+
+# tweak type -> (SystemTweaker setter, value parser, label for the success message).
+_TWEAKS = {
+    "dpi": ("set_dpi", int, "Dpi"),
+    "animation": ("set_animation_scale", float, "Animation"),
+    "timeout": ("set_screen_timeout", int, "Timeout"),
+}
+
+# edl-sparse direction -> convert_sparse_image(to_sparse=...).
+_SPARSE_DIRECTIONS = {"to-raw": False, "to-sparse": True}
+
+# `adb version` output keyed by (binary path, binary mtime); cleared by `bootstrap`.
+_ADB_CACHE: Dict[Tuple[str, float], Tuple[int, str, str]] = {}
+
+
+def _adb_version() -> Tuple[int, str, str]:
+    """Run `adb version`, reusing the last result while the binary is unchanged."""
+    adb_path = shutil.which(resolve_tool_command(["adb"])[0])
+    if not adb_path:
+        return SafeSubprocess.run(["adb", "version"])
+    try:
+        key = (adb_path, Path(adb_path).stat().st_mtime)
+    except OSError:
+        return SafeSubprocess.run([adb_path, "version"])
+    cached = _ADB_CACHE.get(key)
+    if cached is None:
+        cached = SafeSubprocess.run([adb_path, "version"])
+        _ADB_CACHE.clear()
+        _ADB_CACHE[key] = cached
+    return cached
+
+
+_ADVANCED_SECTIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "EDL & Test-point",
+        (
+            "edl-status <device_id|smart>           - Detect EDL mode + USB VID/PID",
+            "edl-enter <device_id|smart>            - Enter EDL mode (if supported)",
+            "mode-enter <device_id|smart> <target>  - Guided mode entry with manual steps",
+            "edl-flash <device_id|smart> <loader> <image> - Flash via EDL",
+            "edl-dump <device_id|smart> <partition> - Dump a partition via EDL",
+            "edl-detect                            - Scan USB for EDL devices",
+            "edl-partitions <device_id|smart> [loader] - Show partition map",
+            "edl-backup <device_id|smart> <partition> - Backup partition via EDL",
+            "edl-restore <device_id|smart> <loader> <image> - Restore partition via EDL",
+            "edl-sparse <to-raw|to-sparse> <source> <dest> - Convert sparse images",
+            "edl-verify <file> [sha256]             - Verify image hash",
+            "edl-unbrick [loader]                   - Show unbrick checklist",
+            "edl-notes [vendor]                     - Show device-specific notes",
+            "edl-reboot <device_id|smart> <target>  - Reboot to target mode",
+            "edl-log                               - Capture EDL workflow logs",
+            "compat-matrix                          - Show EDL compatibility matrix",
+            "testpoint-guide <device_id|smart>      - Show test-point references",
+        ),
+    ),
+    (
+        "Recovery & Root",
+        (
+            "boot-extract <boot.img>                - Extract boot image contents",
+            "magisk-patch <device_id|smart> <boot.img> - Stage Magisk patch workflow",
+            "magisk-pull <device_id|smart> [output_dir] - Pull Magisk patched image",
+            "twrp-verify <device_id|smart> <twrp.img> - Validate TWRP image",
+            "twrp-flash <device_id|smart> <twrp.img> [boot] - Flash/boot TWRP",
+            "root-verify <device_id|smart>          - Verify root access",
+            "safety-check <device_id|smart>         - Run safety checklist",
+            "rollback <device_id|smart> <partition> <image> - Roll back a flash",
+        ),
+    ),
+    (
+        "FRP & Security",
+        (
+            "execute <method> <device_id|smart>     - Execute bypass method",
+            "methods [count]                        - Show top methods",
+        ),
+    ),
+    (
+        "Chipset & Recovery Utilities",
+        (
+            "edl-programmers                       - List available firehose programmers",
+            "edl-profile <list|add|delete>          - Manage EDL profiles",
+            "edl-notes [vendor]                     - Device-specific chipset notes",
+        ),
+    ),
+    (
+        "Discoverability",
+        (
+            "search <keyword>                       - Find commands quickly",
+            "help <command>                         - Show detailed usage",
+            "bootstrap [force]                      - Install bundled platform tools",
+            "menu                                  - Launch interactive menu",
+        ),
+    ),
+)
+
+_HELP_TEXT = """
+╔══════════════════════════════════════════════════════════════╗
+║                   VOID - HELP                                ║
+║                                                              ║
+║  Copyright (c) 2024 Roach Labs. All rights reserved.        ║
+║  Made by James Michael Roach Jr.                            ║
+║  Proprietary and confidential.                              ║
+╚══════════════════════════════════════════════════════════════╝
+
+📋 AVAILABLE COMMANDS:
+
+Tip: Use 'help <command>' for detailed usage or 'search <keyword>' to find commands.
+
+DEVICE MANAGEMENT:
+  devices                          - List all connected devices
+  info <device_id|smart>           - Show detailed device info
+  summary                          - Show a short device summary
+  
+BACKUP & DATA:
+  backup <device_id|smart>         - Create automated backup
+  recover <device_id|smart> <type> - Recover data (contacts/sms)
+  screenshot <device_id|smart>     - Take screenshot
+  
+APP MANAGEMENT:
+  apps <device_id|smart> [filter]  - List apps (system/user/all)
+  
+FILE OPERATIONS:
+  files <device_id|smart> list [path]    - List files
+  files <device_id|smart> pull <path> [local] - Pull file from device
+  files <device_id|smart> push <local> <remote> - Push file to device
+  files <device_id|smart> delete <path>  - Delete file on device
+  
+ANALYSIS:
+  analyze <device_id|smart>        - Performance analysis
+  display-diagnostics <device_id|smart>  - Display + framebuffer diagnostics
+  report <device_id|smart>         - Generate full report
+  repair-flow <device_id|smart> [--report] - Run guided repair workflow
+  logcat <device_id|smart> [tag]   - View real-time logs
+  
+TWEAKS:
+  tweak <device_id|smart> <type> <value> - System tweaks
+    Types: dpi, animation, timeout
+  usb-debug <device_id|smart> [force]    - Enable or force USB debugging
+
+FRP BYPASS:
+  execute <method> <device_id|smart>     - Execute bypass method
+    Methods: adb_shell_reset, fastboot_erase, etc.
+
+ADVANCED TOOLBOX:
+  advanced                         - Show advanced Android tooling overview
+  partitions <device_id|smart>     - List partitions via ADB
+  partition-backup <device_id|smart> <partition> [output_dir] - Backup partition via ADB
+  partition-wipe <device_id|smart> <partition> - Wipe partition via ADB/fastboot (destructive)
+
+EDL & TEST-POINT:
+  edl-status <device_id|smart>           - Detect EDL mode + USB VID/PID
+  edl-enter <device_id|smart>            - Enter EDL mode (if supported)
+  edl-flash <device_id|smart> <loader> <image> - Flash via EDL (chipset-specific)
+  edl-dump <device_id|smart> <partition> - Dump a partition via EDL
+  edl-detect                            - Scan USB for EDL devices
+  edl-programmers                       - List available firehose programmers
+  edl-partitions <device_id|smart> [loader] - Show partition map
+  edl-backup <device_id|smart> <partition> - Backup partition via EDL
+  edl-restore <device_id|smart> <loader> <image> - Restore partition via EDL
+  edl-sparse <to-raw|to-sparse> <source> <dest> - Convert sparse images
+  edl-profile <list|add|delete>          - Manage EDL profiles
+  edl-verify <file> [sha256]             - Verify image hash
+  edl-unbrick [loader]                   - Show unbrick checklist
+  edl-notes [vendor]                     - Show device-specific notes
+  edl-reboot <device_id|smart> <target>  - Reboot to target mode
+  edl-log                               - Capture EDL workflow logs
+  boot-extract <boot.img>                - Extract boot image contents
+  magisk-patch <device_id|smart> <boot.img> - Stage Magisk patch workflow
+  magisk-pull <device_id|smart> [output_dir] - Pull Magisk patched image
+  twrp-verify <device_id|smart> <twrp.img> - Validate TWRP image
+  twrp-flash <device_id|smart> <twrp.img> [boot] - Flash/boot TWRP
+  root-verify <device_id|smart>          - Verify root access
+  safety-check <device_id|smart>         - Run safety checklist
+  rollback <device_id|smart> <partition> <image> - Roll back a flash
+  compat-matrix                          - Show EDL compatibility matrix
+  testpoint-guide <device_id|smart>      - Show test-point references
+  
+SYSTEM:
+  stats                            - Show suite statistics
+  monitor                          - Show system monitor
+  version                          - Show suite version
+  paths                            - Show local data paths
+  menu                             - Launch interactive menu
+  netcheck                         - Check internet connectivity
+  bootstrap [force]                - Install bundled platform tools
+  adb                              - Check ADB availability
+  clear-cache                      - Clear local cache
+  doctor                           - Run quick system checks
+  logs                             - List recent log files
+  backups                          - List recent backups
+  reports                          - List recent reports
+  exports                          - List recent exports
+  devices-json                     - Export devices to JSON
+  stats-json                       - Export stats to JSON
+  logtail [lines]                  - Tail recent log lines
+  cleanup-exports                  - Remove old exports
+  cleanup-backups                  - Remove old backups
+  cleanup-reports                  - Remove old reports
+  env                              - Show environment info
+  recent-logs [count]              - Show recent log entries
+  recent-backups [count]           - Show recent backup records
+  recent-reports [count]           - Show recent report records
+  logs-json                        - Export logs to JSON
+  logs-export <json|csv> [filters] - Export filtered logs to JSON/CSV
+  backups-json                     - Export backups to JSON
+  latest-report                    - Show latest report paths
+  recent-devices [count]           - Show recent devices
+  methods [count]                  - Show top methods
+  methods-json                     - Export top methods to JSON
+  db-health                        - Show database health summary
+  stats-plus                       - Show extended stats
+  reports-json                     - Export reports to JSON
+  smart [status|on|off]            - Show or toggle smart features
+  launcher <install|uninstall|status> - Manage start menu launchers
+  reports-open                     - Open reports directory
+  recent-reports-json              - Export recent reports to JSON
+  config                           - Show configuration values
+  config-json                      - Export configuration to JSON
+  exports-open                     - Open exports directory
+  db-backup                        - Backup database to exports
+  plugins                          - List available plugins
+  plugin <id> [args]               - Run a plugin by id
+  search <keyword>                 - Search commands by keyword
+  help                             - Show this help
+  exit                             - Exit suite
+
+🎯 EXAMPLES:
+
+  void> devices
+  void> info emulator-5554
+  void> summary
+  void> backup emulator-5554
+  void> screenshot emulator-5554
+  void> apps emulator-5554 user
+  void> analyze emulator-5554
+  void> display-diagnostics emulator-5554
+  void> recover emulator-5554 contacts
+  void> tweak emulator-5554 dpi 320
+  void> usb-debug emulator-5554 force
+  void> report emulator-5554
+  void> partitions emulator-5554
+  void> partition-backup emulator-5554 boot
+  void> partition-wipe emulator-5554 userdata
+  void> repair-flow emulator-5554 --report
+  void> execute adb_shell_reset emulator-5554
+  void> edl-status usb-05c6:9008
+  void> edl-enter emulator-5554
+  void> edl-flash usb-05c6:9008 firehose.mbn boot.img
+  void> edl-dump usb-05c6:9008 userdata
+  void> edl-detect
+  void> edl-programmers
+  void> edl-partitions emulator-5554
+  void> edl-backup usb-05c6:9008 modem
+  void> edl-restore usb-05c6:9008 firehose.mbn boot.img
+  void> edl-sparse to-raw system.img system.raw.img
+  void> edl-profile list
+  void> edl-verify boot.img
+  void> edl-unbrick firehose.mbn
+  void> edl-notes qualcomm
+  void> edl-reboot emulator-5554 edl
+  void> edl-log
+  void> boot-extract boot.img
+  void> magisk-patch emulator-5554 boot.img
+  void> magisk-pull emulator-5554
+  void> twrp-verify emulator-5554 twrp.img
+  void> twrp-flash emulator-5554 twrp.img
+  void> root-verify emulator-5554
+  void> safety-check emulator-5554
+  void> rollback emulator-5554 boot boot_backup.img
+  void> compat-matrix
+  void> testpoint-guide usb-05c6:9008
+  void> menu
+  void> version
+  void> paths
+  void> netcheck
+  void> adb
+  void> doctor
+  void> logtail 100
+  void> recent-logs 25
+  void> logs-export json level=error since=2024-01-01
+  void> recent-backups 10
+  void> recent-reports 10
+  void> methods 5
+  void> reports-open
+  void> config-json
+  void> plugins
+  void> plugin system-info
+  void> search backup
+  void> help devices
+
+💡 TIP: All commands work automatically with no setup required!
+
+╚══════════════════════════════════════════════════════════════╝
+"""
+# Encoded once for writing straight to a UTF-8 stdout descriptor; see _write_help().
+_HELP_BYTES = (_HELP_TEXT + "\n").encode("utf-8")
+
+# Test-point guidance per detected chipset, with a fallback for everything else.
+_TESTPOINT_GUIDES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "Qualcomm": MappingProxyType(
+            {
+                "summary": "Qualcomm devices can often enter EDL via test-point short.",
+                "references": (
+                    "https://github.com/bkerler/edl",
+                    "https://forum.xda-developers.com/",
+                ),
+            }
+        ),
+        "MediaTek": MappingProxyType(
+            {
+                "summary": "MediaTek bootrom/preloader modes may require test-point access.",
+                "references": (
+                    "https://github.com/bkerler/mtkclient",
+                    "https://forum.xda-developers.com/",
+                ),
+            }
+        ),
+        "Samsung Exynos": MappingProxyType(
+            {
+                "summary": "Samsung download mode access varies by model and requires OEM docs.",
+                "references": ("https://forum.xda-developers.com/",),
+            }
+        ),
+    }
+)
+_TESTPOINT_DEFAULT: Mapping[str, Any] = MappingProxyType(
+    {"summary": "Use model-specific guides for test-point access.", "references": ()}
+)
+
+# Export key -> Config attribute for the `paths` block of config-json.
+_CONFIG_PATH_KEYS = (
+    ("base", "BASE_DIR"),
+    ("db", "DB_PATH"),
+    ("logs", "LOG_DIR"),
+    ("backups", "BACKUP_DIR"),
+    ("exports", "EXPORTS_DIR"),
+    ("cache", "CACHE_DIR"),
+    ("reports", "REPORTS_DIR"),
+    ("monitor", "MONITOR_DIR"),
+    ("scripts", "SCRIPTS_DIR"),
+)
+
+_TOOL_CHECKS = (
+    ("Android", check_android_tools),
+    ("Qualcomm", check_qualcomm_tools),
+    ("MediaTek", check_mediatek_tools),
+)
+
+# Environment probe results (tool groups, connectivity): label -> (time.monotonic(), result).
+_TOOL_CACHE: Dict[str, Tuple[float, Any]] = {}
+_TOOL_CACHE_TTL = 30.0
+
+
+def _check_tools(label: str, check: Callable[[], Any]) -> Any:
+    """Run an environment probe, reusing its result for ``_TOOL_CACHE_TTL`` seconds."""
+    now = time.monotonic()
+    cached = _TOOL_CACHE.get(label)
+    if cached is not None and now - cached[0] < _TOOL_CACHE_TTL:
+        return cached[1]
+    tools = check()
+    _TOOL_CACHE[label] = (now, tools)
+    return tools
+
+
+def _db_stat() -> Optional[os.stat_result]:
+    """Stat the database file, or return None when it does not exist yet."""
+    try:
+        return os.stat(Config.DB_PATH)
+    except FileNotFoundError:
+        return None
+
+
+def _cached_statistics(db_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+    """Return ``db.get_statistics()``, reusing the last result while it is still current.
+
+    A result is reused for ``_STATS_TTL`` seconds, and beyond that for as long as the
+    database file's mtime and size are unchanged. A signature whose mtime has not yet
+    settled is not trusted, since a same-tick in-place write would leave it unchanged.
+    Pass ``db_stat`` to reuse a stat the caller already made.
+    """
+    global _STATS_CACHE
+    now = time.monotonic()
+    if _STATS_CACHE is not None and now - _STATS_CACHE[0] < _STATS_TTL:
+        return _STATS_CACHE[2]
+    if db_stat is None:
+        db_stat = _db_stat()
+    signature = None
+    if db_stat is not None and time.time_ns() - db_stat.st_mtime_ns > _MTIME_SETTLE_NS:
+        signature = (db_stat.st_mtime_ns, db_stat.st_size)
+    if _STATS_CACHE is not None and signature is not None and _STATS_CACHE[1] == signature:
+        _STATS_CACHE = (now, signature, _STATS_CACHE[2])
+        return _STATS_CACHE[2]
+    stats = db.get_statistics()
+    _STATS_CACHE = (now, signature, stats)
+    return stats
+
+
+def _count_lines(stats: Mapping[str, Any]) -> List[str]:
+    """Format the per-table totals from ``db.get_statistics()`` as listing lines."""
+    return [
+        f"  {label}: {stats.get(key, 0)}"
+        for label, key in (
+            ("Devices", "total_devices"),
+            ("Logs", "total_logs"),
+            ("Backups", "total_backups"),
+            ("Methods", "total_methods"),
+            ("Reports", "total_reports"),
+        )
+    ]
+
+
+def _report_name(event_data: Optional[str]) -> Any:
+    """Return the ``report_name`` recorded in an analytics ``event_data`` JSON blob."""
+    try:
+        payload = _json_loads(event_data or "{}")
+    except ValueError:
+        # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors.
+        return "Unknown"
+    return payload.get("report_name", "Unknown") if isinstance(payload, dict) else "Unknown"
+
+
+def _success_rate(method: Dict[str, Any]) -> float:
+    """Percentage of successful runs for a methods-table row."""
+    total = method['total_count']
+    return (method['success_count'] / total * 100) if total > 0 else 0
+
+
+# json.dump and csv.writer emit many small chunks; a large buffer turns them into few writes.
+_EXPORT_BUFFER = 1 << 20
+
+
+def _dump_json(path: Path, obj: Any) -> None:
+    """Write ``obj`` as indented JSON, using ``orjson`` when it is installed.
+
+    orjson writes non-ASCII text as raw UTF-8 where the stdlib escapes it, so such
+    payloads go through the stdlib encoder to keep exports identical either way.
+    """
+    if orjson is not None:
+        try:
+            # Non-string keys are stringified the way the stdlib encoder does it.
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            data = None
+        if data is not None and data.isascii():
+            path.write_bytes(data)
+            return
+    with path.open("w", buffering=_EXPORT_BUFFER, encoding="utf-8") as handle:
+        json.dump(obj, handle, indent=2)
+
+
+def _json_text(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Return ``obj`` as indented JSON text, using ``orjson`` when it is installed.
+
+    Non-ASCII output falls back to the stdlib's escaped form, as in ``_dump_json``.
+    """
+    if orjson is not None:
+        # Route datetimes and dataclasses through ``default`` like the stdlib encoder does.
+        option = (
+            orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        try:
+            data = orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            data = None
+        if data is not None and data.isascii():
+            return data.decode()
+    return json.dumps(obj, indent=2, default=default)
+
+
+def _write_lines(lines: Iterable[str]) -> None:
+    """Write lines to stdout with a single call instead of one print per line."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
+def _write_help() -> None:
+    """Write the help overview, bypassing the text layer when stdout is a UTF-8 descriptor."""
+    stream = sys.stdout
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    if fd is None or (getattr(stream, "encoding", None) or "").lower().replace("-", "") != "utf8":
+        # Captured (StringIO) or non-UTF-8 streams go through the normal text path.
+        _write_lines((_HELP_TEXT,))
+        return
+    stream.flush()
+    view = memoryview(_HELP_BYTES)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _tail_lines(path: Path, line_count: int, block: int = 1 << 16) -> List[str]:
+    """Return the last ``line_count`` lines of ``path`` by reading backwards from the end."""
+    chunks: List[bytes] = []
+    newlines = 0
+    # Blocks larger than the default buffer are read straight into the result, not copied.
+    with path.open("rb") as handle:
+        pos = handle.seek(0, os.SEEK_END)
+        while pos > 0 and newlines <= line_count:
+            step = min(block, pos)
+            pos -= step
+            handle.seek(pos)
+            chunk = handle.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+    data = b"".join(reversed(chunks))
+    return [line.decode("utf-8", errors="replace") for line in data.splitlines()[-line_count:]]
+
+
+def _lstat_entry(entry: os.DirEntry) -> os.stat_result:
+    return entry.stat(follow_symlinks=False)
+
+
+def _newest(dir_path: Path, suffix: Optional[str] = None) -> Optional[Path]:
+    """Return the most recently modified entry of ``dir_path`` in one scandir pass."""
+    try:
+        with os.scandir(dir_path) as it:
+            latest = max(
+                (entry for entry in it if suffix is None or entry.name.endswith(suffix)),
+                key=lambda entry: _lstat_entry(entry).st_mtime,
+                default=None,
+            )
+    except FileNotFoundError:
+        return None
+    return None if latest is None else Path(latest.path)
+
+
+def _recent_entries(
+    dir_path: Path, limit: int = 10, suffix: Optional[str] = None
+) -> List[Tuple[str, int, bool]]:
+    """Return (name, size, is_dir) for the newest entries in a directory."""
+    cache_key = (str(dir_path), suffix)
+    try:
+        dir_mtime = os.stat(dir_path).st_mtime_ns
+        if _EMPTY_DIRS.get(cache_key) == dir_mtime:
+            return []
+        with os.scandir(dir_path) as it:
+            found = [entry for entry in it if suffix is None or entry.name.endswith(suffix)]
+    except FileNotFoundError:
+        return []
+    if found:
+        _EMPTY_DIRS.pop(cache_key, None)
+    elif time.time_ns() - dir_mtime > _MTIME_SETTLE_NS:
+        # Only trust settled mtimes; coarse filesystems (FAT) can hide a same-tick write.
+        _EMPTY_DIRS[cache_key] = dir_mtime
+    if len(found) >= _PARALLEL_STAT_MIN:
+        # stat() releases the GIL, so large (or network-mounted) dirs benefit from overlap.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=_PARALLEL_STAT_WORKERS) as executor:
+            stats = list(executor.map(_lstat_entry, found))
+    else:
+        stats = [_lstat_entry(entry) for entry in found]
+    entries = [(entry.name, st, entry.is_dir()) for entry, st in zip(found, stats)]
+    newest = heapq.nlargest(limit, entries, key=lambda item: item[1].st_mtime)
+    return [(name, 0 if is_dir else st.st_size, is_dir) for name, st, is_dir in newest]
+
+
+def _cleanup_dir(dir_path: Path, days: int) -> int:
+    """Delete entries older than ``days`` and return how many were removed.
+
+    Where the platform allows it the directory is opened once and entries are
+    stat'ed and unlinked relative to that descriptor instead of by full path.
+    """
+    cutoff = time.time() - days * 86400
+    removed = 0
+    dir_fd: Optional[int] = None
+    try:
+        if _FD_CLEANUP:
+            dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        # Scanning an fd yields entries whose .path is the bare name, relative to dir_fd.
+        with os.scandir(dir_path if dir_fd is None else dir_fd) as it:
+            for entry in it:
+                if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    # rmtree already walks the subtree with fd-relative calls on these platforms.
+                    shutil.rmtree(os.path.join(dir_path, entry.name))
+                else:
+                    os.unlink(entry.path, dir_fd=dir_fd)
+                removed += 1
+    except FileNotFoundError:
+        return removed
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    return removed
+
+
+def _split_command(line: str) -> Tuple[str, List[str]]:
+    """Split a stripped, non-empty command line into (lowercased command, args)."""
+    if line in _ZERO_ARG_CMDS:
+        return sys.intern(line), []
+    parts = line.split()
+    command = parts[0].lower()
+    if len(command) <= _INTERN_MAX_LEN:
+        command = sys.intern(command)
+    return command, parts[1:]
+
+
+def _discard_dir(path: Path) -> Optional[threading.Thread]:
+    """Move ``path`` aside and delete it on a background thread.
+
+    The rename is atomic on the same filesystem, so the caller can recreate ``path`` at once.
+    Trash left behind by an earlier process that exited mid-delete is swept up as well.
+    Returns the deleting thread, if one was started.
+    """
+    trash = path.with_name(f"{path.name}.trash-{os.getpid()}-{time.time_ns()}")
+    try:
+        os.replace(path, trash)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+    stale = list(path.parent.glob(f"{path.name}.trash-*"))
+    if not stale:
+        return None
+    thread = threading.Thread(
+        target=lambda: [shutil.rmtree(entry, ignore_errors=True) for entry in stale],
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def _save_history(readline: Any, path: Path) -> None:
+    """Persist REPL history at exit; a read-only home just loses it."""
+    try:
+        readline.write_history_file(path)
+    except OSError:
+        pass
+
+
+def _mode_label(device: Mapping[str, Any]) -> str:
+    """Return the comma-separated mode list shown for a device row."""
+    modes = device.get("modes") or [device.get("mode", "Unknown")]
+    return ", ".join(modes) if isinstance(modes, list) else str(modes)
+
+
+def _names_with_prefix(names: Sequence[str], prefix: str) -> List[str]:
+    """Return the entries of sorted ``names`` that start with ``prefix``.
+
+    Sorted order keeps every match in one contiguous run, so this bisects to its
+    start instead of scanning the whole sequence.
+    """
+    start = bisect.bisect_left(names, prefix)
+    return list(takewhile(lambda name: name.startswith(prefix), islice(names, start, None)))
+
+
+def _ignore_args(handler: Callable[[], Any]) -> Callable[[List[str]], Any]:
+    """Adapt a zero-argument command handler to the dispatch signature."""
+    return lambda args: handler()
+
+
+class _BufferedEmit:
+    """Plugin emit sink that batches lines into occasional stdout writes."""
+
+    __slots__ = ("_lines",)
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def __call__(self, message: str) -> None:
+        self._lines.append(message)
+        if len(self._lines) >= _EMIT_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            lines, self._lines = self._lines, []
+            _write_lines(lines)
+
+
+class _StrView(abc.Mapping):
+    """Read-only view of a device dict that stringifies values on access."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> str:
+        return str(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._data:
+            return str(self._data[key])
+        return default
+
+
+class CLIUsageError(ValueError):
+    """Raised by a command handler that rejects its arguments.
+
+    The REPL reports these as a one-line warning; any other exception is logged with
+    its traceback.
+    """
 
 
 @dataclass(frozen=True)
@@ -96,36 +893,826 @@ class CommandInfo:
     summary: str
     usage: str
     category: str
-    examples: List[str] = field(default_factory=list)
-    aliases: List[str] = field(default_factory=list)
+    examples: Tuple[str, ...] = ()
+    aliases: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Accept lists from callers but store tuples so shared instances stay immutable.
+        object.__setattr__(self, "examples", tuple(self.examples))
+        object.__setattr__(self, "aliases", tuple(self.aliases))
+
+
+class _SearchIndex(NamedTuple):
+    """Lookup structures for `search`, built once by _build_command_catalog()."""
+
+    commands: Tuple[CommandInfo, ...]  # category/name order
+    blobs: Tuple[str, ...]  # lowercase searchable text per command
+    text: str  # blobs joined by newlines
+    offsets: Tuple[int, ...]  # start of each blob within text
+    trigrams: Mapping[str, FrozenSet[int]]  # 3-char substring -> indexes into commands
+
+
+@lru_cache(maxsize=1)
+def _build_command_catalog() -> Tuple[
+    Mapping[str, CommandInfo], Mapping[str, str], _SearchIndex
+]:
+    """Build the command catalog, alias map and search index once per process.
+
+    The search index pairs each command with its lowercased search text and is
+    ordered by (category, name), the order search results are shown in.
+    """
+    catalog = [
+        CommandInfo(
+            name="advanced",
+            summary="Show advanced Android tooling overview.",
+            usage="advanced",
+            category="Advanced Toolbox",
+            examples=["advanced"],
+            aliases=["toolbox"],
+        ),
+        CommandInfo(
+            name="bootstrap",
+            summary="Install bundled Android platform tools.",
+            usage="bootstrap [force]",
+            category="System & Diagnostics",
+            examples=["bootstrap", "bootstrap force"],
+        ),
+        CommandInfo(
+            name="devices",
+            summary="List all connected devices.",
+            usage="devices",
+            category="Device Management",
+            examples=["devices"],
+            aliases=["list", "ls", "device"],
+        ),
+        CommandInfo(
+            name="info",
+            summary="Show detailed device info.",
+            usage="info <device_id|smart>",
+            category="Device Management",
+            examples=["info emulator-5554", "info smart"],
+        ),
+        CommandInfo(
+            name="summary",
+            summary="Show a short summary for all devices.",
+            usage="summary",
+            category="Device Management",
+            examples=["summary"],
+        ),
+        CommandInfo(
+            name="backup",
+            summary="Create an automated backup.",
+            usage="backup <device_id|smart>",
+            category="Backup & Data",
+            examples=["backup emulator-5554", "backup smart"],
+        ),
+        CommandInfo(
+            name="recover",
+            summary="Recover contacts or SMS.",
+            usage="recover <device_id|smart> <contacts|sms>",
+            category="Backup & Data",
+            examples=["recover emulator-5554 contacts", "recover smart sms"],
+        ),
+        CommandInfo(
+            name="screenshot",
+            summary="Capture a device screenshot.",
+            usage="screenshot <device_id|smart>",
+            category="Backup & Data",
+            examples=["screenshot emulator-5554"],
+        ),
+        CommandInfo(
+            name="apps",
+            summary="List installed apps.",
+            usage="apps <device_id|smart> [system|user|all]",
+            category="Apps & Files",
+            examples=["apps smart", "apps emulator-5554 user"],
+        ),
+        CommandInfo(
+            name="files",
+            summary="Manage files on the device.",
+            usage="files <device_id|smart> <list|pull|push|delete> [path]",
+            category="Apps & Files",
+            examples=["files smart list /sdcard", "files emulator-5554 pull /sdcard/test.txt"],
+        ),
+        CommandInfo(
+            name="analyze",
+            summary="Run performance analysis.",
+            usage="analyze <device_id|smart>",
+            category="Analysis & Reports",
+            examples=["analyze smart"],
+        ),
+        CommandInfo(
+            name="display-diagnostics",
+            summary="Run display and framebuffer diagnostics.",
+            usage="display-diagnostics <device_id|smart>",
+            category="Analysis & Reports",
+            examples=["display-diagnostics emulator-5554"],
+        ),
+        CommandInfo(
+            name="report",
+            summary="Generate a full device report.",
+            usage="report <device_id|smart>",
+            category="Analysis & Reports",
+            examples=["report smart"],
+        ),
+        CommandInfo(
+            name="partitions",
+            summary="List device partitions via ADB.",
+            usage="partitions <device_id|smart>",
+            category="Advanced Toolbox",
+            examples=["partitions smart"],
+        ),
+        CommandInfo(
+            name="partition-backup",
+            summary="Backup a partition image via ADB.",
+            usage="partition-backup <device_id|smart> <partition> [output_dir]",
+            category="Advanced Toolbox",
+            examples=["partition-backup smart boot", "partition-backup emulator-5554 userdata /tmp"],
+        ),
+        CommandInfo(
+            name="partition-wipe",
+            summary="Wipe a partition via fastboot or ADB (destructive).",
+            usage="partition-wipe <device_id|smart> <partition>",
+            category="Advanced Toolbox",
+            examples=["partition-wipe smart userdata"],
+        ),
+        CommandInfo(
+            name="repair-flow",
+            summary="Run guided repair workflow with optional remediation.",
+            usage="repair-flow <device_id|smart> [--report]",
+            category="Analysis & Reports",
+            examples=["repair-flow smart", "repair-flow emulator-5554 --report"],
+            aliases=["workflow", "repair"],
+        ),
+        CommandInfo(
+            name="logcat",
+            summary="View real-time logcat output.",
+            usage="logcat <device_id|smart> [filter_tag]",
+            category="Analysis & Reports",
+            examples=["logcat emulator-5554", "logcat smart ActivityManager"],
+        ),
+        CommandInfo(
+            name="tweak",
+            summary="Apply system tweaks (dpi/animation/timeout).",
+            usage="tweak <device_id|smart> <dpi|animation|timeout> <value>",
+            category="System & Diagnostics",
+            examples=["tweak smart dpi 320", "tweak emulator-5554 timeout 600000"],
+        ),
+        CommandInfo(
+            name="usb-debug",
+            summary="Enable or force USB debugging.",
+            usage="usb-debug <device_id|smart> [force]",
+            category="System & Diagnostics",
+            examples=["usb-debug smart", "usb-debug emulator-5554 force"],
+        ),
+        CommandInfo(
+            name="execute",
+            summary="Execute an FRP method.",
+            usage="execute <method> <device_id|smart>",
+            category="FRP Bypass",
+            examples=["execute adb_shell_reset smart"],
+        ),
+        CommandInfo(
+            name="edl-status",
+            summary="Show EDL mode status and USB IDs.",
+            usage="edl-status <device_id|smart>",
+            category="EDL & Test-point",
+            examples=["edl-status usb-05c6:9008"],
+        ),
+        CommandInfo(
+            name="edl-enter",
+            summary="Enter EDL mode (if supported).",
+            usage="edl-enter <device_id|smart>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="mode-enter",
+            summary="Guided entry into a target mode with chipset-aware steps.",
+            usage=(
+                "mode-enter <device_id|smart> <target_mode> "
+                "[--override=<chipset>] [--auth-token=<token>] [--ownership=<proof>]"
+            ),
+            category="EDL & Test-point",
+            examples=["mode-enter smart edl", "mode-enter usb-05c6:9008 edl --override=Qualcomm"],
+        ),
+        CommandInfo(
+            name="edl-flash",
+            summary="Flash an image via EDL.",
+            usage="edl-flash <device_id|smart> <loader> <image>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-dump",
+            summary="Dump a partition via EDL.",
+            usage="edl-dump <device_id|smart> <partition>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-detect",
+            summary="Scan USB for EDL devices.",
+            usage="edl-detect",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-programmers",
+            summary="List available firehose programmers.",
+            usage="edl-programmers",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-partitions",
+            summary="Show partition map via ADB or EDL.",
+            usage="edl-partitions <device_id|smart> [loader]",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-backup",
+            summary="Backup a partition via EDL.",
+            usage="edl-backup <device_id|smart> <partition>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-restore",
+            summary="Restore a partition via EDL.",
+            usage="edl-restore <device_id|smart> <loader> <image>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-sparse",
+            summary="Convert sparse images.",
+            usage="edl-sparse <to-raw|to-sparse> <source> <dest>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-profile",
+            summary="Manage EDL profiles.",
+            usage="edl-profile <list|add|delete> [name] [json]",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-verify",
+            summary="Verify image hash.",
+            usage="edl-verify <file> [sha256]",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-unbrick",
+            summary="Show an unbrick checklist.",
+            usage="edl-unbrick [loader]",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-notes",
+            summary="Show device-specific notes.",
+            usage="edl-notes [vendor]",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-reboot",
+            summary="Reboot to a target mode.",
+            usage="edl-reboot <device_id|smart> <edl|fastboot|recovery|bootloader|system>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="edl-log",
+            summary="Capture EDL workflow logs.",
+            usage="edl-log",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="boot-extract",
+            summary="Extract boot image contents.",
+            usage="boot-extract <boot.img>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="magisk-patch",
+            summary="Stage a Magisk patch workflow.",
+            usage="magisk-patch <device_id|smart> <boot.img>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="magisk-pull",
+            summary="Pull Magisk patched image.",
+            usage="magisk-pull <device_id|smart> [output_dir]",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="twrp-verify",
+            summary="Verify a TWRP image matches device codename.",
+            usage="twrp-verify <device_id|smart> <twrp.img>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="twrp-flash",
+            summary="Flash or boot TWRP recovery via fastboot.",
+            usage="twrp-flash <device_id|smart> <twrp.img> [boot]",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="root-verify",
+            summary="Verify root access via ADB.",
+            usage="root-verify <device_id|smart>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="safety-check",
+            summary="Run safety checklist for device operations.",
+            usage="safety-check <device_id|smart>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="rollback",
+            summary="Rollback a partition flash.",
+            usage="rollback <device_id|smart> <partition> <image>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="compat-matrix",
+            summary="Show EDL compatibility matrix.",
+            usage="compat-matrix",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="testpoint-guide",
+            summary="Show test-point references.",
+            usage="testpoint-guide <device_id|smart>",
+            category="EDL & Test-point",
+        ),
+        CommandInfo(
+            name="stats",
+            summary="Show suite statistics.",
+            usage="stats",
+            category="System",
+        ),
+        CommandInfo(
+            name="monitor",
+            summary="Show system resource usage.",
+            usage="monitor",
+            category="System",
+        ),
+        CommandInfo(
+            name="version",
+            summary="Show suite version details.",
+            usage="version",
+            category="System",
+        ),
+        CommandInfo(
+            name="paths",
+            summary="Show local data directories.",
+            usage="paths",
+            category="System",
+        ),
+        CommandInfo(
+            name="menu",
+            summary="Launch interactive menu.",
+            usage="menu",
+            category="System",
+        ),
+        CommandInfo(
+            name="netcheck",
+            summary="Check internet connectivity.",
+            usage="netcheck",
+            category="System",
+        ),
+        CommandInfo(
+            name="adb",
+            summary="Check ADB availability.",
+            usage="adb",
+            category="System",
+        ),
+        CommandInfo(
+            name="clear-cache",
+            summary="Clear local cache directory.",
+            usage="clear-cache",
+            category="System",
+        ),
+        CommandInfo(
+            name="doctor",
+            summary="Run quick system checks.",
+            usage="doctor",
+            category="System",
+        ),
+        CommandInfo(
+            name="logs",
+            summary="List recent log files.",
+            usage="logs",
+            category="System",
+        ),
+        CommandInfo(
+            name="backups",
+            summary="List recent backups.",
+            usage="backups",
+            category="System",
+        ),
+        CommandInfo(
+            name="reports",
+            summary="List recent reports.",
+            usage="reports",
+            category="System",
+        ),
+        CommandInfo(
+            name="exports",
+            summary="List recent exports.",
+            usage="exports",
+            category="System",
+        ),
+        CommandInfo(
+            name="devices-json",
+            summary="Export devices to JSON.",
+            usage="devices-json",
+            category="System",
+        ),
+        CommandInfo(
+            name="stats-json",
+            summary="Export stats to JSON.",
+            usage="stats-json",
+            category="System",
+        ),
+        CommandInfo(
+            name="logtail",
+            summary="Tail recent log lines.",
+            usage="logtail [lines]",
+            category="System",
+        ),
+        CommandInfo(
+            name="cleanup-exports",
+            summary="Remove old exports.",
+            usage="cleanup-exports",
+            category="System",
+        ),
+        CommandInfo(
+            name="cleanup-backups",
+            summary="Remove old backups.",
+            usage="cleanup-backups",
+            category="System",
+        ),
+        CommandInfo(
+            name="cleanup-reports",
+            summary="Remove old reports.",
+            usage="cleanup-reports",
+            category="System",
+        ),
+        CommandInfo(
+            name="env",
+            summary="Show environment info.",
+            usage="env",
+            category="System",
+        ),
+        CommandInfo(
+            name="recent-logs",
+            summary="Show recent log entries.",
+            usage="recent-logs [count]",
+            category="System",
+        ),
+        CommandInfo(
+            name="recent-backups",
+            summary="Show recent backup records.",
+            usage="recent-backups [count]",
+            category="System",
+        ),
+        CommandInfo(
+            name="recent-reports",
+            summary="Show recent report records.",
+            usage="recent-reports [count]",
+            category="System",
+        ),
+        CommandInfo(
+            name="logs-json",
+            summary="Export logs to JSON.",
+            usage="logs-json",
+            category="System",
+        ),
+        CommandInfo(
+            name="logs-export",
+            summary="Export filtered logs to JSON or CSV.",
+            usage="logs-export <json|csv> [filters]",
+            category="System",
+        ),
+        CommandInfo(
+            name="backups-json",
+            summary="Export backups to JSON.",
+            usage="backups-json",
+            category="System",
+        ),
+        CommandInfo(
+            name="latest-report",
+            summary="Show latest report paths.",
+            usage="latest-report",
+            category="System",
+        ),
+        CommandInfo(
+            name="recent-devices",
+            summary="Show recent devices.",
+            usage="recent-devices [count]",
+            category="System",
+        ),
+        CommandInfo(
+            name="methods",
+            summary="Show top methods.",
+            usage="methods [count]",
+            category="System",
+        ),
+        CommandInfo(
+            name="methods-json",
+            summary="Export methods to JSON.",
+            usage="methods-json",
+            category="System",
+        ),
+        CommandInfo(
+            name="db-health",
+            summary="Show database health summary.",
+            usage="db-health",
+            category="System",
+        ),
+        CommandInfo(
+            name="stats-plus",
+            summary="Show extended stats.",
+            usage="stats-plus",
+            category="System",
+        ),
+        CommandInfo(
+            name="reports-json",
+            summary="Export reports to JSON.",
+            usage="reports-json",
+            category="System",
+        ),
+        CommandInfo(
+            name="smart",
+            summary="Show or toggle smart features.",
+            usage="smart [status|on|off|auto-device|prefer-last|auto-doctor|suggest|safety] [on|off]",
+            category="System",
+            aliases=["assist", "suggest"],
+        ),
+        CommandInfo(
+            name="launcher",
+            summary="Manage start menu launchers.",
+            usage="launcher <install|uninstall|status>",
+            category="System",
+        ),
+        CommandInfo(
+            name="reports-open",
+            summary="Open reports directory.",
+            usage="reports-open",
+            category="System",
+        ),
+        CommandInfo(
+            name="recent-reports-json",
+            summary="Export recent reports to JSON.",
+            usage="recent-reports-json",
+            category="System",
+        ),
+        CommandInfo(
+            name="config",
+            summary="Show configuration values.",
+            usage="config",
+            category="System",
+        ),
+        CommandInfo(
+            name="config-json",
+            summary="Export configuration to JSON.",
+            usage="config-json",
+            category="System",
+        ),
+        CommandInfo(
+            name="exports-open",
+            summary="Open exports directory.",
+            usage="exports-open",
+            category="System",
+        ),
+        CommandInfo(
+            name="db-backup",
+            summary="Backup database to exports.",
+            usage="db-backup",
+            category="System",
+        ),
+        CommandInfo(
+            name="plugins",
+            summary="List available plugins.",
+            usage="plugins",
+            category="Plugins",
+        ),
+        CommandInfo(
+            name="plugin",
+            summary="Run a plugin by id.",
+            usage="plugin <id> [args]",
+            category="Plugins",
+        ),
+        CommandInfo(
+            name="search",
+            summary="Search commands by keyword.",
+            usage="search <keyword>",
+            category="Help",
+            aliases=["find", "lookup"],
+        ),
+        CommandInfo(
+            name="help",
+            summary="Show help or command details.",
+            usage="help [command]",
+            category="Help",
+            aliases=["h", "man"],
+        ),
+        CommandInfo(
+            name="exit",
+            summary="Exit the suite.",
+            usage="exit",
+            category="Help",
+            aliases=["quit", "q"],
+        ),
+    ]
+    commands = {command.name: command for command in catalog}
+    aliases = {alias: command.name for command in catalog for alias in command.aliases}
+    ordered = tuple(sorted(catalog, key=operator.attrgetter("category", "name")))
+    blobs = tuple(
+        " ".join(
+            (
+                command.name,
+                command.summary,
+                command.usage,
+                " ".join(command.aliases),
+                command.category,
+            )
+        ).lower()
+        for command in ordered
+    )
+    offsets = []
+    position = 0
+    trigrams: Dict[str, set] = {}
+    for slot, blob in enumerate(blobs):
+        offsets.append(position)
+        position += len(blob) + 1
+        for start in range(len(blob) - 2):
+            trigrams.setdefault(blob[start:start + 3], set()).add(slot)
+    search_index = _SearchIndex(
+        commands=ordered,
+        blobs=blobs,
+        text="\n".join(blobs),
+        offsets=tuple(offsets),
+        trigrams=MappingProxyType({gram: frozenset(slots) for gram, slots in trigrams.items()}),
+    )
+    return MappingProxyType(commands), MappingProxyType(aliases), search_index
+
+
+def _search_commands(search_index: _SearchIndex, keyword: str) -> List[CommandInfo]:
+    """Return catalog commands whose search blob contains ``keyword``, in catalog order."""
+    if "\n" in keyword:
+        return []
+    if len(keyword) >= 3:
+        # Every trigram of the keyword must occur in a matching blob; confirm the survivors.
+        postings = [
+            search_index.trigrams.get(keyword[start:start + 3]) for start in range(len(keyword) - 2)
+        ]
+        if not all(postings):
+            return []
+        candidates = sorted(frozenset.intersection(*postings))
+        commands, blobs = search_index.commands, search_index.blobs
+        return [commands[slot] for slot in candidates if keyword in blobs[slot]]
+    text, offsets = search_index.text, search_index.offsets
+    matches = []
+    pos = text.find(keyword)
+    while pos != -1:
+        slot = bisect.bisect_right(offsets, pos) - 1
+        matches.append(search_index.commands[slot])
+        if slot + 1 == len(offsets):
+            break
+        # Resume at the next blob so each command is reported once.
+        pos = text.find(keyword, offsets[slot + 1])
+    return matches
+
+
+class MenuItem(NamedTuple):
+    """Interactive menu entry.
+
+    Selecting it opens ``submenu``, runs ``command`` as if typed at the prompt, or
+    calls the unbound CLI method ``action`` with the CLI instance and ``args``.
+    """
+
+    label: str
+    desc: str
+    shortcut: str
+    command: Optional[str] = None
+    action: Optional[Callable[..., Any]] = None
+    args: Tuple[str, ...] = ()
+    submenu: Optional["Menu"] = None
+    exit: bool = False
+
+
+class Menu(NamedTuple):
+    """Menu entries in display order plus their shortcut -> entry index."""
+
+    items: Tuple[MenuItem, ...]
+    shortcuts: Mapping[str, MenuItem]
+
+
+def _menu(*items: MenuItem) -> Menu:
+    """Build a Menu from its entries, indexing them by shortcut."""
+    shortcuts: Dict[str, MenuItem] = {}
+    for item in items:
+        # The first entry claiming a shortcut wins, as the old linear scan did.
+        if item.shortcut:
+            shortcuts.setdefault(sys.intern(item.shortcut), item)
+    return Menu(items, MappingProxyType(shortcuts))
+
+
+@lru_cache(maxsize=1)
+def _build_banner() -> str:
+    """Render the startup banner once; its inputs are fixed Config constants."""
+    features_count = 200  # Total automated features
+
+    box_width = 62
+
+    def pad(text: str) -> str:
+        return text.ljust(box_width)
+
+    slogan_lines = Config.THEME_SLOGANS[:2]
+    banner = (
+        f"╔{'═' * box_width}╗\n"
+        f"║ {pad(f'VOID v{Config.VERSION} - {Config.CODENAME}')} ║\n"
+        f"║ {pad(Config.THEME_TAGLINE)} ║\n"
+        f"║ {pad(f'{features_count}+ automated features • {Config.THEME_NAME}')} ║\n"
+        f"║ {pad('')} ║\n"
+        f"║ {pad('Copyright (c) 2024 Roach Labs. All rights reserved.')} ║\n"
+        f"║ {pad('Made by James Michael Roach Jr.')} ║\n"
+        f"║ {pad('Proprietary and confidential.')} ║\n"
+        f"╚{'═' * box_width}╝\n\n"
+        f"✨ {slogan_lines[0]}\n"
+        f"✨ {slogan_lines[1]}\n\n"
+        "Type 'help' to see all available commands.\n"
+        "Type 'help <command>' for detailed usage.\n"
+        "Type 'search <keyword>' to find commands.\n"
+        "Type 'menu' to launch the interactive menu.\n"
+    )
+    return banner
 
 
 class CLI:
     """Enhanced CLI with all features."""
 
     def __init__(self, start_monitor: bool = True):
-        self.console = Console() if RICH_AVAILABLE else None
+        self._console: Optional[Console] = None
+        self._console_ready = not RICH_AVAILABLE
+        self._start_monitor = start_monitor
         self.engine = FRPEngine()
         self.logcat = LogcatViewer()
         self.last_device_id: Optional[str] = None
+        self._detect_cache: Optional[
+            Tuple[float, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]
+        ] = None
+        self._export_second = -1
+        self._export_stamp = ""
+        self._export_seq: Dict[str, int] = {}
         self.logger = get_logger(__name__)
-        discover_plugins()
+        # Plugin modules are imported by the plugin commands on first use.
         self.plugin_registry = get_registry()
-        self.command_catalog = self._build_command_catalog()
-        self.command_aliases = self._build_command_aliases()
-
-        # Start monitoring
-        if start_monitor:
-            monitor.start()
+        self._plugin_emit = _BufferedEmit()
+        self._plugin_context = PluginContext(mode="cli", emit=self._plugin_emit)
+        self.command_catalog, self.command_aliases, self._search_index = _build_command_catalog()
+        self._dispatch = self._build_dispatch()
+        # Sorted once for typo suggestions and prefix completion.
+        self._command_names = tuple(sorted(self._dispatch))
+
+    @property
+    def console(self) -> Optional[Console]:
+        """Rich console, created on first use; None when rich is missing or disabled."""
+        if not self._console_ready:
+            from rich.console import Console
+
+            self._console = Console()
+            self._console_ready = True
+        return self._console
+
+    @console.setter
+    def console(self, value: Optional[Console]) -> None:
+        self._console = value
+        self._console_ready = True
+
+    def _export_path(self, prefix: str, ext: str = "json") -> Path:
+        """Build a unique export path; repeats within the same second get a sequence suffix."""
+        second = int(time.time())
+        if second != self._export_second:
+            # Format the stamp once per wall-clock second; the sequence restarts with it.
+            self._export_second = second
+            self._export_stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(second))
+            self._export_seq.clear()
+        name = f"{prefix}_{self._export_stamp}"
+        seq = self._export_seq.get(name, 0)
+        self._export_seq[name] = seq + 1
+        if seq:
+            name = f"{name}_{seq}"
+        return Config.EXPORTS_DIR / f"{name}.{ext}"
 
     def run(self) -> None:
         """Run CLI."""
         self._print_banner()
         self._smart_startup()
+        self._setup_readline()
+        if self._start_monitor:
+            # Sample from the start of the session so `monitor` has history to show.
+            monitor.start()
 
         while True:
             try:
-                cmd = input("\nvoid> ").strip()
+                cmd = input(_PROMPT).strip()
                 if not cmd:
                     continue
                 if len(cmd) > Config.MAX_INPUT_LENGTH:
@@ -135,19 +1722,15 @@ class CLI:
                     )
                     continue
 
-                parts = cmd.split()
-                command = parts[0].lower()
-                args = parts[1:]
-
-                commands = self._get_commands(args)
+                command, args = _split_command(cmd)
 
-                commands = self._add_alias_commands(commands)
                 command_key = self.command_aliases.get(command, command)
+                handler = self._dispatch.get(command_key)
 
-                if command_key in commands:
-                    commands[command_key]()
+                if handler is not None:
+                    handler(args)
                 else:
-                    suggestions = self._suggest_commands(command, list(commands.keys()))
+                    suggestions = self._suggest_commands(command, self._command_names)
                     self.logger.warning(
                         f"Unknown command: {command}",
                         extra={"category": "cli", "device_id": "-", "method": "-"},
@@ -161,20 +1744,62 @@ class CLI:
                     "Use 'exit' to quit",
                     extra={"category": "cli", "device_id": "-", "method": "-"},
                 )
+            except CLIUsageError as exc:
+                # Bad input from the user; a traceback would only be noise.
+                self.logger.warning(
+                    f"Error: {exc}",
+                    extra={"category": "cli", "device_id": "-", "method": "-"},
+                )
             except Exception as exc:
                 self.logger.exception(
                     f"Error: {exc}",
                     extra={"category": "cli", "device_id": "-", "method": "-"},
                 )
 
-    def _suggest_commands(self, command: str, options: List[str]) -> List[str]:
-        """Suggest similar commands for typos or partial input."""
+    def _setup_readline(self) -> None:
+        """Enable prompt history and tab completion of command names when readline exists."""
+        try:
+            import readline
+        except ImportError:
+            return
+        self._completions: List[str] = []
+        readline.set_history_length(_HISTORY_LENGTH)
+        history_path = Config.BASE_DIR / _HISTORY_FILE
+        try:
+            readline.read_history_file(history_path)
+        except OSError:
+            pass
+        atexit.register(_save_history, readline, history_path)
+        # Command names contain '-', which readline treats as a word break by default.
+        readline.set_completer_delims(" \t\n")
+        readline.set_completer(self._complete)
+        if "libedit" in (readline.__doc__ or ""):
+            # macOS ships libedit, which ignores GNU readline binding syntax.
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+
+    def _complete(self, text: str, state: int) -> Optional[str]:
+        """readline completer: the ``state``-th command name starting with ``text``."""
+        if state == 0:
+            import readline
+
+            if readline.get_line_buffer()[: readline.get_begidx()].strip():
+                self._completions = []
+            else:
+                self._completions = _names_with_prefix(self._command_names, text.lower())
+        return self._completions[state] if state < len(self._completions) else None
+
+    def _suggest_commands(self, command: str, options: Sequence[str]) -> List[str]:
+        """Suggest similar commands for typos or partial input; ``options`` must be sorted."""
         if not command:
             return []
 
-        prefix_matches = [option for option in options if option.startswith(command)]
+        prefix_matches = _names_with_prefix(options, command)
         if prefix_matches:
-            return self._format_suggestions(sorted(prefix_matches)[:5])
+            return self._format_suggestions(prefix_matches[:5])
+
+        import difflib
 
         return self._format_suggestions(difflib.get_close_matches(command, options, n=5, cutoff=0.5))
 
@@ -185,113 +1810,114 @@ class CLI:
             resolved.append(self.command_aliases.get(suggestion, suggestion))
         return sorted(set(resolved), key=resolved.index)
 
-    def _add_alias_commands(self, commands: Dict[str, Any]) -> Dict[str, Any]:
-        for alias, target in self.command_aliases.items():
-            if alias not in commands and target in commands:
-                commands[alias] = commands[target]
-        return commands
-
-    def _get_commands(self, args: List[str]) -> Dict[str, Any]:
-        return {
-            'devices': self._cmd_devices,
-            'info': lambda: self._cmd_info(args),
-            'summary': self._cmd_summary,
-            'backup': lambda: self._cmd_backup(args),
-            'screenshot': lambda: self._cmd_screenshot(args),
-            'apps': lambda: self._cmd_apps(args),
-            'files': lambda: self._cmd_files(args),
-            'analyze': lambda: self._cmd_analyze(args),
-            'display-diagnostics': lambda: self._cmd_display_diagnostics(args),
-            'recover': lambda: self._cmd_recover(args),
-            'tweak': lambda: self._cmd_tweak(args),
-            'usb-debug': lambda: self._cmd_usb_debug(args),
-            'report': lambda: self._cmd_report(args),
-            'stats': self._cmd_stats,
-            'monitor': self._cmd_monitor,
-            'logcat': lambda: self._cmd_logcat(args),
-            'execute': lambda: self._cmd_execute(args),
-            'menu': self._cmd_menu,
-            'version': self._cmd_version,
-            'paths': self._cmd_paths,
-            'netcheck': self._cmd_netcheck,
-            'adb': self._cmd_adb,
-            'partitions': lambda: self._cmd_partitions(args),
-            'partition-backup': lambda: self._cmd_partition_backup(args),
-            'partition-wipe': lambda: self._cmd_partition_wipe(args),
-            'repair-flow': lambda: self._cmd_repair_flow(args),
-            'edl-status': lambda: self._cmd_edl_status(args),
-            'edl-enter': lambda: self._cmd_edl_enter(args),
-            'mode-enter': lambda: self._cmd_mode_enter(args),
-            'edl-flash': lambda: self._cmd_edl_flash(args),
-            'edl-dump': lambda: self._cmd_edl_dump(args),
-            'edl-detect': self._cmd_edl_detect,
-            'edl-programmers': self._cmd_edl_programmers,
-            'edl-partitions': lambda: self._cmd_edl_partitions(args),
-            'edl-backup': lambda: self._cmd_edl_backup(args),
-            'edl-restore': lambda: self._cmd_edl_restore(args),
-            'edl-sparse': lambda: self._cmd_edl_sparse(args),
-            'edl-profile': lambda: self._cmd_edl_profile(args),
-            'edl-verify': lambda: self._cmd_edl_verify(args),
-            'edl-unbrick': lambda: self._cmd_edl_unbrick(args),
-            'edl-notes': lambda: self._cmd_edl_notes(args),
-            'edl-reboot': lambda: self._cmd_edl_reboot(args),
-            'edl-log': self._cmd_edl_log,
-            'boot-extract': lambda: self._cmd_boot_extract(args),
-            'magisk-patch': lambda: self._cmd_magisk_patch(args),
-            'magisk-pull': lambda: self._cmd_magisk_pull(args),
-            'twrp-verify': lambda: self._cmd_twrp_verify(args),
-            'twrp-flash': lambda: self._cmd_twrp_flash(args),
-            'root-verify': lambda: self._cmd_root_verify(args),
-            'safety-check': lambda: self._cmd_safety_check(args),
-            'rollback': lambda: self._cmd_rollback(args),
-            'compat-matrix': self._cmd_compat_matrix,
-            'testpoint-guide': lambda: self._cmd_testpoint_guide(args),
-            'clear-cache': self._cmd_clear_cache,
-            'doctor': self._cmd_doctor,
-            'logs': self._cmd_logs,
-            'backups': self._cmd_backups,
-            'reports': self._cmd_reports,
-            'exports': self._cmd_exports,
-            'devices-json': self._cmd_devices_json,
-            'stats-json': self._cmd_stats_json,
-            'logtail': lambda: self._cmd_logtail(args),
-            'cleanup-exports': self._cmd_cleanup_exports,
-            'cleanup-backups': self._cmd_cleanup_backups,
-            'cleanup-reports': self._cmd_cleanup_reports,
-            'env': self._cmd_env,
-            'recent-logs': lambda: self._cmd_recent_logs(args),
-            'recent-backups': lambda: self._cmd_recent_backups(args),
-            'recent-reports': lambda: self._cmd_recent_reports(args),
-            'logs-json': self._cmd_logs_json,
-            'logs-export': lambda: self._cmd_logs_export(args),
-            'backups-json': self._cmd_backups_json,
-            'latest-report': self._cmd_latest_report,
-            'recent-devices': lambda: self._cmd_recent_devices(args),
-            'methods': lambda: self._cmd_methods(args),
-            'methods-json': self._cmd_methods_json,
-            'db-health': self._cmd_db_health,
-            'stats-plus': self._cmd_stats_plus,
-            'reports-json': self._cmd_reports_json,
-            'reports-open': self._cmd_reports_open,
-            'recent-reports-json': self._cmd_recent_reports_json,
-            'config': self._cmd_config,
-            'config-json': self._cmd_config_json,
-            'exports-open': self._cmd_exports_open,
-            'db-backup': self._cmd_db_backup,
-            'plugins': self._cmd_plugins,
-            'plugin': lambda: self._cmd_plugin(args),
-            'smart': lambda: self._cmd_smart(args),
-            'launcher': lambda: self._cmd_launcher(args),
-            'start-menu': lambda: self._cmd_launcher(args),
-            'advanced': self._cmd_advanced,
-            'bootstrap': lambda: self._cmd_bootstrap(args),
-            'search': lambda: self._cmd_search(args),
-            'help': lambda: self._cmd_help(args),
-            'exit': lambda: exit(0),
-            'quit': lambda: exit(0),
-            'q': lambda: exit(0),
-            '?': lambda: self._cmd_help([]),
+    def _build_dispatch(self) -> Dict[str, Callable[[List[str]], Any]]:
+        """Map every command name and alias to a handler taking the argument list."""
+        handlers: Dict[str, Callable[[List[str]], Any]] = {
+            'devices': _ignore_args(self._cmd_devices),
+            'info': self._cmd_info,
+            'summary': _ignore_args(self._cmd_summary),
+            'backup': self._cmd_backup,
+            'screenshot': self._cmd_screenshot,
+            'apps': self._cmd_apps,
+            'files': self._cmd_files,
+            'analyze': self._cmd_analyze,
+            'display-diagnostics': self._cmd_display_diagnostics,
+            'recover': self._cmd_recover,
+            'tweak': self._cmd_tweak,
+            'usb-debug': self._cmd_usb_debug,
+            'report': self._cmd_report,
+            'stats': _ignore_args(self._cmd_stats),
+            'monitor': _ignore_args(self._cmd_monitor),
+            'logcat': self._cmd_logcat,
+            'execute': self._cmd_execute,
+            'menu': _ignore_args(self._cmd_menu),
+            'version': _ignore_args(self._cmd_version),
+            'paths': _ignore_args(self._cmd_paths),
+            'netcheck': _ignore_args(self._cmd_netcheck),
+            'adb': _ignore_args(self._cmd_adb),
+            'partitions': self._cmd_partitions,
+            'partition-backup': self._cmd_partition_backup,
+            'partition-wipe': self._cmd_partition_wipe,
+            'repair-flow': self._cmd_repair_flow,
+            'edl-status': self._cmd_edl_status,
+            'edl-enter': self._cmd_edl_enter,
+            'mode-enter': self._cmd_mode_enter,
+            'edl-flash': self._cmd_edl_flash,
+            'edl-dump': self._cmd_edl_dump,
+            'edl-detect': _ignore_args(self._cmd_edl_detect),
+            'edl-programmers': _ignore_args(self._cmd_edl_programmers),
+            'edl-partitions': self._cmd_edl_partitions,
+            'edl-backup': self._cmd_edl_backup,
+            'edl-restore': self._cmd_edl_restore,
+            'edl-sparse': self._cmd_edl_sparse,
+            'edl-profile': self._cmd_edl_profile,
+            'edl-verify': self._cmd_edl_verify,
+            'edl-unbrick': self._cmd_edl_unbrick,
+            'edl-notes': self._cmd_edl_notes,
+            'edl-reboot': self._cmd_edl_reboot,
+            'edl-log': _ignore_args(self._cmd_edl_log),
+            'boot-extract': self._cmd_boot_extract,
+            'magisk-patch': self._cmd_magisk_patch,
+            'magisk-pull': self._cmd_magisk_pull,
+            'twrp-verify': self._cmd_twrp_verify,
+            'twrp-flash': self._cmd_twrp_flash,
+            'root-verify': self._cmd_root_verify,
+            'safety-check': self._cmd_safety_check,
+            'rollback': self._cmd_rollback,
+            'compat-matrix': _ignore_args(self._cmd_compat_matrix),
+            'testpoint-guide': self._cmd_testpoint_guide,
+            'clear-cache': _ignore_args(self._cmd_clear_cache),
+            'doctor': _ignore_args(self._cmd_doctor),
+            'logs': _ignore_args(self._cmd_logs),
+            'backups': _ignore_args(self._cmd_backups),
+            'reports': _ignore_args(self._cmd_reports),
+            'exports': _ignore_args(self._cmd_exports),
+            'devices-json': _ignore_args(self._cmd_devices_json),
+            'stats-json': _ignore_args(self._cmd_stats_json),
+            'logtail': self._cmd_logtail,
+            'cleanup-exports': _ignore_args(self._cmd_cleanup_exports),
+            'cleanup-backups': _ignore_args(self._cmd_cleanup_backups),
+            'cleanup-reports': _ignore_args(self._cmd_cleanup_reports),
+            'env': _ignore_args(self._cmd_env),
+            'recent-logs': self._cmd_recent_logs,
+            'recent-backups': self._cmd_recent_backups,
+            'recent-reports': self._cmd_recent_reports,
+            'logs-json': _ignore_args(self._cmd_logs_json),
+            'logs-export': self._cmd_logs_export,
+            'backups-json': _ignore_args(self._cmd_backups_json),
+            'latest-report': _ignore_args(self._cmd_latest_report),
+            'recent-devices': self._cmd_recent_devices,
+            'methods': self._cmd_methods,
+            'methods-json': _ignore_args(self._cmd_methods_json),
+            'db-health': _ignore_args(self._cmd_db_health),
+            'stats-plus': _ignore_args(self._cmd_stats_plus),
+            'reports-json': _ignore_args(self._cmd_reports_json),
+            'reports-open': _ignore_args(self._cmd_reports_open),
+            'recent-reports-json': _ignore_args(self._cmd_recent_reports_json),
+            'config': _ignore_args(self._cmd_config),
+            'config-json': _ignore_args(self._cmd_config_json),
+            'exports-open': _ignore_args(self._cmd_exports_open),
+            'db-backup': _ignore_args(self._cmd_db_backup),
+            'plugins': _ignore_args(self._cmd_plugins),
+            'plugin': self._cmd_plugin,
+            'smart': self._cmd_smart,
+            'launcher': self._cmd_launcher,
+            'start-menu': self._cmd_launcher,
+            'advanced': _ignore_args(self._cmd_advanced),
+            'bootstrap': self._cmd_bootstrap,
+            'search': self._cmd_search,
+            'help': self._cmd_help,
+            'exit': lambda args: exit(0),
+            'quit': lambda args: exit(0),
+            'q': lambda args: exit(0),
+            '?': lambda args: self._cmd_help([]),
         }
+        for alias, target in self.command_aliases.items():
+            if alias not in handlers and target in handlers:
+                handlers[alias] = handlers[target]
+        # Hyphenated literals are not interned by the compiler; interning them lets lookups of
+        # interned command words hit the identity fast path.
+        return {sys.intern(name): handler for name, handler in handlers.items()}
 
     def execute_command_line(self, command_line: str) -> Dict[str, Any]:
         """Execute a CLI command programmatically (for GUI/automation)."""
@@ -304,17 +1930,14 @@ class CLI:
                 "message": f"Command too long (max {Config.MAX_INPUT_LENGTH} characters).",
             }
 
-        parts = command_line.split()
-        command = parts[0].lower()
-        args = parts[1:]
+        command, args = _split_command(command_line)
         if command in {"exit", "quit", "q"}:
             return {"success": True, "message": "Exit command ignored in GUI mode."}
 
-        commands = self._get_commands(args)
-        commands = self._add_alias_commands(commands)
         command_key = self.command_aliases.get(command, command)
-        if command_key not in commands:
-            suggestions = self._suggest_commands(command, list(commands.keys()))
+        handler = self._dispatch.get(command_key)
+        if handler is None:
+            suggestions = self._suggest_commands(command, self._command_names)
             hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
             return {"success": False, "message": f"Unknown command: {command}.{hint}"}
 
@@ -324,7 +1947,7 @@ class CLI:
         buffer = io.StringIO()
         try:
             with redirect_stdout(buffer):
-                commands[command_key]()
+                handler(args)
         except SystemExit:
             return {"success": True, "message": "Exit command ignored in GUI mode."}
         except Exception as exc:
@@ -334,690 +1957,51 @@ class CLI:
         message = output or f"{command_key} completed."
         return {"success": True, "message": message, "output": output}
 
-    def _build_command_aliases(self) -> Dict[str, str]:
-        aliases: Dict[str, str] = {}
-        for command in self.command_catalog.values():
-            for alias in command.aliases:
-                aliases[alias] = command.name
-        return aliases
-
-    def _build_command_catalog(self) -> Dict[str, CommandInfo]:
-        catalog = [
-            CommandInfo(
-                name="advanced",
-                summary="Show advanced Android tooling overview.",
-                usage="advanced",
-                category="Advanced Toolbox",
-                examples=["advanced"],
-                aliases=["toolbox"],
-            ),
-            CommandInfo(
-                name="bootstrap",
-                summary="Install bundled Android platform tools.",
-                usage="bootstrap [force]",
-                category="System & Diagnostics",
-                examples=["bootstrap", "bootstrap force"],
-            ),
-            CommandInfo(
-                name="devices",
-                summary="List all connected devices.",
-                usage="devices",
-                category="Device Management",
-                examples=["devices"],
-                aliases=["list", "ls", "device"],
-            ),
-            CommandInfo(
-                name="info",
-                summary="Show detailed device info.",
-                usage="info <device_id|smart>",
-                category="Device Management",
-                examples=["info emulator-5554", "info smart"],
-            ),
-            CommandInfo(
-                name="summary",
-                summary="Show a short summary for all devices.",
-                usage="summary",
-                category="Device Management",
-                examples=["summary"],
-            ),
-            CommandInfo(
-                name="backup",
-                summary="Create an automated backup.",
-                usage="backup <device_id|smart>",
-                category="Backup & Data",
-                examples=["backup emulator-5554", "backup smart"],
-            ),
-            CommandInfo(
-                name="recover",
-                summary="Recover contacts or SMS.",
-                usage="recover <device_id|smart> <contacts|sms>",
-                category="Backup & Data",
-                examples=["recover emulator-5554 contacts", "recover smart sms"],
-            ),
-            CommandInfo(
-                name="screenshot",
-                summary="Capture a device screenshot.",
-                usage="screenshot <device_id|smart>",
-                category="Backup & Data",
-                examples=["screenshot emulator-5554"],
-            ),
-            CommandInfo(
-                name="apps",
-                summary="List installed apps.",
-                usage="apps <device_id|smart> [system|user|all]",
-                category="Apps & Files",
-                examples=["apps smart", "apps emulator-5554 user"],
-            ),
-            CommandInfo(
-                name="files",
-                summary="Manage files on the device.",
-                usage="files <device_id|smart> <list|pull|push|delete> [path]",
-                category="Apps & Files",
-                examples=["files smart list /sdcard", "files emulator-5554 pull /sdcard/test.txt"],
-            ),
-            CommandInfo(
-                name="analyze",
-                summary="Run performance analysis.",
-                usage="analyze <device_id|smart>",
-                category="Analysis & Reports",
-                examples=["analyze smart"],
-            ),
-            CommandInfo(
-                name="display-diagnostics",
-                summary="Run display and framebuffer diagnostics.",
-                usage="display-diagnostics <device_id|smart>",
-                category="Analysis & Reports",
-                examples=["display-diagnostics emulator-5554"],
-            ),
-            CommandInfo(
-                name="report",
-                summary="Generate a full device report.",
-                usage="report <device_id|smart>",
-                category="Analysis & Reports",
-                examples=["report smart"],
-            ),
-            CommandInfo(
-                name="partitions",
-                summary="List device partitions via ADB.",
-                usage="partitions <device_id|smart>",
-                category="Advanced Toolbox",
-                examples=["partitions smart"],
-            ),
-            CommandInfo(
-                name="partition-backup",
-                summary="Backup a partition image via ADB.",
-                usage="partition-backup <device_id|smart> <partition> [output_dir]",
-                category="Advanced Toolbox",
-                examples=["partition-backup smart boot", "partition-backup emulator-5554 userdata /tmp"],
-            ),
-            CommandInfo(
-                name="partition-wipe",
-                summary="Wipe a partition via fastboot or ADB (destructive).",
-                usage="partition-wipe <device_id|smart> <partition>",
-                category="Advanced Toolbox",
-                examples=["partition-wipe smart userdata"],
-            ),
-            CommandInfo(
-                name="repair-flow",
-                summary="Run guided repair workflow with optional remediation.",
-                usage="repair-flow <device_id|smart> [--report]",
-                category="Analysis & Reports",
-                examples=["repair-flow smart", "repair-flow emulator-5554 --report"],
-                aliases=["workflow", "repair"],
-            ),
-            CommandInfo(
-                name="logcat",
-                summary="View real-time logcat output.",
-                usage="logcat <device_id|smart> [filter_tag]",
-                category="Analysis & Reports",
-                examples=["logcat emulator-5554", "logcat smart ActivityManager"],
-            ),
-            CommandInfo(
-                name="tweak",
-                summary="Apply system tweaks (dpi/animation/timeout).",
-                usage="tweak <device_id|smart> <dpi|animation|timeout> <value>",
-                category="System & Diagnostics",
-                examples=["tweak smart dpi 320", "tweak emulator-5554 timeout 600000"],
-            ),
-            CommandInfo(
-                name="usb-debug",
-                summary="Enable or force USB debugging.",
-                usage="usb-debug <device_id|smart> [force]",
-                category="System & Diagnostics",
-                examples=["usb-debug smart", "usb-debug emulator-5554 force"],
-            ),
-            CommandInfo(
-                name="execute",
-                summary="Execute an FRP method.",
-                usage="execute <method> <device_id|smart>",
-                category="FRP Bypass",
-                examples=["execute adb_shell_reset smart"],
-            ),
-            CommandInfo(
-                name="edl-status",
-                summary="Show EDL mode status and USB IDs.",
-                usage="edl-status <device_id|smart>",
-                category="EDL & Test-point",
-                examples=["edl-status usb-05c6:9008"],
-            ),
-            CommandInfo(
-                name="edl-enter",
-                summary="Enter EDL mode (if supported).",
-                usage="edl-enter <device_id|smart>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="mode-enter",
-                summary="Guided entry into a target mode with chipset-aware steps.",
-                usage=(
-                    "mode-enter <device_id|smart> <target_mode> "
-                    "[--override=<chipset>] [--auth-token=<token>] [--ownership=<proof>]"
-                ),
-                category="EDL & Test-point",
-                examples=["mode-enter smart edl", "mode-enter usb-05c6:9008 edl --override=Qualcomm"],
-            ),
-            CommandInfo(
-                name="edl-flash",
-                summary="Flash an image via EDL.",
-                usage="edl-flash <device_id|smart> <loader> <image>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-dump",
-                summary="Dump a partition via EDL.",
-                usage="edl-dump <device_id|smart> <partition>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-detect",
-                summary="Scan USB for EDL devices.",
-                usage="edl-detect",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-programmers",
-                summary="List available firehose programmers.",
-                usage="edl-programmers",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-partitions",
-                summary="Show partition map via ADB or EDL.",
-                usage="edl-partitions <device_id|smart> [loader]",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-backup",
-                summary="Backup a partition via EDL.",
-                usage="edl-backup <device_id|smart> <partition>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-restore",
-                summary="Restore a partition via EDL.",
-                usage="edl-restore <device_id|smart> <loader> <image>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-sparse",
-                summary="Convert sparse images.",
-                usage="edl-sparse <to-raw|to-sparse> <source> <dest>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-profile",
-                summary="Manage EDL profiles.",
-                usage="edl-profile <list|add|delete> [name] [json]",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-verify",
-                summary="Verify image hash.",
-                usage="edl-verify <file> [sha256]",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-unbrick",
-                summary="Show an unbrick checklist.",
-                usage="edl-unbrick [loader]",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-notes",
-                summary="Show device-specific notes.",
-                usage="edl-notes [vendor]",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-reboot",
-                summary="Reboot to a target mode.",
-                usage="edl-reboot <device_id|smart> <edl|fastboot|recovery|bootloader|system>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="edl-log",
-                summary="Capture EDL workflow logs.",
-                usage="edl-log",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="boot-extract",
-                summary="Extract boot image contents.",
-                usage="boot-extract <boot.img>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="magisk-patch",
-                summary="Stage a Magisk patch workflow.",
-                usage="magisk-patch <device_id|smart> <boot.img>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="magisk-pull",
-                summary="Pull Magisk patched image.",
-                usage="magisk-pull <device_id|smart> [output_dir]",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="twrp-verify",
-                summary="Verify a TWRP image matches device codename.",
-                usage="twrp-verify <device_id|smart> <twrp.img>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="twrp-flash",
-                summary="Flash or boot TWRP recovery via fastboot.",
-                usage="twrp-flash <device_id|smart> <twrp.img> [boot]",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="root-verify",
-                summary="Verify root access via ADB.",
-                usage="root-verify <device_id|smart>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="safety-check",
-                summary="Run safety checklist for device operations.",
-                usage="safety-check <device_id|smart>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="rollback",
-                summary="Rollback a partition flash.",
-                usage="rollback <device_id|smart> <partition> <image>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="compat-matrix",
-                summary="Show EDL compatibility matrix.",
-                usage="compat-matrix",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="testpoint-guide",
-                summary="Show test-point references.",
-                usage="testpoint-guide <device_id|smart>",
-                category="EDL & Test-point",
-            ),
-            CommandInfo(
-                name="stats",
-                summary="Show suite statistics.",
-                usage="stats",
-                category="System",
-            ),
-            CommandInfo(
-                name="monitor",
-                summary="Show system resource usage.",
-                usage="monitor",
-                category="System",
-            ),
-            CommandInfo(
-                name="version",
-                summary="Show suite version details.",
-                usage="version",
-                category="System",
-            ),
-            CommandInfo(
-                name="paths",
-                summary="Show local data directories.",
-                usage="paths",
-                category="System",
-            ),
-            CommandInfo(
-                name="menu",
-                summary="Launch interactive menu.",
-                usage="menu",
-                category="System",
-            ),
-            CommandInfo(
-                name="netcheck",
-                summary="Check internet connectivity.",
-                usage="netcheck",
-                category="System",
-            ),
-            CommandInfo(
-                name="adb",
-                summary="Check ADB availability.",
-                usage="adb",
-                category="System",
-            ),
-            CommandInfo(
-                name="clear-cache",
-                summary="Clear local cache directory.",
-                usage="clear-cache",
-                category="System",
-            ),
-            CommandInfo(
-                name="doctor",
-                summary="Run quick system checks.",
-                usage="doctor",
-                category="System",
-            ),
-            CommandInfo(
-                name="logs",
-                summary="List recent log files.",
-                usage="logs",
-                category="System",
-            ),
-            CommandInfo(
-                name="backups",
-                summary="List recent backups.",
-                usage="backups",
-                category="System",
-            ),
-            CommandInfo(
-                name="reports",
-                summary="List recent reports.",
-                usage="reports",
-                category="System",
-            ),
-            CommandInfo(
-                name="exports",
-                summary="List recent exports.",
-                usage="exports",
-                category="System",
-            ),
-            CommandInfo(
-                name="devices-json",
-                summary="Export devices to JSON.",
-                usage="devices-json",
-                category="System",
-            ),
-            CommandInfo(
-                name="stats-json",
-                summary="Export stats to JSON.",
-                usage="stats-json",
-                category="System",
-            ),
-            CommandInfo(
-                name="logtail",
-                summary="Tail recent log lines.",
-                usage="logtail [lines]",
-                category="System",
-            ),
-            CommandInfo(
-                name="cleanup-exports",
-                summary="Remove old exports.",
-                usage="cleanup-exports",
-                category="System",
-            ),
-            CommandInfo(
-                name="cleanup-backups",
-                summary="Remove old backups.",
-                usage="cleanup-backups",
-                category="System",
-            ),
-            CommandInfo(
-                name="cleanup-reports",
-                summary="Remove old reports.",
-                usage="cleanup-reports",
-                category="System",
-            ),
-            CommandInfo(
-                name="env",
-                summary="Show environment info.",
-                usage="env",
-                category="System",
-            ),
-            CommandInfo(
-                name="recent-logs",
-                summary="Show recent log entries.",
-                usage="recent-logs [count]",
-                category="System",
-            ),
-            CommandInfo(
-                name="recent-backups",
-                summary="Show recent backup records.",
-                usage="recent-backups [count]",
-                category="System",
-            ),
-            CommandInfo(
-                name="recent-reports",
-                summary="Show recent report records.",
-                usage="recent-reports [count]",
-                category="System",
-            ),
-            CommandInfo(
-                name="logs-json",
-                summary="Export logs to JSON.",
-                usage="logs-json",
-                category="System",
-            ),
-            CommandInfo(
-                name="logs-export",
-                summary="Export filtered logs to JSON or CSV.",
-                usage="logs-export <json|csv> [filters]",
-                category="System",
-            ),
-            CommandInfo(
-                name="backups-json",
-                summary="Export backups to JSON.",
-                usage="backups-json",
-                category="System",
-            ),
-            CommandInfo(
-                name="latest-report",
-                summary="Show latest report paths.",
-                usage="latest-report",
-                category="System",
-            ),
-            CommandInfo(
-                name="recent-devices",
-                summary="Show recent devices.",
-                usage="recent-devices [count]",
-                category="System",
-            ),
-            CommandInfo(
-                name="methods",
-                summary="Show top methods.",
-                usage="methods [count]",
-                category="System",
-            ),
-            CommandInfo(
-                name="methods-json",
-                summary="Export methods to JSON.",
-                usage="methods-json",
-                category="System",
-            ),
-            CommandInfo(
-                name="db-health",
-                summary="Show database health summary.",
-                usage="db-health",
-                category="System",
-            ),
-            CommandInfo(
-                name="stats-plus",
-                summary="Show extended stats.",
-                usage="stats-plus",
-                category="System",
-            ),
-            CommandInfo(
-                name="reports-json",
-                summary="Export reports to JSON.",
-                usage="reports-json",
-                category="System",
-            ),
-            CommandInfo(
-                name="smart",
-                summary="Show or toggle smart features.",
-                usage="smart [status|on|off|auto-device|prefer-last|auto-doctor|suggest|safety] [on|off]",
-                category="System",
-                aliases=["assist", "suggest"],
-            ),
-            CommandInfo(
-                name="launcher",
-                summary="Manage start menu launchers.",
-                usage="launcher <install|uninstall|status>",
-                category="System",
-            ),
-            CommandInfo(
-                name="reports-open",
-                summary="Open reports directory.",
-                usage="reports-open",
-                category="System",
-            ),
-            CommandInfo(
-                name="recent-reports-json",
-                summary="Export recent reports to JSON.",
-                usage="recent-reports-json",
-                category="System",
-            ),
-            CommandInfo(
-                name="config",
-                summary="Show configuration values.",
-                usage="config",
-                category="System",
-            ),
-            CommandInfo(
-                name="config-json",
-                summary="Export configuration to JSON.",
-                usage="config-json",
-                category="System",
-            ),
-            CommandInfo(
-                name="exports-open",
-                summary="Open exports directory.",
-                usage="exports-open",
-                category="System",
-            ),
-            CommandInfo(
-                name="db-backup",
-                summary="Backup database to exports.",
-                usage="db-backup",
-                category="System",
-            ),
-            CommandInfo(
-                name="plugins",
-                summary="List available plugins.",
-                usage="plugins",
-                category="Plugins",
-            ),
-            CommandInfo(
-                name="plugin",
-                summary="Run a plugin by id.",
-                usage="plugin <id> [args]",
-                category="Plugins",
-            ),
-            CommandInfo(
-                name="search",
-                summary="Search commands by keyword.",
-                usage="search <keyword>",
-                category="Help",
-                aliases=["find", "lookup"],
-            ),
-            CommandInfo(
-                name="help",
-                summary="Show help or command details.",
-                usage="help [command]",
-                category="Help",
-                aliases=["h", "man"],
-            ),
-            CommandInfo(
-                name="exit",
-                summary="Exit the suite.",
-                usage="exit",
-                category="Help",
-                aliases=["quit", "q"],
-            ),
-        ]
-        return {command.name: command for command in catalog}
-
     def _print_toolkit_result(self, result: ToolkitResult) -> None:
         icon = "✅" if result.success else "⚠️"
         print(f"{icon} {result.message}")
         if result.data:
-            print(json.dumps(result.data, indent=2))
+            print(_json_text(result.data))
 
     def _print_banner(self) -> None:
         """Print banner."""
-        features_count = 200  # Total automated features
-
-        box_width = 62
-
-        def pad(text: str) -> str:
-            return text.ljust(box_width)
-
-        slogan_lines = Config.THEME_SLOGANS[:2]
-        banner = (
-            f"╔{'═' * box_width}╗\n"
-            f"║ {pad(f'VOID v{Config.VERSION} - {Config.CODENAME}')} ║\n"
-            f"║ {pad(Config.THEME_TAGLINE)} ║\n"
-            f"║ {pad(f'{features_count}+ automated features • {Config.THEME_NAME}')} ║\n"
-            f"║ {pad('')} ║\n"
-            f"║ {pad('Copyright (c) 2024 Roach Labs. All rights reserved.')} ║\n"
-            f"║ {pad('Made by James Michael Roach Jr.')} ║\n"
-            f"║ {pad('Proprietary and confidential.')} ║\n"
-            f"╚{'═' * box_width}╝\n\n"
-            f"✨ {slogan_lines[0]}\n"
-            f"✨ {slogan_lines[1]}\n\n"
-            "Type 'help' to see all available commands.\n"
-            "Type 'help <command>' for detailed usage.\n"
-            "Type 'search <keyword>' to find commands.\n"
-            "Type 'menu' to launch the interactive menu.\n"
-        )
-        print(banner)
+        _write_lines((_build_banner(),))
 
     def _cmd_devices(self) -> None:
         """List devices."""
-        devices, _ = DeviceDetector.detect_all()
+        devices, _ = self._detect_devices()
 
         if not devices:
             print("❌ No devices detected")
             return
 
         if self.console:
+            from rich.table import Table
+
             table = Table(title="Connected Devices")
-            table.add_column("ID", style="cyan")
-            table.add_column("Modes", style="green")
-            table.add_column("Status", style="white")
-            table.add_column("Manufacturer", style="yellow")
-            table.add_column("Model", style="blue")
-            table.add_column("Android", style="magenta")
-
-            for device in devices:
-                modes = device.get("modes") or [device.get("mode", "Unknown")]
-                mode_label = ", ".join(modes) if isinstance(modes, list) else str(modes)
-                table.add_row(
+            for header, style in _DEVICE_COLUMNS:
+                table.add_column(header, style=style)
+            rows = [
+                (
                     device.get('id', 'Unknown'),
-                    mode_label,
+                    _mode_label(device),
                     device.get('status', 'Unknown'),
                     device.get('manufacturer', 'Unknown'),
                     device.get('model', 'Unknown'),
-                    device.get('android_version', 'Unknown')
+                    device.get('android_version', 'Unknown'),
                 )
-
+                for device in devices
+            ]
+            for row in rows:
+                table.add_row(*row)
             self.console.print(table)
         else:
             print("\n📱 Connected Devices:")
-            for device in devices:
-                status = device.get('status', 'Unknown')
-                modes = device.get("modes") or [device.get("mode", "Unknown")]
-                mode_label = ", ".join(modes) if isinstance(modes, list) else str(modes)
-                print(
-                    f"  • {device.get('id')} - {device.get('manufacturer')} "
-                    f"{device.get('model')} ({status}) [{mode_label}]"
-                )
+            _write_lines(
+                f"  • {device.get('id')} - {device.get('manufacturer')} "
+                f"{device.get('model')} ({device.get('status', 'Unknown')}) [{_mode_label(device)}]"
+                for device in devices
+            )
 
     def _cmd_backup(self, args: List[str]) -> None:
         """Create backup."""
@@ -1055,8 +2039,7 @@ class CLI:
         apps = AppManager.list_apps(device_id, filter_type)
 
         print(f"\n📦 {filter_type.title()} Apps ({len(apps)}):")
-        for app in apps[:20]:
-            print(f"  • {app['package']}")
+        _write_lines(f"  • {app['package']}" for app in apps[:20])
 
         if len(apps) > 20:
             print(f"  ... and {len(apps) - 20} more")
@@ -1068,7 +2051,7 @@ class CLI:
             return
 
         diagnostics = DisplayAnalyzer.analyze(device_id)
-        print(json.dumps(diagnostics, indent=2))
+        print(_json_text(diagnostics))
 
     def _cmd_info(self, args: List[str]) -> None:
         """Show device info."""
@@ -1076,7 +2059,7 @@ class CLI:
         if not device_id:
             return
 
-        devices, _ = DeviceDetector.detect_all()
+        devices, _ = self._detect_devices()
         device = next((d for d in devices if d['id'] == device_id), None)
 
         if device:
@@ -1089,7 +2072,7 @@ class CLI:
 
     def _cmd_summary(self) -> None:
         """Show a short device summary."""
-        devices, _ = DeviceDetector.detect_all()
+        devices, _ = self._detect_devices()
         if not devices:
             print("❌ No devices detected")
             return
@@ -1103,11 +2086,9 @@ class CLI:
             security = device.get('security_patch', 'Unknown')
             reachable = "Yes" if device.get("reachable") else "No"
             status = device.get('status', 'Unknown')
-            modes = device.get("modes") or [device.get("mode", "Unknown")]
-            mode_label = ", ".join(modes) if isinstance(modes, list) else str(modes)
             print(
                 f"• {device_id} — {brand} {model} | Android {android} | Patch {security} "
-                f"| Status: {status} | Modes: {mode_label} | Reachable: {reachable}"
+                f"| Status: {status} | Modes: {_mode_label(device)} | Reachable: {reachable}"
             )
 
     def _cmd_menu(self) -> None:
@@ -1116,11 +2097,11 @@ class CLI:
 
     def _run_menu(self) -> None:
         """Interactive menu navigation."""
-        menu_stack = [("Main Menu", self._menu_main())]
+        menu_stack = [("Main Menu", _MAIN_MENU, "Main Menu")]
 
         while menu_stack:
-            title, items = menu_stack[-1]
-            self._render_menu(title, items, menu_stack)
+            title, menu, _ = menu_stack[-1]
+            self._render_menu(title, menu.items, menu_stack)
 
             choice = self._prompt("Select an option (number or shortcut)").lower()
             if not choice:
@@ -1137,40 +2118,43 @@ class CLI:
                     return
                 continue
 
-            matched = self._match_menu_choice(choice, items)
+            matched = self._match_menu_choice(choice, menu)
             if not matched:
                 print("❌ Invalid selection")
                 continue
 
-            if "submenu" in matched:
-                menu_stack.append((matched["label"], matched["submenu"]))
+            if matched.submenu:
+                label = matched.label
+                parent_crumb = menu_stack[-1][2]
+                breadcrumb = f"{parent_crumb} > {label}" if parent_crumb else label
+                menu_stack.append((label, matched.submenu, breadcrumb))
                 continue
-            action = matched.get("action")
-            if action:
-                action()
-            if matched.get("exit"):
+            if matched.command:
+                command, args = _split_command(matched.command)
+                self._dispatch[command](args)
+            elif matched.action:
+                matched.action(self, *matched.args)
+            if matched.exit:
                 return
 
-    def _render_menu(self, title: str, items: List[Dict[str, Any]], stack: List[Any]) -> None:
+    def _render_menu(self, title: str, items: Tuple[MenuItem, ...], stack: List[Any]) -> None:
         """Render a menu with optional rich formatting."""
-        breadcrumb = " > ".join(level[0] for level in stack)
+        breadcrumb = stack[-1][2]
         subtitle = f"Path: {breadcrumb}"
         if self.last_device_id:
             subtitle = f"{subtitle} | Last device: {self.last_device_id}"
 
         if self.console:
+            from rich.panel import Panel
+            from rich.table import Table
+
             table = Table(title=f"📋 {title}", show_header=True, header_style="bold cyan")
             table.add_column("#", style="dim", width=4, justify="right")
             table.add_column("Action", style="bold")
             table.add_column("Description", style="white")
             table.add_column("Shortcut", style="magenta", width=8, justify="center")
             for index, item in enumerate(items, start=1):
-                table.add_row(
-                    str(index),
-                    item["label"],
-                    item.get("desc", ""),
-                    item.get("shortcut", "")
-                )
+                table.add_row(str(index), item.label, item.desc, item.shortcut)
             self.console.print(Panel.fit(subtitle, style="dim"))
             self.console.print(table)
             self.console.print("[dim]b[/dim]=Back  [dim]h[/dim]=Help  [dim]q[/dim]=Quit  [dim]0[/dim]=Back  [?]=Help")
@@ -1178,9 +2162,9 @@ class CLI:
             print(f"\n📋 {title}")
             print(f"   {subtitle}\n")
             for index, item in enumerate(items, start=1):
-                desc = f" — {item.get('desc', '')}" if item.get("desc") else ""
-                shortcut = f"[{item.get('shortcut')}]" if item.get("shortcut") else ""
-                print(f"  {index}. {item['label']} {shortcut}{desc}")
+                desc = f" — {item.desc}" if item.desc else ""
+                shortcut = f"[{item.shortcut}]" if item.shortcut else ""
+                print(f"  {index}. {item.label} {shortcut}{desc}")
             print("\n  b. Back   h. Help   q. Quit   0. Back   ?. Help")
 
     def _print_menu_help(self) -> None:
@@ -1188,90 +2172,14 @@ class CLI:
         print("\nTip: Use numbers or shortcuts to navigate.")
         print("Type 'b' or '0' to go back, 'q' to quit.\n")
 
-    def _match_menu_choice(self, choice: str, items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def _match_menu_choice(self, choice: str, menu: Menu) -> Optional[MenuItem]:
         """Match menu choice to an item."""
         if choice.isdigit():
             index = int(choice) - 1
-            if 0 <= index < len(items):
-                return items[index]
+            if 0 <= index < len(menu.items):
+                return menu.items[index]
             return None
-        for item in items:
-            if item.get("shortcut") == choice:
-                return item
-        return None
-
-    def _menu_main(self) -> List[Dict[str, Any]]:
-        """Main menu items."""
-        return [
-            {"label": "Devices", "desc": "Detect and inspect connected devices", "shortcut": "d", "submenu": self._menu_devices()},
-            {"label": "Backup & Recovery", "desc": "Backups and data recovery tools", "shortcut": "b", "submenu": self._menu_backup()},
-            {"label": "Apps & Files", "desc": "App listing and file operations", "shortcut": "a", "submenu": self._menu_apps_files()},
-            {"label": "Analysis & Reports", "desc": "Performance analysis and reports", "shortcut": "r", "submenu": self._menu_analysis()},
-            {"label": "System & Diagnostics", "desc": "Health checks and system tools", "shortcut": "s", "submenu": self._menu_system()},
-            {"label": "Advanced Toolbox", "desc": "EDL, recovery, and expert workflows", "shortcut": "x", "action": self._cmd_advanced},
-            {"label": "Exit Menu", "desc": "Return to CLI prompt", "shortcut": "q", "exit": True},
-        ]
-
-    def _menu_devices(self) -> List[Dict[str, Any]]:
-        """Device menu items."""
-        return [
-            {"label": "List devices", "desc": "Show all connected devices", "shortcut": "l", "action": self._cmd_devices},
-            {"label": "Device summary", "desc": "Quick overview of all devices", "shortcut": "s", "action": self._cmd_summary},
-            {"label": "Device info", "desc": "Inspect a single device", "shortcut": "i", "action": self._menu_device_info},
-            {"label": "Screenshot", "desc": "Capture device screen", "shortcut": "c", "action": self._menu_screenshot},
-        ]
-
-    def _menu_backup(self) -> List[Dict[str, Any]]:
-        """Backup menu items."""
-        return [
-            {"label": "Create backup", "desc": "Automated device backup", "shortcut": "b", "action": self._menu_backup_create},
-            {"label": "Recover contacts", "desc": "Restore contacts data", "shortcut": "c", "action": lambda: self._menu_recover("contacts")},
-            {"label": "Recover SMS", "desc": "Restore SMS messages", "shortcut": "s", "action": lambda: self._menu_recover("sms")},
-            {"label": "Recent backups (DB)", "desc": "Show recent backup records", "shortcut": "r", "action": lambda: self._cmd_recent_backups([])},
-        ]
-
-    def _menu_apps_files(self) -> List[Dict[str, Any]]:
-        """Apps and files menu items."""
-        return [
-            {"label": "List apps", "desc": "List installed apps", "shortcut": "a", "action": self._menu_apps},
-            {"label": "List files", "desc": "Browse device storage", "shortcut": "l", "action": lambda: self._menu_files("list")},
-            {"label": "Pull file", "desc": "Copy file from device", "shortcut": "p", "action": lambda: self._menu_files("pull")},
-            {"label": "Push file", "desc": "Copy file to device", "shortcut": "u", "action": lambda: self._menu_files("push")},
-            {"label": "Delete file", "desc": "Remove file from device", "shortcut": "d", "action": lambda: self._menu_files("delete")},
-        ]
-
-    def _menu_analysis(self) -> List[Dict[str, Any]]:
-        """Analysis menu items."""
-        return [
-            {"label": "Analyze device", "desc": "Performance analysis", "shortcut": "a", "action": self._menu_analyze},
-            {"label": "Generate report", "desc": "Create full device report", "shortcut": "g", "action": self._menu_report},
-            {"label": "Latest report paths", "desc": "Show latest report files", "shortcut": "l", "action": self._cmd_latest_report},
-            {"label": "Recent reports (DB)", "desc": "Show recent report records", "shortcut": "r", "action": lambda: self._cmd_recent_reports([])},
-        ]
-
-    def _menu_system(self) -> List[Dict[str, Any]]:
-        """System menu items."""
-        return [
-            {"label": "Suite stats", "desc": "Usage statistics", "shortcut": "s", "action": self._cmd_stats},
-            {"label": "Version info", "desc": "Suite version details", "shortcut": "v", "action": self._cmd_version},
-            {"label": "System monitor", "desc": "CPU/Memory/Disk usage", "shortcut": "m", "action": self._cmd_monitor},
-            {"label": "Show paths", "desc": "Local data directories", "shortcut": "p", "action": self._cmd_paths},
-            {"label": "Install platform tools", "desc": "Bundle ADB/Fastboot locally", "shortcut": "z", "action": lambda: self._cmd_bootstrap([])},
-            {"label": "System checks", "desc": "Connectivity and health checks", "shortcut": "d", "action": self._cmd_doctor},
-            {"label": "Network check", "desc": "Internet reachability", "shortcut": "n", "action": self._cmd_netcheck},
-            {"label": "ADB availability", "desc": "ADB version check", "shortcut": "a", "action": self._cmd_adb},
-            {"label": "DB health", "desc": "Database size and totals", "shortcut": "h", "action": self._cmd_db_health},
-            {"label": "Recent logs (DB)", "desc": "Latest log entries", "shortcut": "l", "action": lambda: self._cmd_recent_logs([])},
-            {"label": "Tail log file", "desc": "Show last 50 lines", "shortcut": "t", "action": lambda: self._cmd_logtail(["50"])},
-            {"label": "Clear cache", "desc": "Clear cached files", "shortcut": "c", "action": self._cmd_clear_cache},
-            {"label": "Log files", "desc": "List recent log files", "shortcut": "g", "action": self._cmd_logs},
-            {"label": "Backups", "desc": "List recent backups", "shortcut": "b", "action": self._cmd_backups},
-            {"label": "Reports", "desc": "List recent reports", "shortcut": "r", "action": self._cmd_reports},
-            {"label": "Exports", "desc": "List recent exports", "shortcut": "e", "action": self._cmd_exports},
-            {"label": "Environment", "desc": "Runtime environment info", "shortcut": "i", "action": self._cmd_env},
-            {"label": "Smart mode", "desc": "Smart suggestions and toggles", "shortcut": "x", "action": lambda: self._cmd_smart([])},
-            {"label": "Start menu launcher", "desc": "Install or remove launchers", "shortcut": "y", "action": lambda: self._cmd_launcher([])},
-        ]
+        return menu.shortcuts.get(choice)
 
     def _prompt(self, label: str) -> str:
         """Prompt with input length guard."""
@@ -1319,9 +2227,12 @@ class CLI:
         return choice.device_id
 
     def _resolve_device_id(self, args: List[str], usage: str) -> Optional[str]:
-        """Resolve device id, honoring smart defaults."""
-        if args:
-            candidate = args[0]
+        """Resolve device id from the first argument, honoring smart defaults."""
+        return self._resolve_device_id_str(args[0] if args else None, usage)
+
+    def _resolve_device_id_str(self, candidate: Optional[str], usage: str) -> Optional[str]:
+        """Resolve a single device id candidate, honoring smart defaults."""
+        if candidate is not None:
             if candidate.lower() in {"smart", "auto"}:
                 device_id = self._smart_select_device()
                 if device_id:
@@ -1466,7 +2377,7 @@ class CLI:
 
     def _cmd_adb(self) -> None:
         """Check ADB availability."""
-        code, stdout, stderr = SafeSubprocess.run(['adb', 'version'])
+        code, stdout, stderr = _adb_version()
         if code == 0:
             first_line = stdout.strip().splitlines()[0] if stdout else "ADB available"
             print(f"✅ {first_line}")
@@ -1476,18 +2387,18 @@ class CLI:
 
     def _cmd_clear_cache(self) -> None:
         """Clear cache directory."""
-        if Config.CACHE_DIR.exists():
-            shutil.rmtree(Config.CACHE_DIR)
+        _discard_dir(Config.CACHE_DIR)
         Config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         print(f"✅ Cache cleared: {Config.CACHE_DIR}")
 
     def _cmd_doctor(self) -> None:
         """Run quick system checks."""
         print("\n🧪 System Checks\n")
+        # Connectivity changes too quickly to cache; probe it each time, as netcheck does.
         internet_status = "Online" if NetworkTools.check_internet() else "Offline"
         print(f"  Internet: {internet_status}")
 
-        android_tools = check_android_tools()
+        android_tools = _check_tools("Android", check_android_tools)
         adb_result = next((tool for tool in android_tools if tool.name == "adb"), None)
         if adb_result and adb_result.available:
             version = adb_result.version or "ADB available"
@@ -1502,12 +2413,12 @@ class CLI:
         print(f"  DB Path: {Config.DB_PATH}")
 
         print("\n🧰 Tooling\n")
-        tool_groups = [
-            ("Android", android_tools),
-            ("Qualcomm", check_qualcomm_tools()),
-            ("MediaTek", check_mediatek_tools()),
-        ]
-        for label, tools in tool_groups:
+        self._print_tooling()
+
+    def _print_tooling(self) -> None:
+        """Print tool availability per chipset group."""
+        for label, check in _TOOL_CHECKS:
+            tools = _check_tools(label, check)
             print(f"  {label}:")
             for tool in tools:
                 if tool.available:
@@ -1524,6 +2435,8 @@ class CLI:
         force = bool(args and args[0].lower() == "force")
         print("\n📦 Installing Android platform tools\n")
         result = install_android_platform_tools(force=force)
+        _ADB_CACHE.clear()
+        _TOOL_CACHE.clear()
         status = result.get("status", "fail")
         message = result.get("message", "Install failed.")
         detail = result.get("detail", "")
@@ -1546,139 +2459,69 @@ class CLI:
         print("\n🧰 Advanced Android Toolbox\n")
         print("Use these expert workflows with care. Always back up data first.\n")
 
-        sections = {
-            "EDL & Test-point": [
-                "edl-status <device_id|smart>           - Detect EDL mode + USB VID/PID",
-                "edl-enter <device_id|smart>            - Enter EDL mode (if supported)",
-                "mode-enter <device_id|smart> <target>  - Guided mode entry with manual steps",
-                "edl-flash <device_id|smart> <loader> <image> - Flash via EDL",
-                "edl-dump <device_id|smart> <partition> - Dump a partition via EDL",
-                "edl-detect                            - Scan USB for EDL devices",
-                "edl-partitions <device_id|smart> [loader] - Show partition map",
-                "edl-backup <device_id|smart> <partition> - Backup partition via EDL",
-                "edl-restore <device_id|smart> <loader> <image> - Restore partition via EDL",
-                "edl-sparse <to-raw|to-sparse> <source> <dest> - Convert sparse images",
-                "edl-verify <file> [sha256]             - Verify image hash",
-                "edl-unbrick [loader]                   - Show unbrick checklist",
-                "edl-notes [vendor]                     - Show device-specific notes",
-                "edl-reboot <device_id|smart> <target>  - Reboot to target mode",
-                "edl-log                               - Capture EDL workflow logs",
-                "compat-matrix                          - Show EDL compatibility matrix",
-                "testpoint-guide <device_id|smart>      - Show test-point references",
-            ],
-            "Recovery & Root": [
-                "boot-extract <boot.img>                - Extract boot image contents",
-                "magisk-patch <device_id|smart> <boot.img> - Stage Magisk patch workflow",
-                "magisk-pull <device_id|smart> [output_dir] - Pull Magisk patched image",
-                "twrp-verify <device_id|smart> <twrp.img> - Validate TWRP image",
-                "twrp-flash <device_id|smart> <twrp.img> [boot] - Flash/boot TWRP",
-                "root-verify <device_id|smart>          - Verify root access",
-                "safety-check <device_id|smart>         - Run safety checklist",
-                "rollback <device_id|smart> <partition> <image> - Roll back a flash",
-            ],
-            "FRP & Security": [
-                "execute <method> <device_id|smart>     - Execute bypass method",
-                "methods [count]                        - Show top methods",
-            ],
-            "Chipset & Recovery Utilities": [
-                "edl-programmers                       - List available firehose programmers",
-                "edl-profile <list|add|delete>          - Manage EDL profiles",
-                "edl-notes [vendor]                     - Device-specific chipset notes",
-            ],
-            "Discoverability": [
-                "search <keyword>                       - Find commands quickly",
-                "help <command>                         - Show detailed usage",
-                "bootstrap [force]                      - Install bundled platform tools",
-                "menu                                  - Launch interactive menu",
-            ],
-        }
-
-        for title, entries in sections.items():
-            print(f"{title}:")
-            for entry in entries:
-                print(f"  {entry}")
-            print("")
+        lines: List[str] = []
+        for title, entries in _ADVANCED_SECTIONS:
+            lines.append(f"{title}:")
+            lines.extend(f"  {entry}" for entry in entries)
+            lines.append("")
+        _write_lines(lines)
 
         print("🧰 Tooling Status")
-        tool_groups = [
-            ("Android", check_android_tools()),
-            ("Qualcomm", check_qualcomm_tools()),
-            ("MediaTek", check_mediatek_tools()),
-        ]
-        for label, tools in tool_groups:
-            print(f"  {label}:")
-            for tool in tools:
-                if tool.available:
-                    version = tool.version or "available"
-                    if tool.error:
-                        version = f"{version} (version unknown)"
-                    print(f"    - {tool.name}: {version}")
-                else:
-                    message = tool.error.get("message", "missing")
-                    print(f"    - {tool.name}: {message}")
+        self._print_tooling()
         print("")
 
+    def _list_recent(
+        self,
+        title: str,
+        directory: Path,
+        empty: str,
+        suffix: Optional[str] = None,
+        show_kind: bool = True,
+    ) -> None:
+        """Print the newest entries of ``directory`` under a heading."""
+        print(f"\n{title}\n")
+        items = _recent_entries(directory, suffix=suffix)
+        if not items:
+            print(f"  {empty}")
+            return
+        if show_kind:
+            _write_lines(
+                f"  {name} ({'dir' if is_dir else 'file'}, {size:,} bytes)"
+                for name, size, is_dir in items
+            )
+        else:
+            _write_lines(f"  {name} ({size:,} bytes)" for name, size, _ in items)
+
     def _cmd_logs(self) -> None:
         """List recent log files."""
-        print("\n🧾 Recent Logs\n")
-        logs = sorted(Config.LOG_DIR.glob("*.log"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if not logs:
-            print("  No log files found.")
-            return
-        for log in logs[:10]:
-            size = log.stat().st_size
-            print(f"  {log.name} ({size:,} bytes)")
+        self._list_recent(
+            "🧾 Recent Logs", Config.LOG_DIR, "No log files found.", suffix=".log", show_kind=False
+        )
 
     def _cmd_backups(self) -> None:
         """List recent backups."""
-        print("\n💾 Recent Backups\n")
-        items = sorted(Config.BACKUP_DIR.glob("*"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if not items:
-            print("  No backups found.")
-            return
-        for item in items[:10]:
-            size = item.stat().st_size if item.is_file() else 0
-            label = "dir" if item.is_dir() else "file"
-            print(f"  {item.name} ({label}, {size:,} bytes)")
+        self._list_recent("💾 Recent Backups", Config.BACKUP_DIR, "No backups found.")
 
     def _cmd_reports(self) -> None:
         """List recent reports."""
-        print("\n📄 Recent Reports\n")
-        items = sorted(Config.REPORTS_DIR.glob("*"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if not items:
-            print("  No reports found.")
-            return
-        for item in items[:10]:
-            size = item.stat().st_size if item.is_file() else 0
-            label = "dir" if item.is_dir() else "file"
-            print(f"  {item.name} ({label}, {size:,} bytes)")
+        self._list_recent("📄 Recent Reports", Config.REPORTS_DIR, "No reports found.")
 
     def _cmd_exports(self) -> None:
         """List recent exports."""
-        print("\n📦 Recent Exports\n")
-        items = sorted(Config.EXPORTS_DIR.glob("*"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if not items:
-            print("  No exports found.")
-            return
-        for item in items[:10]:
-            size = item.stat().st_size if item.is_file() else 0
-            label = "dir" if item.is_dir() else "file"
-            print(f"  {item.name} ({label}, {size:,} bytes)")
+        self._list_recent("📦 Recent Exports", Config.EXPORTS_DIR, "No exports found.")
 
     def _cmd_devices_json(self) -> None:
         """Export connected devices to JSON."""
-        devices, _ = DeviceDetector.detect_all()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"devices_{timestamp}.json"
-        export_path.write_text(json.dumps(devices, indent=2))
+        devices, _ = self._detect_devices()
+        export_path = self._export_path("devices", "json")
+        _dump_json(export_path, devices)
         print(f"✅ Devices exported: {export_path}")
 
     def _cmd_stats_json(self) -> None:
         """Export database stats to JSON."""
-        stats = db.get_statistics()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"stats_{timestamp}.json"
-        export_path.write_text(json.dumps(stats, indent=2))
+        stats = _cached_statistics()
+        export_path = self._export_path("stats", "json")
+        _dump_json(export_path, stats)
         print(f"✅ Stats exported: {export_path}")
 
     def _cmd_logtail(self, args: List[str]) -> None:
@@ -1691,65 +2534,44 @@ class CLI:
                 print("Usage: logtail [lines]")
                 return
 
-        logs = sorted(Config.LOG_DIR.glob("*.log"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if not logs:
+        flush_logs()
+        log_path = _newest(Config.LOG_DIR, suffix=".log")
+        if log_path is None:
             print("❌ No log files found")
             return
 
-        log_path = logs[0]
         print(f"\n🧾 Tail: {log_path.name} (last {line_count} lines)\n")
-        with log_path.open("r", encoding="utf-8", errors="replace") as handle:
-            recent = deque(handle, maxlen=line_count)
-        for line in recent:
-            print(line.rstrip())
+        _write_lines(line.rstrip() for line in _tail_lines(log_path, line_count))
 
     def _cmd_cleanup_exports(self) -> None:
         """Remove old exports."""
-        cutoff = datetime.now() - timedelta(days=7)
-        removed = 0
-        for item in Config.EXPORTS_DIR.glob("*"):
-            if datetime.fromtimestamp(item.stat().st_mtime) < cutoff:
-                if item.is_dir():
-                    shutil.rmtree(item)
-                else:
-                    item.unlink()
-                removed += 1
+        removed = _cleanup_dir(Config.EXPORTS_DIR, 7)
         print(f"✅ Removed {removed} export(s) older than 7 days")
 
     def _cmd_cleanup_backups(self) -> None:
         """Remove old backups."""
-        cutoff = datetime.now() - timedelta(days=30)
-        removed = 0
-        for item in Config.BACKUP_DIR.glob("*"):
-            if datetime.fromtimestamp(item.stat().st_mtime) < cutoff:
-                if item.is_dir():
-                    shutil.rmtree(item)
-                else:
-                    item.unlink()
-                removed += 1
+        removed = _cleanup_dir(Config.BACKUP_DIR, 30)
         print(f"✅ Removed {removed} backup(s) older than 30 days")
 
     def _cmd_cleanup_reports(self) -> None:
         """Remove old reports."""
-        cutoff = datetime.now() - timedelta(days=30)
-        removed = 0
-        for item in Config.REPORTS_DIR.glob("*"):
-            if datetime.fromtimestamp(item.stat().st_mtime) < cutoff:
-                if item.is_dir():
-                    shutil.rmtree(item)
-                else:
-                    item.unlink()
-                removed += 1
+        removed = _cleanup_dir(Config.REPORTS_DIR, 30)
         print(f"✅ Removed {removed} report(s) older than 30 days")
 
     def _cmd_env(self) -> None:
         """Show environment info."""
-        print("\n🧩 Environment\n")
-        print(f"  User: {getpass.getuser()}")
-        print(f"  Host: {platform.node()}")
-        print(f"  OS: {platform.system()} {platform.release()}")
-        print(f"  Python: {sys.version.split()[0]}")
-        print(f"  CWD: {Path.cwd()}")
+        import getpass
+
+        _write_lines(
+            (
+                "\n🧩 Environment\n",
+                f"  User: {getpass.getuser()}",
+                f"  Host: {platform.node()}",
+                f"  OS: {platform.system()} {platform.release()}",
+                f"  Python: {sys.version.split()[0]}",
+                f"  CWD: {Path.cwd()}",
+            )
+        )
 
     def _cmd_recent_logs(self, args: List[str]) -> None:
         """Show recent log entries."""
@@ -1765,12 +2587,14 @@ class CLI:
             print("❌ No log entries found")
             return
         print("\n🧾 Recent Log Entries\n")
+        lines = []
         for row in rows:
             timestamp = row.get("timestamp", "")
             level = row.get("level", "").upper()
             category = row.get("category", "")
             message = row.get("message", "")
-            print(f"  [{timestamp}] {level} {category}: {message}")
+            lines.append(f"  [{timestamp}] {level} {category}: {message}")
+        _write_lines(lines)
 
     def _cmd_recent_backups(self, args: List[str]) -> None:
         """Show recent backup records."""
@@ -1786,13 +2610,15 @@ class CLI:
             print("❌ No backup records found")
             return
         print("\n💾 Recent Backup Records\n")
+        lines = []
         for row in rows:
             name = row.get("backup_name", "Unknown")
             device_id = row.get("device_id", "Unknown")
             created = row.get("created", "")
             size = row.get("backup_size", 0)
             backup_type = row.get("backup_type", "Unknown")
-            print(f"  {name} ({backup_type}) - {device_id} - {created} - {size:,} bytes")
+            lines.append(f"  {name} ({backup_type}) - {device_id} - {created} - {size:,} bytes")
+        _write_lines(lines)
 
     def _cmd_recent_reports(self, args: List[str]) -> None:
         """Show recent report records."""
@@ -1808,23 +2634,17 @@ class CLI:
             print("❌ No report records found")
             return
         print("\n📄 Recent Report Records\n")
-        for row in rows:
-            timestamp = row.get("timestamp", "")
-            device_id = row.get("device_id", "Unknown")
-            event_data = row.get("event_data", "{}")
-            try:
-                payload = json.loads(event_data)
-            except json.JSONDecodeError:
-                payload = {}
-            report_name = payload.get("report_name", "Unknown")
-            print(f"  {report_name} - {device_id} - {timestamp}")
+        _write_lines(
+            f"  {_report_name(row.get('event_data'))} - {row.get('device_id', 'Unknown')} - "
+            f"{row.get('timestamp', '')}"
+            for row in rows
+        )
 
     def _cmd_logs_json(self) -> None:
         """Export recent logs to JSON."""
         rows = db.get_recent_logs(limit=200)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"logs_{timestamp}.json"
-        export_path.write_text(json.dumps(rows, indent=2))
+        export_path = self._export_path("logs", "json")
+        _dump_json(export_path, rows)
         print(f"✅ Logs exported: {export_path}")
 
     def _cmd_logs_export(self, args: List[str]) -> None:
@@ -1852,10 +2672,10 @@ class CLI:
         }
 
         for item in args[1:]:
-            if "=" not in item:
+            key, sep, value = item.partition("=")
+            if not sep:
                 print("Usage: logs-export <json|csv> [filters...]")
                 return
-            key, value = item.split("=", 1)
             key = key.lstrip("-").lower()
             if key in {"device", "device_id"}:
                 key = "device_id"
@@ -1866,7 +2686,7 @@ class CLI:
                     print("Usage: logs-export <json|csv> [filters...]")
                     return
                 continue
-            if key not in {"level", "category", "device_id", "method", "since", "until"}:
+            if key not in _LOGS_EXPORT_KEYS:
                 print("Usage: logs-export <json|csv> [filters...]")
                 return
             filters[key] = value
@@ -1884,34 +2704,36 @@ class CLI:
             print("❌ No log entries found")
             return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"logs_filtered_{timestamp}.{export_format}"
+        export_path = self._export_path("logs_filtered", export_format)
         if export_format == "json":
-            export_path.write_text(json.dumps(rows, indent=2))
+            _dump_json(export_path, rows)
         else:
+            import csv
+
             fieldnames = ["timestamp", "level", "category", "message", "device_id", "method"]
-            with export_path.open("w", newline="", encoding="utf-8") as handle:
-                writer = csv.DictWriter(handle, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
+            getter = operator.itemgetter(*fieldnames)
+            with export_path.open(
+                "w", buffering=_EXPORT_BUFFER, newline="", encoding="utf-8"
+            ) as handle:
+                writer = csv.writer(handle)
+                writer.writerow(fieldnames)
+                writer.writerows(getter(row) for row in rows)
 
         print(f"✅ Logs exported: {export_path}")
 
     def _cmd_backups_json(self) -> None:
         """Export recent backups to JSON."""
         rows = db.get_recent_backups(limit=200)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"backups_{timestamp}.json"
-        export_path.write_text(json.dumps(rows, indent=2))
+        export_path = self._export_path("backups", "json")
+        _dump_json(export_path, rows)
         print(f"✅ Backups exported: {export_path}")
 
     def _cmd_latest_report(self) -> None:
         """Show latest report paths."""
-        reports = sorted(Config.REPORTS_DIR.glob("*"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if not reports:
+        report_dir = _newest(Config.REPORTS_DIR)
+        if report_dir is None:
             print("❌ No reports found")
             return
-        report_dir = reports[0]
         html_path = report_dir / "report.html"
         json_path = report_dir / "report.json"
         print(f"\n📄 Latest Report: {report_dir.name}\n")
@@ -1934,6 +2756,7 @@ class CLI:
             print("❌ No device records found")
             return
         print("\n📱 Recent Devices\n")
+        lines = []
         for row in rows:
             device_id = row.get("id", "Unknown")
             manufacturer = row.get("manufacturer", "Unknown")
@@ -1941,7 +2764,11 @@ class CLI:
             android = row.get("android_version", "Unknown")
             last_seen = row.get("last_seen", "")
             count = row.get("connection_count", 0)
-            print(f"  {device_id} - {manufacturer} {model} (Android {android}) - last seen {last_seen} ({count}x)")
+            lines.append(
+                f"  {device_id} - {manufacturer} {model} (Android {android}) "
+                f"- last seen {last_seen} ({count}x)"
+            )
+        _write_lines(lines)
 
     def _cmd_methods(self, args: List[str]) -> None:
         """Show top methods by success rate."""
@@ -1957,6 +2784,7 @@ class CLI:
             print("❌ No method records found")
             return
         print("\n🧪 Top Methods\n")
+        lines = []
         for row in rows:
             name = row.get("name", "Unknown")
             success = row.get("success_count", 0)
@@ -1964,83 +2792,78 @@ class CLI:
             avg = row.get("avg_duration", 0)
             last_success = row.get("last_success", "")
             rate = (success / total * 100) if total else 0
-            print(f"  {name}: {rate:.1f}% ({success}/{total}) avg {avg:.2f}s last {last_success}")
+            lines.append(
+                f"  {name}: {rate:.1f}% ({success}/{total}) avg {avg:.2f}s last {last_success}"
+            )
+        _write_lines(lines)
 
     def _cmd_methods_json(self) -> None:
         """Export top methods to JSON."""
         rows = db.get_top_methods(limit=50)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"methods_{timestamp}.json"
-        export_path.write_text(json.dumps(rows, indent=2))
+        export_path = self._export_path("methods", "json")
+        _dump_json(export_path, rows)
         print(f"✅ Methods exported: {export_path}")
 
     def _cmd_db_health(self) -> None:
         """Show database health summary."""
-        stats = db.get_statistics()
-        db_size = Config.DB_PATH.stat().st_size if Config.DB_PATH.exists() else 0
-        print("\n🗄️  Database Health\n")
-        print(f"  Path: {Config.DB_PATH}")
-        print(f"  Size: {db_size:,} bytes")
-        print(f"  Devices: {stats.get('total_devices', 0)}")
-        print(f"  Logs: {stats.get('total_logs', 0)}")
-        print(f"  Backups: {stats.get('total_backups', 0)}")
-        print(f"  Methods: {stats.get('total_methods', 0)}")
-        print(f"  Reports: {stats.get('total_reports', 0)}")
+        db_stat = _db_stat()
+        stats = _cached_statistics(db_stat)
+        db_size = db_stat.st_size if db_stat is not None else 0
+        _write_lines(
+            (
+                "\n🗄️  Database Health\n",
+                f"  Path: {Config.DB_PATH}",
+                f"  Size: {db_size:,} bytes",
+                *_count_lines(stats),
+            )
+        )
 
     def _cmd_stats_plus(self) -> None:
         """Show extended statistics."""
-        stats = db.get_statistics()
-        print("\n📊 VOID EXTENDED STATS\n")
-        print(f"  Devices: {stats.get('total_devices', 0)}")
-        print(f"  Logs: {stats.get('total_logs', 0)}")
-        print(f"  Backups: {stats.get('total_backups', 0)}")
-        print(f"  Methods: {stats.get('total_methods', 0)}")
-        print(f"  Reports: {stats.get('total_reports', 0)}")
+        stats = _cached_statistics()
+        _write_lines(("\n📊 VOID EXTENDED STATS\n", *_count_lines(stats)))
 
     def _cmd_reports_json(self) -> None:
         """Export report records to JSON."""
         rows = db.get_recent_reports(limit=200)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"reports_{timestamp}.json"
-        export_path.write_text(json.dumps(rows, indent=2))
+        export_path = self._export_path("reports", "json")
+        _dump_json(export_path, rows)
         print(f"✅ Reports exported: {export_path}")
 
     def _cmd_reports_open(self) -> None:
         """Open reports directory."""
-        target = str(Config.REPORTS_DIR)
-        if platform.system() == "Darwin":
-            SafeSubprocess.run(["open", target])
-        elif platform.system() == "Windows":
-            SafeSubprocess.run(["explorer", target])
-        else:
-            SafeSubprocess.run(["xdg-open", target])
+        SafeSubprocess.run([_OPEN_CMD, str(Config.REPORTS_DIR)])
         print(f"✅ Opened: {Config.REPORTS_DIR}")
 
     def _cmd_recent_reports_json(self) -> None:
         """Export recent report records to JSON."""
         rows = db.get_recent_reports(limit=50)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"recent_reports_{timestamp}.json"
-        export_path.write_text(json.dumps(rows, indent=2))
+        export_path = self._export_path("recent_reports", "json")
+        _dump_json(export_path, rows)
         print(f"✅ Recent reports exported: {export_path}")
 
     def _cmd_config(self) -> None:
         """Show configuration values."""
-        print("\n⚙️  Configuration\n")
-        print(f"  Version: {Config.VERSION}")
-        print(f"  Codename: {Config.CODENAME}")
-        print(f"  App Name: {Config.APP_NAME}")
-        print(f"  Timeouts: short={Config.TIMEOUT_SHORT}s medium={Config.TIMEOUT_MEDIUM}s long={Config.TIMEOUT_LONG}s")
-        print(f"  Auto Backup: {Config.ENABLE_AUTO_BACKUP}")
-        print(f"  Monitoring: {Config.ENABLE_MONITORING}")
-        print(f"  Analytics: {Config.ENABLE_ANALYTICS}")
-        print(f"  Smart Mode: {Config.SMART_ENABLED}")
-        print(f"    Smart Auto Device: {Config.SMART_AUTO_DEVICE}")
-        print(f"    Smart Prefer Last Device: {Config.SMART_PREFER_LAST_DEVICE}")
-        print(f"    Smart Auto Doctor: {Config.SMART_AUTO_DOCTOR}")
-        print(f"    Smart Suggestions: {Config.SMART_SUGGESTIONS}")
-        print(f"    Smart Safe Guards: {Config.SMART_SAFE_GUARDS}")
-        print(f"  Allow Insecure Crypto: {Config.ALLOW_INSECURE_CRYPTO}")
+        _write_lines(
+            (
+                "\n⚙️  Configuration\n",
+                f"  Version: {Config.VERSION}",
+                f"  Codename: {Config.CODENAME}",
+                f"  App Name: {Config.APP_NAME}",
+                f"  Timeouts: short={Config.TIMEOUT_SHORT}s medium={Config.TIMEOUT_MEDIUM}s "
+                f"long={Config.TIMEOUT_LONG}s",
+                f"  Auto Backup: {Config.ENABLE_AUTO_BACKUP}",
+                f"  Monitoring: {Config.ENABLE_MONITORING}",
+                f"  Analytics: {Config.ENABLE_ANALYTICS}",
+                f"  Smart Mode: {Config.SMART_ENABLED}",
+                f"    Smart Auto Device: {Config.SMART_AUTO_DEVICE}",
+                f"    Smart Prefer Last Device: {Config.SMART_PREFER_LAST_DEVICE}",
+                f"    Smart Auto Doctor: {Config.SMART_AUTO_DOCTOR}",
+                f"    Smart Suggestions: {Config.SMART_SUGGESTIONS}",
+                f"    Smart Safe Guards: {Config.SMART_SAFE_GUARDS}",
+                f"  Allow Insecure Crypto: {Config.ALLOW_INSECURE_CRYPTO}",
+            )
+        )
 
     def _cmd_config_json(self) -> None:
         """Export configuration to JSON."""
@@ -2053,17 +2876,7 @@ class CLI:
                 "medium": Config.TIMEOUT_MEDIUM,
                 "long": Config.TIMEOUT_LONG,
             },
-            "paths": {
-                "base": str(Config.BASE_DIR),
-                "db": str(Config.DB_PATH),
-                "logs": str(Config.LOG_DIR),
-                "backups": str(Config.BACKUP_DIR),
-                "exports": str(Config.EXPORTS_DIR),
-                "cache": str(Config.CACHE_DIR),
-                "reports": str(Config.REPORTS_DIR),
-                "monitor": str(Config.MONITOR_DIR),
-                "scripts": str(Config.SCRIPTS_DIR),
-            },
+            "paths": {key: str(getattr(Config, attr)) for key, attr in _CONFIG_PATH_KEYS},
             "features": {
                 "auto_backup": Config.ENABLE_AUTO_BACKUP,
                 "monitoring": Config.ENABLE_MONITORING,
@@ -2082,9 +2895,8 @@ class CLI:
                 "allow_insecure_crypto": Config.ALLOW_INSECURE_CRYPTO,
             },
         }
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_path = Config.EXPORTS_DIR / f"config_{timestamp}.json"
-        export_path.write_text(json.dumps(payload, indent=2))
+        export_path = self._export_path("config", "json")
+        _dump_json(export_path, payload)
         print(f"✅ Config exported: {export_path}")
 
     def _cmd_smart(self, args: List[str]) -> None:
@@ -2177,13 +2989,7 @@ class CLI:
 
     def _cmd_exports_open(self) -> None:
         """Open exports directory."""
-        target = str(Config.EXPORTS_DIR)
-        if platform.system() == "Darwin":
-            SafeSubprocess.run(["open", target])
-        elif platform.system() == "Windows":
-            SafeSubprocess.run(["explorer", target])
-        else:
-            SafeSubprocess.run(["xdg-open", target])
+        SafeSubprocess.run([_OPEN_CMD, str(Config.EXPORTS_DIR)])
         print(f"✅ Opened: {Config.EXPORTS_DIR}")
 
     def _cmd_db_backup(self) -> None:
@@ -2191,9 +2997,8 @@ class CLI:
         if not Config.DB_PATH.exists():
             print("❌ Database file not found")
             return
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = Config.EXPORTS_DIR / f"void_db_{timestamp}.db"
-        shutil.copy2(Config.DB_PATH, backup_path)
+        backup_path = self._export_path("void_db", "db")
+        copy_file(Config.DB_PATH, backup_path)
         print(f"✅ Database backup created: {backup_path}")
 
     def _cmd_analyze(self, args: List[str]) -> None:
@@ -2223,7 +3028,9 @@ class CLI:
                 print("Usage: recover <device_id|smart> <contacts|sms>")
                 return
         else:
-            device_id = self._resolve_device_id([args[0]], "recover <device_id|smart> <contacts|sms>")
+            device_id = self._resolve_device_id_str(
+                args[0], "recover <device_id|smart> <contacts|sms>"
+            )
             if not device_id:
                 return
             data_type = args[1]
@@ -2249,7 +3056,9 @@ class CLI:
         if len(args) < 2:
             print("Usage: tweak <device_id|smart> <dpi|animation|timeout> <value>")
             return
-        device_id = self._resolve_device_id([args[0]], "tweak <device_id|smart> <dpi|animation|timeout> <value>")
+        device_id = self._resolve_device_id_str(
+            args[0], "tweak <device_id|smart> <dpi|animation|timeout> <value>"
+        )
         if not device_id:
             return
         if len(args) < 3:
@@ -2257,25 +3066,26 @@ class CLI:
             return
         tweak_type, value = args[1], args[2]
 
-        if tweak_type == 'dpi':
-            success = SystemTweaker.set_dpi(device_id, int(value))
-        elif tweak_type == 'animation':
-            success = SystemTweaker.set_animation_scale(device_id, float(value))
-        elif tweak_type == 'timeout':
-            success = SystemTweaker.set_screen_timeout(device_id, int(value))
-        else:
+        tweak = _TWEAKS.get(tweak_type)
+        if tweak is None:
             print("❌ Unknown tweak type")
             return
+        setter, parse, label = tweak
+        try:
+            parsed = parse(value)
+        except ValueError:
+            raise CLIUsageError(f"Invalid {tweak_type} value: {value}") from None
+        success = getattr(SystemTweaker, setter)(device_id, parsed)
 
         if success:
-            print(f"✅ {tweak_type.title()} updated")
+            print(f"✅ {label} updated")
         else:
             print("❌ Tweak failed")
 
     def _cmd_usb_debug(self, args: List[str]) -> None:
         """Enable or force USB debugging."""
         # Check for help/info flag
-        if len(args) > 0 and args[0].lower() in {'--help', '-h', 'help', 'methods', 'info'}:
+        if len(args) > 0 and args[0].lower() in _USB_DEBUG_INFO_FLAGS:
             methods_info = SystemTweaker.get_usb_debugging_methods()
             print("\n📱 USB Debugging Force-Enable Methods")
             print("=" * 70)
@@ -2312,18 +3122,16 @@ class CLI:
         
         if len(args) > 1:
             potential_method = args[1].lower()
-            if potential_method in ['all', 'standard', 'properties', 'settings_db', 
-                                   'build_prop', 'adb_keys', 'recovery', 'root']:
+            if potential_method in _USB_DEBUG_METHODS:
                 method = potential_method
-                if len(args) > 2 and args[2].lower() in {'force', '--force', '-f'}:
+                if len(args) > 2 and args[2].lower() in _FORCE_FLAGS:
                     force_confirm = True
-            elif potential_method in {'force', '--force', '-f'}:
+            elif potential_method in _FORCE_FLAGS:
                 method = 'all'
                 force_confirm = True
 
         # Require confirmation for risky methods
-        risky_methods = ['all', 'settings_db', 'build_prop', 'adb_keys', 'root']
-        if method in risky_methods:
+        if method in _USB_DEBUG_RISKY_METHODS:
             if not force_confirm or not self._smart_confirm(
                 f"Use method '{method}' on {device_id}? (May require root/modify system)"
             ):
@@ -2337,24 +3145,27 @@ class CLI:
         if method != 'standard':
             result = SystemTweaker.force_usb_debugging(device_id, method)
         else:
+            # Skip the second adb round-trip when developer options could not be enabled.
+            dev_options = SystemTweaker.enable_developer_options(device_id)
+            usb_setting = SystemTweaker.enable_usb_debugging(device_id) if dev_options else False
             result = {
                 "steps": [
                     {
                         "step": "enable_developer_options",
                         "category": "standard",
-                        "success": SystemTweaker.enable_developer_options(device_id),
+                        "success": dev_options,
                         "detail": None,
                     },
                     {
                         "step": "enable_usb_debugging_setting",
                         "category": "standard",
-                        "success": SystemTweaker.enable_usb_debugging(device_id),
-                        "detail": None,
+                        "success": usb_setting,
+                        "detail": None if dev_options else "Skipped: developer options not enabled",
                     },
                 ],
                 "methods_attempted": method,
+                "success": bool(dev_options and usb_setting),
             }
-            result["success"] = all(step["success"] for step in result["steps"])
             result["adb_enabled"] = result["success"]
             result["usb_config"] = None
             result["has_root"] = False
@@ -2417,15 +3228,16 @@ class CLI:
             return
         partitions = result.get("partitions", [])
         print(f"📦 Partitions for {device_id} ({len(partitions)}):")
-        for name in partitions:
-            print(f"  • {name}")
+        _write_lines(f"  • {name}" for name in partitions)
 
     def _cmd_partition_backup(self, args: List[str]) -> None:
         """Backup a partition via ADB."""
         if len(args) < 2:
             print("Usage: partition-backup <device_id|smart> <partition> [output_dir]")
             return
-        device_id = self._resolve_device_id([args[0]], "partition-backup <device_id|smart> <partition> [output_dir]")
+        device_id = self._resolve_device_id_str(
+            args[0], "partition-backup <device_id|smart> <partition> [output_dir]"
+        )
         if not device_id:
             return
         partition = args[1]
@@ -2441,14 +3253,16 @@ class CLI:
         else:
             print(f"❌ Backup failed: {result.get('message')}")
         if result.get("steps"):
-            print(json.dumps(result["steps"], indent=2))
+            print(_json_text(result["steps"]))
 
     def _cmd_partition_wipe(self, args: List[str]) -> None:
         """Wipe a partition via ADB or fastboot."""
         if len(args) < 2:
             print("Usage: partition-wipe <device_id|smart> <partition>")
             return
-        device_id = self._resolve_device_id([args[0]], "partition-wipe <device_id|smart> <partition>")
+        device_id = self._resolve_device_id_str(
+            args[0], "partition-wipe <device_id|smart> <partition>"
+        )
         if not device_id:
             return
         partition = args[1]
@@ -2470,7 +3284,7 @@ class CLI:
             print("Usage: repair-flow <device_id|smart> [--report]")
             return
 
-        device_id = self._resolve_device_id([args[0]], "repair-flow <device_id|smart> [--report]")
+        device_id = self._resolve_device_id_str(args[0], "repair-flow <device_id|smart> [--report]")
         if not device_id:
             return
 
@@ -2495,28 +3309,38 @@ class CLI:
             save_report=save_report,
         )
         result = workflow.run()
-        print(json.dumps(result, indent=2, default=str))
+        print(_json_text(result, default=str))
 
     def _cmd_stats(self) -> None:
         """Show statistics."""
-        stats = db.get_statistics()
-
-        print("\n📊 VOID STATISTICS\n")
-        print(f"  Total Devices: {stats['total_devices']}")
-        print(f"  Total Logs: {stats['total_logs']}")
-        print(f"  Total Backups: {stats['total_backups']}")
-        print(f"  Methods Tracked: {stats['total_methods']}")
-        print(f"  Reports Tracked: {stats.get('total_reports', 0)}")
+        stats = _cached_statistics()
+
+        lines = [
+            "\n📊 VOID STATISTICS\n",
+            f"  Total Devices: {stats['total_devices']}",
+            f"  Total Logs: {stats['total_logs']}",
+            f"  Total Backups: {stats['total_backups']}",
+            f"  Methods Tracked: {stats['total_methods']}",
+            f"  Reports Tracked: {stats.get('total_reports', 0)}",
+        ]
 
         if stats.get('top_methods'):
-            print("\n  Top Methods:")
-            for method in stats['top_methods']:
-                rate = (method['success_count'] / method['total_count'] * 100) if method['total_count'] > 0 else 0
-                print(f"    • {method['name']}: {rate:.1f}% ({method['success_count']}/{method['total_count']})")
+            lines.append("\n  Top Methods:")
+            lines.extend(
+                f"    • {method['name']}: {_success_rate(method):.1f}% "
+                f"({method['success_count']}/{method['total_count']})"
+                for method in stats['top_methods']
+            )
+        _write_lines(lines)
 
     def _cmd_monitor(self) -> None:
         """Show system monitor."""
-        stats = monitor.get_stats()
+        # Without a running sampler psutil has no earlier reading to diff against, so take
+        # a short blocking sample instead of reporting ~0% CPU.
+        fresh = not monitor.monitoring
+        if self._start_monitor:
+            monitor.start()
+        stats = monitor.get_stats(interval=_CPU_SAMPLE_INTERVAL if fresh else None)
 
         if stats:
             print("\n🖥️  SYSTEM MONITOR\n")
@@ -2536,14 +3360,17 @@ class CLI:
         print("📜 Starting logcat (Ctrl+C to stop)...")
         self.logcat.start(device_id, filter_tag)
 
+        # Each read returns everything the pipe holds, so a burst goes out in one write.
         try:
             while True:
-                line = self.logcat.read_line()
-                if line:
-                    print(line.strip())
+                lines = self.logcat.read_lines()
+                if lines is None:
+                    break
+                _write_lines(line.strip() for line in lines)
         except KeyboardInterrupt:
-            self.logcat.stop()
-            print("\n📜 Logcat stopped")
+            pass
+        self.logcat.stop()
+        print("\n📜 Logcat stopped")
 
     def _cmd_execute(self, args: List[str]) -> None:
         """Execute FRP method."""
@@ -2552,7 +3379,7 @@ class CLI:
             return
 
         method_name = args[0]
-        device_id = self._resolve_device_id([args[1]], "execute <method> <device_id|smart>")
+        device_id = self._resolve_device_id_str(args[1], "execute <method> <device_id|smart>")
         if not device_id:
             return
         if not self._smart_confirm(f"Run method '{method_name}' on {device_id}?"):
@@ -2578,77 +3405,98 @@ class CLI:
             print("Usage: files <device_id|smart> <list|pull|push|delete> [path]")
             return
 
-        device_id = self._resolve_device_id([args[0]], "files <device_id|smart> <list|pull|push|delete> [path]")
+        device_id = self._resolve_device_id_str(
+            args[0], "files <device_id|smart> <list|pull|push|delete> [path]"
+        )
         if not device_id:
             return
-        operation = args[1]
+        handler_name = _FILES_OPS.get(args[1])
+        if handler_name is None:
+            print("❌ Unknown operation")
+            return
+        getattr(self, handler_name)(device_id, args)
 
-        if operation == 'list':
-            path = args[2] if len(args) > 2 else '/sdcard'
-            files = FileManager.list_files(device_id, path)
+    def _files_list(self, device_id: str, args: List[str]) -> None:
+        path = args[2] if len(args) > 2 else '/sdcard'
+        first, remaining = FileManager.list_head(device_id, path, 20)
 
-            print(f"\n📁 Files in {path}:\n")
-            for file in files[:20]:
-                print(f"  {file['permissions']} {file['size']:>10} {file['date']:>20} {file['name']}")
+        print(f"\n📁 Files in {path}:\n")
+        _write_lines(
+            f"  {file['permissions']} {file['size']:>10} {file['date']:>20} {file['name']}"
+            for file in first
+        )
 
-            if len(files) > 20:
-                print(f"\n  ... and {len(files) - 20} more")
+        if remaining:
+            print(f"\n  ... and {remaining} more")
 
-        elif operation == 'pull':
-            if len(args) < 3:
-                print("Usage: files <device_id|smart> pull <remote_path> [local_path]")
-                return
+    def _files_pull(self, device_id: str, args: List[str]) -> None:
+        if len(args) < 3:
+            print("Usage: files <device_id|smart> pull <remote_path> [local_path]")
+            return
 
-            local_path = Path(args[3]) if len(args) > 3 else None
-            result = FileManager.pull_file(device_id, args[2], local_path)
-            if result['success']:
-                print(f"✅ File pulled: {result['path']}")
-            else:
-                print("❌ Pull failed")
-        elif operation == 'push':
-            if len(args) < 4:
-                print("Usage: files <device_id|smart> push <local_path> <remote_path>")
-                return
+        local_path = Path(args[3]) if len(args) > 3 else None
+        result = FileManager.pull_file(device_id, args[2], local_path)
+        if result['success']:
+            print(f"✅ File pulled: {result['path']}")
+        else:
+            print("❌ Pull failed")
 
-            result = FileManager.push_file(device_id, Path(args[2]), args[3])
-            if result:
-                print("✅ File pushed")
-            else:
-                print("❌ Push failed")
-        elif operation == 'delete':
-            if len(args) < 3:
-                print("Usage: files <device_id|smart> delete <remote_path>")
-                return
+    def _files_push(self, device_id: str, args: List[str]) -> None:
+        if len(args) < 4:
+            print("Usage: files <device_id|smart> push <local_path> <remote_path>")
+            return
 
-            if not self._smart_confirm(f"Delete remote file {args[2]} on {device_id}?"):
-                print("⚠️  Action cancelled.")
-                return
-            result = FileManager.delete_file(device_id, args[2])
-            if result:
-                print("✅ File deleted")
-            else:
-                print("❌ Delete failed")
+        result = FileManager.push_file(device_id, Path(args[2]), args[3])
+        if result:
+            print("✅ File pushed")
+        else:
+            print("❌ Push failed")
+
+    def _files_delete(self, device_id: str, args: List[str]) -> None:
+        if len(args) < 3:
+            print("Usage: files <device_id|smart> delete <remote_path>")
+            return
 
+        if not self._smart_confirm(f"Delete remote file {args[2]} on {device_id}?"):
+            print("⚠️  Action cancelled.")
+            return
+        result = FileManager.delete_file(device_id, args[2])
+        if result:
+            print("✅ File deleted")
         else:
-            print("❌ Unknown operation")
+            print("❌ Delete failed")
+
+    def _detect_devices(self) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Return detected devices and their lookup index, reusing the last scan briefly.
 
-    def _resolve_device_context(self, device_id: str) -> tuple[dict[str, str], Dict[str, Any] | None]:
+        The index maps each device's ``id``, ``usb_id`` and ``usb-``-stripped id to
+        the device; the first device to claim a key wins, as in a linear scan.
+        """
+        now = time.monotonic()
+        if self._detect_cache is not None and now - self._detect_cache[0] < _DETECT_TTL:
+            return self._detect_cache[1], self._detect_cache[2]
         devices, _ = DeviceDetector.detect_all()
-        device = None
+        index: Dict[str, Dict[str, Any]] = {}
         for item in devices:
-            if item.get("id") == device_id:
-                device = item
-                break
-            if item.get("usb_id") == device_id:
-                device = item
-                break
+            for key in (item.get("id"), item.get("usb_id")):
+                if key is not None:
+                    index.setdefault(key, item)
             usb_id = str(item.get("id", ""))
-            if usb_id.startswith("usb-") and usb_id.replace("usb-", "") == device_id:
-                device = item
-                break
+            if usb_id.startswith("usb-"):
+                index.setdefault(usb_id.replace("usb-", ""), item)
+        self._detect_cache = (now, devices, index)
+        return devices, index
+
+    def invalidate_device_cache(self) -> None:
+        """Drop the cached device scan after a command changes device state."""
+        self._detect_cache = None
+
+    def _resolve_device_context(self, device_id: str) -> tuple[Mapping[str, str], Dict[str, Any] | None]:
+        _, index = self._detect_devices()
+        device = index.get(device_id)
 
         if device:
-            context = {key: str(value) for key, value in device.items()}
+            context: Mapping[str, str] = _StrView(device)
         else:
             context = {"id": device_id, "mode": "unknown"}
         return context, device
@@ -2696,6 +3544,7 @@ class CLI:
             return
         context, _ = self._resolve_device_context(device_id)
         result = enter_chipset_mode(context, "edl")
+        self.invalidate_device_cache()
 
         if result.success:
             print(f"✅ {result.message}")
@@ -2719,7 +3568,9 @@ class CLI:
                 "[--override=<chipset>] [--auth-token=<token>] [--ownership=<proof>]"
             )
             return
-        device_id = self._resolve_device_id([args[0]], "mode-enter <device_id|smart> <target_mode>")
+        device_id = self._resolve_device_id_str(
+            args[0], "mode-enter <device_id|smart> <target_mode>"
+        )
         if not device_id:
             return
         target_mode = args[1]
@@ -2742,6 +3593,7 @@ class CLI:
             authorization_token,
             ownership_verification,
         )
+        self.invalidate_device_cache()
 
         if result.success:
             print(f"✅ {result.message}")
@@ -2765,11 +3617,15 @@ class CLI:
 
     def _cmd_edl_flash(self, args: List[str]) -> None:
         """Flash an image via EDL."""
+        from .core.edl import edl_flash
+
         if len(args) < 3:
             print("Usage: edl-flash <device_id|smart> <loader> <image>")
             return
 
-        device_id = self._resolve_device_id([args[0]], "edl-flash <device_id|smart> <loader> <image>")
+        device_id = self._resolve_device_id_str(
+            args[0], "edl-flash <device_id|smart> <loader> <image>"
+        )
         if not device_id:
             return
         loader, image = args[1], args[2]
@@ -2805,6 +3661,7 @@ class CLI:
 
         context, _ = self._resolve_device_context(device_id)
         result = edl_flash(context, str(loader_path), str(image_path))
+        self.invalidate_device_cache()
 
         if result.success:
             print(f"✅ {result.message}")
@@ -2824,11 +3681,13 @@ class CLI:
 
     def _cmd_edl_dump(self, args: List[str]) -> None:
         """Dump a partition via EDL when supported."""
+        from .core.edl import edl_dump
+
         if len(args) < 2:
             print("Usage: edl-dump <device_id|smart> <partition>")
             return
 
-        device_id = self._resolve_device_id([args[0]], "edl-dump <device_id|smart> <partition>")
+        device_id = self._resolve_device_id_str(args[0], "edl-dump <device_id|smart> <partition>")
         if not device_id:
             return
         partition = args[1]
@@ -2853,20 +3712,28 @@ class CLI:
 
     def _cmd_edl_detect(self) -> None:
         """Detect EDL devices using USB scanning."""
+        from .core.edl_toolkit import detect_edl_devices
+
         result = detect_edl_devices()
         self._print_toolkit_result(result)
 
     def _cmd_edl_programmers(self) -> None:
         """List firehose programmers."""
+        from .core.edl_toolkit import list_firehose_programmers
+
         result = list_firehose_programmers()
         self._print_toolkit_result(result)
 
     def _cmd_edl_partitions(self, args: List[str]) -> None:
         """List partition map via ADB or EDL tooling."""
+        from .core.edl_toolkit import list_partitions_via_adb, read_partition_table
+
         if len(args) < 1:
             print("Usage: edl-partitions <device_id|smart> [loader]")
             return
-        device_id = self._resolve_device_id([args[0]], "edl-partitions <device_id|smart> [loader]")
+        device_id = self._resolve_device_id_str(
+            args[0], "edl-partitions <device_id|smart> [loader]"
+        )
         if not device_id:
             return
         loader = args[1] if len(args) > 1 else None
@@ -2879,10 +3746,12 @@ class CLI:
 
     def _cmd_edl_backup(self, args: List[str]) -> None:
         """Backup a partition via EDL."""
+        from .core.edl_toolkit import backup_partition
+
         if len(args) < 2:
             print("Usage: edl-backup <device_id|smart> <partition>")
             return
-        device_id = self._resolve_device_id([args[0]], "edl-backup <device_id|smart> <partition>")
+        device_id = self._resolve_device_id_str(args[0], "edl-backup <device_id|smart> <partition>")
         if not device_id:
             return
         partition = args[1]
@@ -2891,10 +3760,14 @@ class CLI:
 
     def _cmd_edl_restore(self, args: List[str]) -> None:
         """Restore a partition via EDL."""
+        from .core.edl_toolkit import restore_partition
+
         if len(args) < 3:
             print("Usage: edl-restore <device_id|smart> <loader> <image>")
             return
-        device_id = self._resolve_device_id([args[0]], "edl-restore <device_id|smart> <loader> <image>")
+        device_id = self._resolve_device_id_str(
+            args[0], "edl-restore <device_id|smart> <loader> <image>"
+        )
         if not device_id:
             return
         loader = args[1]
@@ -2904,12 +3777,16 @@ class CLI:
 
     def _cmd_edl_sparse(self, args: List[str]) -> None:
         """Convert sparse images."""
+        from .core.edl_toolkit import convert_sparse_image
+
         if len(args) < 3:
             print("Usage: edl-sparse <to-raw|to-sparse> <source> <dest>")
             return
-        direction = args[0].lower()
-        to_sparse = direction == "to-sparse"
-        if direction not in {"to-raw", "to-sparse"}:
+        direction = args[0]
+        to_sparse = _SPARSE_DIRECTIONS.get(direction)
+        if to_sparse is None:
+            to_sparse = _SPARSE_DIRECTIONS.get(direction.lower())
+        if to_sparse is None:
             print("Usage: edl-sparse <to-raw|to-sparse> <source> <dest>")
             return
         result = convert_sparse_image(Path(args[1]), Path(args[2]), to_sparse)
@@ -2917,37 +3794,52 @@ class CLI:
 
     def _cmd_edl_profile(self, args: List[str]) -> None:
         """Manage EDL profiles."""
-        if not args:
+        handler_name = None
+        if args:
+            handler_name = _EDL_PROFILE_OPS.get(args[0]) or _EDL_PROFILE_OPS.get(args[0].lower())
+        if handler_name is None or not getattr(self, handler_name)(args):
             print("Usage: edl-profile <list|add|delete> [name] [json]")
-            return
-        action = args[0].lower()
-        if action == "list":
-            profiles = load_profiles()
-            result = ToolkitResult(
-                success=True,
-                message="EDL profiles loaded.",
-                data={"profiles": profiles},
-            )
-            self._print_toolkit_result(result)
-            return
-        if action == "add" and len(args) >= 3:
-            name = args[1]
-            try:
-                profile = json.loads(" ".join(args[2:]))
-            except json.JSONDecodeError:
-                print("Profile data must be valid JSON.")
-                return
-            result = save_profile(name, profile)
-            self._print_toolkit_result(result)
-            return
-        if action == "delete" and len(args) == 2:
-            result = delete_profile(args[1])
-            self._print_toolkit_result(result)
-            return
-        print("Usage: edl-profile <list|add|delete> [name] [json]")
+
+    def _edl_profile_list(self, args: List[str]) -> bool:
+        from .core.edl_toolkit import ToolkitResult, load_profiles
+
+        profiles = load_profiles()
+        result = ToolkitResult(
+            success=True,
+            message="EDL profiles loaded.",
+            data={"profiles": profiles},
+        )
+        self._print_toolkit_result(result)
+        return True
+
+    def _edl_profile_add(self, args: List[str]) -> bool:
+        from .core.edl_toolkit import save_profile
+
+        if len(args) < 3:
+            return False
+        name = args[1]
+        try:
+            profile = _json_loads(" ".join(args[2:]))
+        except json.JSONDecodeError:
+            print("Profile data must be valid JSON.")
+            return True
+        result = save_profile(name, profile)
+        self._print_toolkit_result(result)
+        return True
+
+    def _edl_profile_delete(self, args: List[str]) -> bool:
+        from .core.edl_toolkit import delete_profile
+
+        if len(args) != 2:
+            return False
+        result = delete_profile(args[1])
+        self._print_toolkit_result(result)
+        return True
 
     def _cmd_edl_verify(self, args: List[str]) -> None:
         """Verify image hash."""
+        from .core.edl_toolkit import verify_hash
+
         if len(args) < 1:
             print("Usage: edl-verify <file> [sha256]")
             return
@@ -2957,35 +3849,46 @@ class CLI:
 
     def _cmd_edl_unbrick(self, args: List[str]) -> None:
         """Generate an unbrick checklist."""
+        from .core.edl_toolkit import edl_unbrick_plan
+
         loader = args[0] if args else None
         result = edl_unbrick_plan(loader)
         self._print_toolkit_result(result)
 
     def _cmd_edl_notes(self, args: List[str]) -> None:
         """Show device-specific notes."""
+        from .core.edl_toolkit import device_notes
+
         vendor = args[0] if args else None
         result = device_notes(vendor)
         self._print_toolkit_result(result)
 
     def _cmd_edl_reboot(self, args: List[str]) -> None:
         """Reboot to a target mode."""
+        from .core.edl_toolkit import reboot_device
+
         if len(args) < 2:
             print("Usage: edl-reboot <device_id|smart> <edl|fastboot|recovery|bootloader|system>")
             return
-        device_id = self._resolve_device_id([args[0]], "edl-reboot <device_id|smart> <target>")
+        device_id = self._resolve_device_id_str(args[0], "edl-reboot <device_id|smart> <target>")
         if not device_id:
             return
         target = args[1]
         result = reboot_device(device_id, target)
+        self.invalidate_device_cache()
         self._print_toolkit_result(result)
 
     def _cmd_edl_log(self) -> None:
         """Capture EDL log artifacts."""
+        from .core.edl_toolkit import capture_edl_log
+
         result = capture_edl_log()
         self._print_toolkit_result(result)
 
     def _cmd_boot_extract(self, args: List[str]) -> None:
         """Extract boot image contents."""
+        from .core.edl_toolkit import extract_boot_image
+
         if len(args) < 1:
             print("Usage: boot-extract <boot.img>")
             return
@@ -2994,10 +3897,14 @@ class CLI:
 
     def _cmd_magisk_patch(self, args: List[str]) -> None:
         """Stage a Magisk patch workflow."""
+        from .core.edl_toolkit import stage_magisk_patch
+
         if len(args) < 2:
             print("Usage: magisk-patch <device_id|smart> <boot.img>")
             return
-        device_id = self._resolve_device_id([args[0]], "magisk-patch <device_id|smart> <boot.img>")
+        device_id = self._resolve_device_id_str(
+            args[0], "magisk-patch <device_id|smart> <boot.img>"
+        )
         if not device_id:
             return
         result = stage_magisk_patch(device_id, Path(args[1]))
@@ -3005,10 +3912,14 @@ class CLI:
 
     def _cmd_magisk_pull(self, args: List[str]) -> None:
         """Pull Magisk patched image."""
+        from .core.edl_toolkit import pull_magisk_patched
+
         if len(args) < 1:
             print("Usage: magisk-pull <device_id|smart> [output_dir]")
             return
-        device_id = self._resolve_device_id([args[0]], "magisk-pull <device_id|smart> [output_dir]")
+        device_id = self._resolve_device_id_str(
+            args[0], "magisk-pull <device_id|smart> [output_dir]"
+        )
         if not device_id:
             return
         output_dir = Path(args[1]) if len(args) > 1 else Config.EXPORTS_DIR
@@ -3017,10 +3928,12 @@ class CLI:
 
     def _cmd_twrp_verify(self, args: List[str]) -> None:
         """Verify a TWRP image matches device codename."""
+        from .core.edl_toolkit import verify_twrp_image
+
         if len(args) < 2:
             print("Usage: twrp-verify <device_id|smart> <twrp.img>")
             return
-        device_id = self._resolve_device_id([args[0]], "twrp-verify <device_id|smart> <twrp.img>")
+        device_id = self._resolve_device_id_str(args[0], "twrp-verify <device_id|smart> <twrp.img>")
         if not device_id:
             return
         result = verify_twrp_image(device_id, Path(args[1]))
@@ -3028,10 +3941,12 @@ class CLI:
 
     def _cmd_twrp_flash(self, args: List[str]) -> None:
         """Flash or boot TWRP recovery via fastboot."""
+        from .core.edl_toolkit import flash_recovery
+
         if len(args) < 2:
             print("Usage: twrp-flash <device_id|smart> <twrp.img> [boot]")
             return
-        device_id = self._resolve_device_id([args[0]], "twrp-flash <device_id|smart> <twrp.img>")
+        device_id = self._resolve_device_id_str(args[0], "twrp-flash <device_id|smart> <twrp.img>")
         if not device_id:
             return
         boot_only = len(args) > 2 and args[2].lower() == "boot"
@@ -3040,10 +3955,12 @@ class CLI:
 
     def _cmd_root_verify(self, args: List[str]) -> None:
         """Verify root access via ADB."""
+        from .core.edl_toolkit import verify_root
+
         if len(args) < 1:
             print("Usage: root-verify <device_id|smart>")
             return
-        device_id = self._resolve_device_id([args[0]], "root-verify <device_id|smart>")
+        device_id = self._resolve_device_id_str(args[0], "root-verify <device_id|smart>")
         if not device_id:
             return
         result = verify_root(device_id)
@@ -3051,10 +3968,12 @@ class CLI:
 
     def _cmd_safety_check(self, args: List[str]) -> None:
         """Run safety checklist for device operations."""
+        from .core.edl_toolkit import safety_check
+
         if len(args) < 1:
             print("Usage: safety-check <device_id|smart>")
             return
-        device_id = self._resolve_device_id([args[0]], "safety-check <device_id|smart>")
+        device_id = self._resolve_device_id_str(args[0], "safety-check <device_id|smart>")
         if not device_id:
             return
         result = safety_check(device_id)
@@ -3062,10 +3981,14 @@ class CLI:
 
     def _cmd_rollback(self, args: List[str]) -> None:
         """Rollback a partition flash."""
+        from .core.edl_toolkit import rollback_flash
+
         if len(args) < 3:
             print("Usage: rollback <device_id|smart> <partition> <image>")
             return
-        device_id = self._resolve_device_id([args[0]], "rollback <device_id|smart> <partition> <image>")
+        device_id = self._resolve_device_id_str(
+            args[0], "rollback <device_id|smart> <partition> <image>"
+        )
         if not device_id:
             return
         result = rollback_flash(device_id, args[1], Path(args[2]))
@@ -3073,6 +3996,8 @@ class CLI:
 
     def _cmd_compat_matrix(self) -> None:
         """Show compatibility matrix."""
+        from .core.edl_toolkit import compatibility_matrix
+
         result = compatibility_matrix()
         self._print_toolkit_result(result)
 
@@ -3085,33 +4010,7 @@ class CLI:
         detection = detect_chipset_for_device(context)
         chipset = detection.chipset if detection else "Unknown"
 
-        guides = {
-            "Qualcomm": {
-                "summary": "Qualcomm devices can often enter EDL via test-point short.",
-                "references": [
-                    "https://github.com/bkerler/edl",
-                    "https://forum.xda-developers.com/",
-                ],
-            },
-            "MediaTek": {
-                "summary": "MediaTek bootrom/preloader modes may require test-point access.",
-                "references": [
-                    "https://github.com/bkerler/mtkclient",
-                    "https://forum.xda-developers.com/",
-                ],
-            },
-            "Samsung Exynos": {
-                "summary": "Samsung download mode access varies by model and requires OEM docs.",
-                "references": [
-                    "https://forum.xda-developers.com/",
-                ],
-            },
-        }
-
-        guide = guides.get(
-            chipset,
-            {"summary": "Use model-specific guides for test-point access.", "references": []},
-        )
+        guide = _TESTPOINT_GUIDES.get(chipset, _TESTPOINT_DEFAULT)
 
         print(f"📌 Test-point guidance for {chipset}:")
         print(f"   {guide['summary']}")
@@ -3139,20 +4038,14 @@ class CLI:
             return
 
         keyword = " ".join(args).strip().lower()
-        matches = []
-        for command in self.command_catalog.values():
-            haystack = " ".join(
-                [command.name, command.summary, command.usage, " ".join(command.aliases), command.category]
-            ).lower()
-            if keyword in haystack:
-                matches.append(command)
+        matches = _search_commands(self._search_index, keyword)
 
         if not matches:
             print(f"❌ No commands matched '{keyword}'.")
             return
 
         print(f"\n🔎 Matches for '{keyword}':\n")
-        for command in sorted(matches, key=lambda item: (item.category, item.name)):
+        for command in matches:
             alias_text = f" (aliases: {', '.join(command.aliases)})" if command.aliases else ""
             print(f"  {command.name} — {command.summary}{alias_text}")
 
@@ -3168,249 +4061,60 @@ class CLI:
                 print("Tip: use 'search <keyword>' to discover commands.")
                 return
 
-            print(f"\n📘 Help: {command.name}\n")
-            print(f"Summary: {command.summary}")
-            print(f"Usage:   {command.usage}")
+            lines = [
+                f"\n📘 Help: {command.name}\n",
+                f"Summary: {command.summary}",
+                f"Usage:   {command.usage}",
+            ]
             if command.aliases:
-                print(f"Aliases: {', '.join(command.aliases)}")
+                lines.append(f"Aliases: {', '.join(command.aliases)}")
             if command.examples:
-                print("\nExamples:")
-                for example in command.examples:
-                    print(f"  {example}")
+                lines.append("\nExamples:")
+                lines.extend(f"  {example}" for example in command.examples)
+            _write_lines(lines)
             return
 
-        help_text = """
-╔══════════════════════════════════════════════════════════════╗
-║                   VOID - HELP                                ║
-║                                                              ║
-║  Copyright (c) 2024 Roach Labs. All rights reserved.        ║
-║  Made by James Michael Roach Jr.                            ║
-║  Proprietary and confidential.                              ║
-╚══════════════════════════════════════════════════════════════╝
-
-📋 AVAILABLE COMMANDS:
-
-Tip: Use 'help <command>' for detailed usage or 'search <keyword>' to find commands.
-
-DEVICE MANAGEMENT:
-  devices                          - List all connected devices
-  info <device_id|smart>           - Show detailed device info
-  summary                          - Show a short device summary
-  
-BACKUP & DATA:
-  backup <device_id|smart>         - Create automated backup
-  recover <device_id|smart> <type> - Recover data (contacts/sms)
-  screenshot <device_id|smart>     - Take screenshot
-  
-APP MANAGEMENT:
-  apps <device_id|smart> [filter]  - List apps (system/user/all)
-  
-FILE OPERATIONS:
-  files <device_id|smart> list [path]    - List files
-  files <device_id|smart> pull <path> [local] - Pull file from device
-  files <device_id|smart> push <local> <remote> - Push file to device
-  files <device_id|smart> delete <path>  - Delete file on device
-  
-ANALYSIS:
-  analyze <device_id|smart>        - Performance analysis
-  display-diagnostics <device_id|smart>  - Display + framebuffer diagnostics
-  report <device_id|smart>         - Generate full report
-  repair-flow <device_id|smart> [--report] - Run guided repair workflow
-  logcat <device_id|smart> [tag]   - View real-time logs
-  
-TWEAKS:
-  tweak <device_id|smart> <type> <value> - System tweaks
-    Types: dpi, animation, timeout
-  usb-debug <device_id|smart> [force]    - Enable or force USB debugging
-
-FRP BYPASS:
-  execute <method> <device_id|smart>     - Execute bypass method
-    Methods: adb_shell_reset, fastboot_erase, etc.
-
-ADVANCED TOOLBOX:
-  advanced                         - Show advanced Android tooling overview
-  partitions <device_id|smart>     - List partitions via ADB
-  partition-backup <device_id|smart> <partition> [output_dir] - Backup partition via ADB
-  partition-wipe <device_id|smart> <partition> - Wipe partition via ADB/fastboot (destructive)
-
-EDL & TEST-POINT:
-  edl-status <device_id|smart>           - Detect EDL mode + USB VID/PID
-  edl-enter <device_id|smart>            - Enter EDL mode (if supported)
-  edl-flash <device_id|smart> <loader> <image> - Flash via EDL (chipset-specific)
-  edl-dump <device_id|smart> <partition> - Dump a partition via EDL
-  edl-detect                            - Scan USB for EDL devices
-  edl-programmers                       - List available firehose programmers
-  edl-partitions <device_id|smart> [loader] - Show partition map
-  edl-backup <device_id|smart> <partition> - Backup partition via EDL
-  edl-restore <device_id|smart> <loader> <image> - Restore partition via EDL
-  edl-sparse <to-raw|to-sparse> <source> <dest> - Convert sparse images
-  edl-profile <list|add|delete>          - Manage EDL profiles
-  edl-verify <file> [sha256]             - Verify image hash
-  edl-unbrick [loader]                   - Show unbrick checklist
-  edl-notes [vendor]                     - Show device-specific notes
-  edl-reboot <device_id|smart> <target>  - Reboot to target mode
-  edl-log                               - Capture EDL workflow logs
-  boot-extract <boot.img>                - Extract boot image contents
-  magisk-patch <device_id|smart> <boot.img> - Stage Magisk patch workflow
-  magisk-pull <device_id|smart> [output_dir] - Pull Magisk patched image
-  twrp-verify <device_id|smart> <twrp.img> - Validate TWRP image
-  twrp-flash <device_id|smart> <twrp.img> [boot] - Flash/boot TWRP
-  root-verify <device_id|smart>          - Verify root access
-  safety-check <device_id|smart>         - Run safety checklist
-  rollback <device_id|smart> <partition> <image> - Roll back a flash
-  compat-matrix                          - Show EDL compatibility matrix
-  testpoint-guide <device_id|smart>      - Show test-point references
-  
-SYSTEM:
-  stats                            - Show suite statistics
-  monitor                          - Show system monitor
-  version                          - Show suite version
-  paths                            - Show local data paths
-  menu                             - Launch interactive menu
-  netcheck                         - Check internet connectivity
-  bootstrap [force]                - Install bundled platform tools
-  adb                              - Check ADB availability
-  clear-cache                      - Clear local cache
-  doctor                           - Run quick system checks
-  logs                             - List recent log files
-  backups                          - List recent backups
-  reports                          - List recent reports
-  exports                          - List recent exports
-  devices-json                     - Export devices to JSON
-  stats-json                       - Export stats to JSON
-  logtail [lines]                  - Tail recent log lines
-  cleanup-exports                  - Remove old exports
-  cleanup-backups                  - Remove old backups
-  cleanup-reports                  - Remove old reports
-  env                              - Show environment info
-  recent-logs [count]              - Show recent log entries
-  recent-backups [count]           - Show recent backup records
-  recent-reports [count]           - Show recent report records
-  logs-json                        - Export logs to JSON
-  logs-export <json|csv> [filters] - Export filtered logs to JSON/CSV
-  backups-json                     - Export backups to JSON
-  latest-report                    - Show latest report paths
-  recent-devices [count]           - Show recent devices
-  methods [count]                  - Show top methods
-  methods-json                     - Export top methods to JSON
-  db-health                        - Show database health summary
-  stats-plus                       - Show extended stats
-  reports-json                     - Export reports to JSON
-  smart [status|on|off]            - Show or toggle smart features
-  launcher <install|uninstall|status> - Manage start menu launchers
-  reports-open                     - Open reports directory
-  recent-reports-json              - Export recent reports to JSON
-  config                           - Show configuration values
-  config-json                      - Export configuration to JSON
-  exports-open                     - Open exports directory
-  db-backup                        - Backup database to exports
-  plugins                          - List available plugins
-  plugin <id> [args]               - Run a plugin by id
-  search <keyword>                 - Search commands by keyword
-  help                             - Show this help
-  exit                             - Exit suite
-
-🎯 EXAMPLES:
-
-  void> devices
-  void> info emulator-5554
-  void> summary
-  void> backup emulator-5554
-  void> screenshot emulator-5554
-  void> apps emulator-5554 user
-  void> analyze emulator-5554
-  void> display-diagnostics emulator-5554
-  void> recover emulator-5554 contacts
-  void> tweak emulator-5554 dpi 320
-  void> usb-debug emulator-5554 force
-  void> report emulator-5554
-  void> partitions emulator-5554
-  void> partition-backup emulator-5554 boot
-  void> partition-wipe emulator-5554 userdata
-  void> repair-flow emulator-5554 --report
-  void> execute adb_shell_reset emulator-5554
-  void> edl-status usb-05c6:9008
-  void> edl-enter emulator-5554
-  void> edl-flash usb-05c6:9008 firehose.mbn boot.img
-  void> edl-dump usb-05c6:9008 userdata
-  void> edl-detect
-  void> edl-programmers
-  void> edl-partitions emulator-5554
-  void> edl-backup usb-05c6:9008 modem
-  void> edl-restore usb-05c6:9008 firehose.mbn boot.img
-  void> edl-sparse to-raw system.img system.raw.img
-  void> edl-profile list
-  void> edl-verify boot.img
-  void> edl-unbrick firehose.mbn
-  void> edl-notes qualcomm
-  void> edl-reboot emulator-5554 edl
-  void> edl-log
-  void> boot-extract boot.img
-  void> magisk-patch emulator-5554 boot.img
-  void> magisk-pull emulator-5554
-  void> twrp-verify emulator-5554 twrp.img
-  void> twrp-flash emulator-5554 twrp.img
-  void> root-verify emulator-5554
-  void> safety-check emulator-5554
-  void> rollback emulator-5554 boot boot_backup.img
-  void> compat-matrix
-  void> testpoint-guide usb-05c6:9008
-  void> menu
-  void> version
-  void> paths
-  void> netcheck
-  void> adb
-  void> doctor
-  void> logtail 100
-  void> recent-logs 25
-  void> logs-export json level=error since=2024-01-01
-  void> recent-backups 10
-  void> recent-reports 10
-  void> methods 5
-  void> reports-open
-  void> config-json
-  void> plugins
-  void> plugin system-info
-  void> search backup
-  void> help devices
-
-💡 TIP: All commands work automatically with no setup required!
-
-╚══════════════════════════════════════════════════════════════╝
-"""
-        print(help_text)
+        _write_help()
 
     def _cmd_plugins(self) -> None:
         """List available plugins."""
-        plugins = self.plugin_registry.list_metadata()
-
-        if not plugins:
+        discover_plugins()
+        if self.plugin_registry.is_empty:
             print("No plugins registered.")
             return
 
+        plugins = self.plugin_registry.list_metadata()
+
         if self.console:
+            from rich.table import Table
+
             table = Table(title="Available Plugins")
-            table.add_column("ID", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Description", style="yellow")
-            table.add_column("Version", style="magenta")
-            table.add_column("Tags", style="blue")
-            for plugin in plugins:
-                table.add_row(
-                    plugin.id,
-                    plugin.name,
-                    plugin.description,
-                    plugin.version,
-                    ", ".join(plugin.tags) if plugin.tags else "-",
-                )
+            for header, style in _PLUGIN_COLUMNS:
+                table.add_column(header, style=style)
+            rows = [
+                (plugin.id, plugin.name, plugin.description, plugin.version, plugin.tags_display)
+                for plugin in plugins
+            ]
+            for row in rows:
+                table.add_row(*row)
             self.console.print(table)
             return
 
-        print("\n🔌 Available Plugins:")
+        lines = ["\n🔌 Available Plugins:"]
         for plugin in plugins:
-            tags = ", ".join(plugin.tags) if plugin.tags else "-"
-            print(f"  • {plugin.id} - {plugin.name} ({plugin.version}) [{tags}]")
-            print(f"      {plugin.description}")
+            lines.append(
+                f"  • {plugin.id} - {plugin.name} ({plugin.version}) [{plugin.tags_display}]"
+            )
+            lines.append(f"      {plugin.description}")
+        _write_lines(lines)
+
+    def _run_plugin(self, plugin_id: str, plugin_args: List[str]) -> PluginResult:
+        """Run a plugin, writing out anything it emitted even if it raises."""
+        discover_plugins()
+        try:
+            return self.plugin_registry.run(plugin_id, self._plugin_context, plugin_args)
+        finally:
+            self._plugin_emit.flush()
 
     def _cmd_plugin(self, args: List[str]) -> None:
         """Run a plugin by id."""
@@ -3420,20 +4124,84 @@ SYSTEM:
 
         plugin_id = args[0]
         plugin_args = args[1:]
-        context = PluginContext(mode="cli", emit=print)
 
         try:
-            result = self.plugin_registry.run(plugin_id, context, plugin_args)
+            result = self._run_plugin(plugin_id, plugin_args)
         except KeyError as exc:
             print(f"❌ {exc}")
             return
-        except Exception as exc:
+        except PluginExecutionError as exc:
             print(f"❌ Plugin failed: {exc}")
             return
 
         print(f"✅ {result.message}")
         if result.data:
-            print(json.dumps(result.data, indent=2))
+            print(_json_text(result.data))
+
+
+# Built after CLI so entries can reference its menu handlers directly.
+_DEVICE_MENU = _menu(
+    MenuItem("List devices", "Show all connected devices", "l", command="devices"),
+    MenuItem("Device summary", "Quick overview of all devices", "s", command="summary"),
+    MenuItem("Device info", "Inspect a single device", "i", action=CLI._menu_device_info),
+    MenuItem("Screenshot", "Capture device screen", "c", action=CLI._menu_screenshot),
+)
+
+_BACKUP_MENU = _menu(
+    MenuItem("Create backup", "Automated device backup", "b", action=CLI._menu_backup_create),
+    MenuItem(
+        "Recover contacts", "Restore contacts data", "c", action=CLI._menu_recover, args=("contacts",)
+    ),
+    MenuItem("Recover SMS", "Restore SMS messages", "s", action=CLI._menu_recover, args=("sms",)),
+    MenuItem("Recent backups (DB)", "Show recent backup records", "r", command="recent-backups"),
+)
+
+_APPS_FILES_MENU = _menu(
+    MenuItem("List apps", "List installed apps", "a", action=CLI._menu_apps),
+    MenuItem("List files", "Browse device storage", "l", action=CLI._menu_files, args=("list",)),
+    MenuItem("Pull file", "Copy file from device", "p", action=CLI._menu_files, args=("pull",)),
+    MenuItem("Push file", "Copy file to device", "u", action=CLI._menu_files, args=("push",)),
+    MenuItem("Delete file", "Remove file from device", "d", action=CLI._menu_files, args=("delete",)),
+)
+
+_ANALYSIS_MENU = _menu(
+    MenuItem("Analyze device", "Performance analysis", "a", action=CLI._menu_analyze),
+    MenuItem("Generate report", "Create full device report", "g", action=CLI._menu_report),
+    MenuItem("Latest report paths", "Show latest report files", "l", command="latest-report"),
+    MenuItem("Recent reports (DB)", "Show recent report records", "r", command="recent-reports"),
+)
+
+_SYSTEM_MENU = _menu(
+    MenuItem("Suite stats", "Usage statistics", "s", command="stats"),
+    MenuItem("Version info", "Suite version details", "v", command="version"),
+    MenuItem("System monitor", "CPU/Memory/Disk usage", "m", command="monitor"),
+    MenuItem("Show paths", "Local data directories", "p", command="paths"),
+    MenuItem("Install platform tools", "Bundle ADB/Fastboot locally", "z", command="bootstrap"),
+    MenuItem("System checks", "Connectivity and health checks", "d", command="doctor"),
+    MenuItem("Network check", "Internet reachability", "n", command="netcheck"),
+    MenuItem("ADB availability", "ADB version check", "a", command="adb"),
+    MenuItem("DB health", "Database size and totals", "h", command="db-health"),
+    MenuItem("Recent logs (DB)", "Latest log entries", "l", command="recent-logs"),
+    MenuItem("Tail log file", "Show last 50 lines", "t", command="logtail 50"),
+    MenuItem("Clear cache", "Clear cached files", "c", command="clear-cache"),
+    MenuItem("Log files", "List recent log files", "g", command="logs"),
+    MenuItem("Backups", "List recent backups", "b", command="backups"),
+    MenuItem("Reports", "List recent reports", "r", command="reports"),
+    MenuItem("Exports", "List recent exports", "e", command="exports"),
+    MenuItem("Environment", "Runtime environment info", "i", command="env"),
+    MenuItem("Smart mode", "Smart suggestions and toggles", "x", command="smart"),
+    MenuItem("Start menu launcher", "Install or remove launchers", "y", command="launcher"),
+)
+
+_MAIN_MENU = _menu(
+    MenuItem("Devices", "Detect and inspect connected devices", "d", submenu=_DEVICE_MENU),
+    MenuItem("Backup & Recovery", "Backups and data recovery tools", "b", submenu=_BACKUP_MENU),
+    MenuItem("Apps & Files", "App listing and file operations", "a", submenu=_APPS_FILES_MENU),
+    MenuItem("Analysis & Reports", "Performance analysis and reports", "r", submenu=_ANALYSIS_MENU),
+    MenuItem("System & Diagnostics", "Health checks and system tools", "s", submenu=_SYSTEM_MENU),
+    MenuItem("Advanced Toolbox", "EDL, recovery, and expert workflows", "x", command="advanced"),
+    MenuItem("Exit Menu", "Return to CLI prompt", "q", exit=True),
+)
 
 
 __all__ = ["CLI", "RICH_AVAILABLE"]
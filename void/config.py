@@ -8,9 +8,19 @@ Unauthorized copying, modification, distribution, or disclosure is prohibited.
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
+import copy
 import json
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# An mtime younger than this may still hide a same-tick, same-size rewrite.
+_MTIME_SETTLE_NS = 2_000_000_000
 
 
 class Config:
@@ -69,6 +79,9 @@ class Config:
     TOOLS_DIR = BASE_DIR / "tools"
     ANDROID_PLATFORM_TOOLS_DIR = TOOLS_DIR / "platform-tools"
 
+    # Last parsed config keyed by (path, mtime_ns, size); see read_config().
+    _config_cache: Optional[Tuple[Tuple[str, int, int], Dict[str, Any]]] = None
+
     # Security
     MAX_INPUT_LENGTH = 256
 
@@ -145,22 +158,48 @@ class Config:
 
     @classmethod
     def read_config(cls) -> Dict[str, Any]:
-        """Read the JSON config file."""
+        """Read the JSON config file, reusing the last parse while the file is unchanged."""
         try:
-            with cls.CONFIG_PATH.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-                return data if isinstance(data, dict) else {}
+            stat = cls.CONFIG_PATH.stat()
+        except FileNotFoundError:
+            cls._config_cache = None
+            return {}
+        key = (str(cls.CONFIG_PATH), stat.st_mtime_ns, stat.st_size)
+        cached = cls._config_cache
+        if cached is not None and cached[0] == key:
+            return copy.deepcopy(cached[1])
+        try:
+            with cls.CONFIG_PATH.open("rb") as handle:
+                raw = handle.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except FileNotFoundError:
             return {}
         except json.JSONDecodeError:
             return {}
+        data = data if isinstance(data, dict) else {}
+        # Only trust settled mtimes; coarse timestamps can hide a same-tick rewrite.
+        if time.time_ns() - stat.st_mtime_ns > _MTIME_SETTLE_NS:
+            cls._config_cache = (key, data)
+            return copy.deepcopy(data)
+        cls._config_cache = None
+        return data
 
     @classmethod
     def write_config(cls, data: Dict[str, Any]) -> None:
         """Persist JSON config data."""
         cls.BASE_DIR.mkdir(parents=True, exist_ok=True)
-        with cls.CONFIG_PATH.open("w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2, sort_keys=True)
+        payload = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            except TypeError:
+                pass
+        if payload is not None:
+            cls.CONFIG_PATH.write_bytes(payload)
+        else:
+            with cls.CONFIG_PATH.open("w", encoding="utf-8") as handle:
+                json.dump(data, handle, indent=2, sort_keys=True)
+        cls._config_cache = None
 
     @classmethod
     def _normalize_settings(cls, settings: Dict[str, Any]) -> Dict[str, Any]:
@@ -207,7 +207,7 @@ class Database:
                 """
                 SELECT timestamp, level, category, message, device_id, method
                 FROM logs
-                ORDER BY timestamp DESC
+                ORDER BY id DESC
                 LIMIT ?
                 """,
                 (limit,),
@@ -256,7 +256,11 @@ class Database:
         if clauses:
             query += " WHERE " + " AND ".join(clauses)
 
-        query += " ORDER BY timestamp DESC LIMIT ?"
+        # Rows are stamped on insert, so rowid order is timestamp order. A date range is served
+        # by idx_logs_timestamp, which already yields rows in that order; otherwise the rowid
+        # walk avoids a sort.
+        order = "timestamp" if since or until else "id"
+        query += f" ORDER BY {order} DESC LIMIT ?"
         params.append(limit)
 
         with self._get_connection() as conn:
@@ -270,7 +274,7 @@ class Database:
                 """
                 SELECT device_id, backup_name, backup_path, backup_size, backup_type, created
                 FROM backups
-                ORDER BY created DESC
+                ORDER BY id DESC
                 LIMIT ?
                 """,
                 (limit,),
@@ -285,7 +289,7 @@ class Database:
                 SELECT timestamp, event_data, device_id
                 FROM analytics
                 WHERE event_type = 'report'
-                ORDER BY timestamp DESC
+                ORDER BY id DESC
                 LIMIT ?
                 """,
                 (limit,),
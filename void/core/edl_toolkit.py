@@ -11,6 +11,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
+import mmap
+import os
 from pathlib import Path
 import shutil
 import subprocess
@@ -19,7 +21,7 @@ from typing import Any, Iterable
 from ..config import Config
 from .device import DeviceDetector
 from .edl import edl_dump, edl_flash
-from .utils import SafeSubprocess, check_tool, check_tools
+from .utils import SafeSubprocess, check_tool, check_tools, copy_file
 
 
 @dataclass(frozen=True)
@@ -176,6 +178,18 @@ def convert_sparse_image(source: Path, dest: Path, to_sparse: bool) -> ToolkitRe
     )
 
 
+def _sha256_file(path: Path) -> str:
+    """Hash a file in C: hashlib.file_digest on 3.11+, otherwise one update over an mmap."""
+    with path.open("rb", buffering=0) as handle:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        if os.fstat(handle.fileno()).st_size:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        return digest.hexdigest()
+
+
 def verify_hash(path: Path, expected: str | None = None) -> ToolkitResult:
     if not path.exists():
         return ToolkitResult(
@@ -183,11 +197,7 @@ def verify_hash(path: Path, expected: str | None = None) -> ToolkitResult:
             message="File not found for hash verification.",
             data={"path": str(path)},
         )
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    computed = digest.hexdigest()
+    computed = _sha256_file(path)
     matches = expected.lower() == computed.lower() if expected else True
     return ToolkitResult(
         success=matches,
@@ -349,7 +359,7 @@ def extract_boot_image(boot_image: Path) -> ToolkitResult:
     output_dir.mkdir(parents=True, exist_ok=True)
     target = output_dir / boot_image.name
     if boot_image.resolve() != target.resolve():
-        shutil.copy2(boot_image, target)
+        copy_file(boot_image, target)
 
     if shutil.which("magiskboot"):
         try:
@@ -9,7 +9,7 @@ Proprietary and confidential. Unauthorized use or distribution is prohibited.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 from ..config import Config
 from .utils import SafeSubprocess
@@ -19,25 +19,55 @@ class FileManager:
     """Device file management"""
 
     @staticmethod
-    def list_files(device_id: str, path: str = '/sdcard') -> List[Dict]:
-        """List files in directory"""
+    def _ls_lines(device_id: str, path: str) -> List[str]:
+        """Return the raw ``ls -la`` output lines for ``path``"""
         code, stdout, _ = SafeSubprocess.run(['adb', '-s', device_id, 'shell', 'ls', '-la', path])
+        if code != 0:
+            return []
+        return stdout.strip().split('\n')
+
+    @staticmethod
+    def _parse_entry(line: str) -> Dict | None:
+        """Parse one ``ls -la`` line, or return None for headers and short lines"""
+        parts = line.split()
+        if len(parts) < 8:
+            return None
+        return {
+            'permissions': parts[0],
+            'size': parts[4],
+            'date': f"{parts[5]} {parts[6]}",
+            'name': ' '.join(parts[7:]),
+        }
 
-        files = []
-        if code == 0:
-            for line in stdout.strip().split('\n'):
-                parts = line.split()
-                if len(parts) >= 8:
-                    files.append(
-                        {
-                            'permissions': parts[0],
-                            'size': parts[4],
-                            'date': f"{parts[5]} {parts[6]}",
-                            'name': ' '.join(parts[7:]),
-                        }
-                    )
-
-        return files
+    @staticmethod
+    def iter_files(device_id: str, path: str = '/sdcard') -> Iterator[Dict]:
+        """Yield parsed directory entries one at a time"""
+        for line in FileManager._ls_lines(device_id, path):
+            entry = FileManager._parse_entry(line)
+            if entry is not None:
+                yield entry
+
+    @staticmethod
+    def list_head(device_id: str, path: str = '/sdcard', limit: int = 20) -> Tuple[List[Dict], int]:
+        """Return the first ``limit`` entries and how many more there are
+
+        Lines past the limit are only checked for the entry field count, not parsed.
+        """
+        entries: List[Dict] = []
+        remaining = 0
+        for line in FileManager._ls_lines(device_id, path):
+            if len(entries) < limit:
+                entry = FileManager._parse_entry(line)
+                if entry is not None:
+                    entries.append(entry)
+            elif len(line.split(None, 7)) == 8:
+                remaining += 1
+        return entries, remaining
+
+    @staticmethod
+    def list_files(device_id: str, path: str = '/sdcard') -> List[Dict]:
+        """List files in directory"""
+        return list(FileManager.iter_files(device_id, path))
 
     @staticmethod
     def pull_file(device_id: str, remote_path: str, local_path: Path = None) -> Dict:
@@ -8,8 +8,9 @@ Proprietary and confidential. Unauthorized use or distribution is prohibited.
 
 from __future__ import annotations
 
+import os
 import subprocess
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 from .logging import logger
 
@@ -20,6 +21,7 @@ class LogcatViewer:
     def __init__(self):
         self.process = None
         self.running = False
+        self._partial = b""
 
     def start(
         self,
@@ -39,7 +41,6 @@ class LogcatViewer:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
             )
         except (FileNotFoundError, OSError) as exc:
             self.process = None
@@ -50,6 +51,7 @@ class LogcatViewer:
             return
 
         self.running = True
+        self._partial = b""
 
         logger.log('info', 'logcat', 'Logcat started')
         if progress_callback:
@@ -68,11 +70,33 @@ class LogcatViewer:
         """Read one line"""
         if self.process and self.running:
             try:
-                return self.process.stdout.readline()
+                return self.process.stdout.readline().decode("utf-8", errors="replace")
             except Exception:
                 pass
         return None
 
+    def read_lines(self) -> Optional[List[str]]:
+        """Block until output arrives, then return every complete line received.
+
+        Whatever the pipe holds (up to 64 KiB) is taken in one read, so a burst comes back as
+        one batch; a trailing partial line is kept for the next call. Returns None once the
+        stream has ended. Reads the pipe descriptor directly, so don't mix with read_line().
+        """
+        if not (self.process and self.running and self.process.stdout):
+            return None
+        fd = self.process.stdout.fileno()
+        while True:
+            try:
+                data = os.read(fd, 65536)
+            except OSError:
+                return None
+            if not data:
+                tail, self._partial = self._partial, b""
+                return [tail.decode("utf-8", errors="replace")] if tail else None
+            *lines, self._partial = (self._partial + data).split(b"\n")
+            if lines:
+                return [line.decode("utf-8", errors="replace") for line in lines]
+
     @staticmethod
     def capture_logcat(device_id: str, level: str = None, tag: str = None, lines: int = None) -> str:
         """Capture logcat output
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import threading
 import time
-from typing import Dict
+from typing import Dict, Optional
 
 from .logging import logger
 
@@ -66,11 +66,15 @@ class SystemMonitor:
             except Exception:
                 pass
 
-    def get_stats(self) -> Dict:
-        """Get current statistics"""
+    def get_stats(self, interval: Optional[float] = None) -> Dict:
+        """Get current statistics
+
+        Without ``interval`` CPU usage is measured since the previous psutil call, which
+        is meaningless on the first call; pass a short interval to take a real sample.
+        """
         if PSUTIL_AVAILABLE:
             return {
-                'cpu_percent': psutil.cpu_percent(),
+                'cpu_percent': psutil.cpu_percent(interval=interval),
                 'memory_percent': psutil.virtual_memory().percent,
                 'disk_usage': psutil.disk_usage('/').percent,
                 'cpu_history': self.stats['cpu'][-20:],
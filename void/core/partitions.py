@@ -13,7 +13,6 @@ from typing import Any, Dict, Optional
 
 from ..config import Config
 from .device import DeviceDetector
-from .edl_toolkit import list_partitions_via_adb
 from .logging import logger
 from .utils import SafeSubprocess
 
@@ -34,6 +33,8 @@ def list_partitions(device_id: str) -> Dict[str, Any]:
             "mode": mode,
         }
 
+    from .edl_toolkit import list_partitions_via_adb
+
     result = list_partitions_via_adb(device_id)
     return {
         "success": result.success,
@@ -9,6 +9,8 @@ Proprietary and confidential. Unauthorized use or distribution is prohibited.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import errno
+import os
 import platform
 import shutil
 import subprocess
@@ -125,3 +127,26 @@ def check_tool(
 def check_tools(tools: Iterable[tuple[str, Sequence[str] | None]]) -> List[ToolCheckResult]:
     """Validate a list of tools from (name, version_args) tuples."""
     return [check_tool(name, version_args) for name, version_args in tools]
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` with metadata, in-kernel via copy_file_range where available."""
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        # The source shrank, or the filesystem reports 0 instead of an errno;
+                        # redo the copy through userspace rather than keep a truncated file.
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError as exc:
+            if exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    shutil.copy2(src, dst)
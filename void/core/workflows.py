@@ -13,7 +13,6 @@ from typing import Any, Callable, Dict, List, Optional
 
 from .device import DeviceDetector
 from .display import DisplayAnalyzer
-from .edl_toolkit import list_partitions_via_adb, read_partition_table
 from .logging import logger
 from .network import NetworkAnalyzer
 from .performance import PerformanceAnalyzer
@@ -195,6 +194,8 @@ class RepairWorkflow:
         }
 
     def _scan_partitions(self, init_result: Dict[str, Any]) -> Dict[str, Any]:
+        from .edl_toolkit import list_partitions_via_adb, read_partition_table
+
         mode = str(init_result.get("mode") or "").lower()
         adb_available = init_result["prerequisites"].get("adb", {}).get("available", False)
         results: Dict[str, Any] = {}
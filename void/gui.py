@@ -65,6 +65,12 @@ except ImportError:
     GUI_AVAILABLE = False
 
 
+def _write_json(path: Path, obj: Any) -> None:
+    """Stream ``obj`` into ``path`` as indented JSON without building the whole string first."""
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(obj, handle, indent=2)
+
+
 class Tooltip:
     """Lightweight tooltip helper for Tk widgets."""
 
@@ -2409,7 +2415,7 @@ class VoidGUI:
             return
 
         plugin = self.plugin_metadata[selection[0]]
-        tags = ", ".join(plugin.tags) if plugin.tags else "None"
+        tags = plugin.tags_display if plugin.tags else "None"
         details = (
             f"{plugin.name} ({plugin.id})\n"
             f"Version: {plugin.version}\n"
@@ -7465,7 +7471,7 @@ TOOLS NEEDED:
             devices, _ = DeviceDetector.detect_all()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_path = Config.EXPORTS_DIR / f"devices_{timestamp}.json"
-            export_path.write_text(json.dumps(devices, indent=2))
+            _write_json(export_path, devices)
             self._log(f"Devices exported: {export_path}")
             return {"success": True, "message": f"Devices exported: {export_path}"}
 
@@ -7476,7 +7482,7 @@ TOOLS NEEDED:
             stats = db.get_statistics()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_path = Config.EXPORTS_DIR / f"stats_{timestamp}.json"
-            export_path.write_text(json.dumps(stats, indent=2))
+            _write_json(export_path, stats)
             self._log(f"Stats exported: {export_path}")
             return {"success": True, "message": f"Stats exported: {export_path}"}
 
@@ -7489,7 +7495,7 @@ TOOLS NEEDED:
                 return {"success": False, "message": "No log entries found."}
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_path = Config.EXPORTS_DIR / f"logs_{timestamp}.json"
-            export_path.write_text(json.dumps(rows, indent=2))
+            _write_json(export_path, rows)
             self._log(f"Logs exported: {export_path}")
             return {"success": True, "message": f"Logs exported: {export_path}"}
 
@@ -7507,7 +7513,7 @@ TOOLS NEEDED:
                 return {"success": False, "message": "No report records found."}
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_path = Config.EXPORTS_DIR / f"reports_{timestamp}.json"
-            export_path.write_text(json.dumps(rows, indent=2))
+            _write_json(export_path, rows)
             self._log(f"Reports exported: {export_path}")
             return {"success": True, "message": f"Reports exported: {export_path}"}
 
@@ -7520,7 +7526,7 @@ TOOLS NEEDED:
                 return {"success": False, "message": "No backup records found."}
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_path = Config.EXPORTS_DIR / f"backups_{timestamp}.json"
-            export_path.write_text(json.dumps(rows, indent=2))
+            _write_json(export_path, rows)
             self._log(f"Backups exported: {export_path}")
             return {"success": True, "message": f"Backups exported: {export_path}"}
 
@@ -7715,7 +7721,7 @@ TOOLS NEEDED:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             export_path = Config.EXPORTS_DIR / f"logs_filtered_{timestamp}.{export_format}"
             if export_format == "json":
-                export_path.write_text(json.dumps(rows, indent=2))
+                _write_json(export_path, rows)
             else:
                 fieldnames = ["timestamp", "level", "category", "message", "device_id", "method"]
                 with export_path.open("w", newline="", encoding="utf-8") as handle:
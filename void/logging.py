@@ -10,10 +10,12 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from logging.handlers import MemoryHandler
 
 from .config import Config
 
 _CONFIGURED = False
+_FILE_BUFFER: MemoryHandler | None = None
 
 
 class StructuredFormatter(logging.Formatter):
@@ -28,7 +30,7 @@ class StructuredFormatter(logging.Formatter):
 
 def configure_logging(level: int = logging.DEBUG) -> None:
     """Configure log handlers for file and console."""
-    global _CONFIGURED
+    global _CONFIGURED, _FILE_BUFFER
     if _CONFIGURED:
         return
 
@@ -49,12 +51,21 @@ def configure_logging(level: int = logging.DEBUG) -> None:
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
-    root_logger.addHandler(file_handler)
+    # Batch file writes; errors and interpreter exit (logging.shutdown) flush right away.
+    _FILE_BUFFER = MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=file_handler)
+
+    root_logger.addHandler(_FILE_BUFFER)
     root_logger.addHandler(console_handler)
 
     _CONFIGURED = True
 
 
+def flush_logs() -> None:
+    """Write any buffered log records to the log file."""
+    if _FILE_BUFFER is not None:
+        _FILE_BUFFER.flush()
+
+
 def get_logger(name: str) -> logging.Logger:
     """Return a configured logger."""
     configure_logging()
@@ -6,11 +6,12 @@ Made by James Michael Roach Jr.
 Proprietary and confidential. Unauthorized use or distribution is prohibited.
 """
 
-from .base import PluginContext, PluginFeature, PluginMetadata, PluginResult
+from .base import PluginContext, PluginExecutionError, PluginFeature, PluginMetadata, PluginResult
 from .registry import discover_plugins, get_registry, register_plugin
 
 __all__ = [
     "PluginContext",
+    "PluginExecutionError",
     "PluginFeature",
     "PluginMetadata",
     "PluginResult",
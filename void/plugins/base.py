@@ -10,12 +10,20 @@ Proprietary and confidential. Unauthorized use or distribution is prohibited.
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Callable, Sequence
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep instance dicts.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+class PluginExecutionError(RuntimeError):
+    """Raised when a plugin fails while running."""
+
+
+@dataclass(frozen=True, **_SLOTS)
 class PluginMetadata:
     """Metadata describing a plugin feature."""
 
@@ -25,6 +33,14 @@ class PluginMetadata:
     version: str = "1.0.0"
     author: str = "Void"
     tags: tuple[str, ...] = ()
+    tags_display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Ids and tags are compared and joined on every listing; intern and format them once.
+        tags = tuple(sys.intern(tag) for tag in self.tags)
+        object.__setattr__(self, "id", sys.intern(self.id))
+        object.__setattr__(self, "tags", tags)
+        object.__setattr__(self, "tags_display", ", ".join(tags) or "-")
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize metadata for structured outputs."""
@@ -47,7 +63,7 @@ class PluginResult:
     data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PluginContext:
     """Execution context for plugins."""
 
@@ -10,9 +10,9 @@ from __future__ import annotations
 
 import importlib
 import pkgutil
-from typing import Dict, List, Sequence
+from typing import Dict, List, Sequence, Tuple
 
-from .base import PluginContext, PluginFeature, PluginMetadata, PluginResult
+from .base import PluginContext, PluginExecutionError, PluginFeature, PluginMetadata, PluginResult
 
 
 class PluginRegistry:
@@ -20,6 +20,9 @@ class PluginRegistry:
 
     def __init__(self) -> None:
         self._plugins: Dict[str, PluginFeature] = {}
+        # Bumped on every registration so callers can tell when cached views are stale.
+        self.version = 0
+        self._metadata_cache: Tuple[int, Tuple[PluginMetadata, ...]] | None = None
 
     def register(self, plugin: PluginFeature) -> None:
         """Register a plugin by its metadata id."""
@@ -27,24 +30,43 @@ class PluginRegistry:
         if plugin_id in self._plugins:
             raise ValueError(f"Plugin already registered: {plugin_id}")
         self._plugins[plugin_id] = plugin
+        self.version += 1
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no plugins have been registered."""
+        return not self._plugins
 
     def list_metadata(self) -> List[PluginMetadata]:
         """List plugin metadata sorted by name."""
-        return sorted(
-            (plugin.metadata for plugin in self._plugins.values()),
-            key=lambda meta: meta.name.lower(),
-        )
+        cached = self._metadata_cache
+        if cached is None or cached[0] != self.version:
+            ordered = tuple(
+                sorted(
+                    (plugin.metadata for plugin in self._plugins.values()),
+                    key=lambda meta: meta.name.lower(),
+                )
+            )
+            cached = self._metadata_cache = (self.version, ordered)
+        return list(cached[1])
 
     def get(self, plugin_id: str) -> PluginFeature | None:
         """Get a plugin by id."""
         return self._plugins.get(plugin_id)
 
     def run(self, plugin_id: str, context: PluginContext, args: Sequence[str]) -> PluginResult:
-        """Execute a plugin by id."""
+        """Execute a plugin by id.
+
+        Raises ``KeyError`` for unknown ids and wraps failures inside the plugin
+        in ``PluginExecutionError``.
+        """
         plugin = self.get(plugin_id)
         if not plugin:
             raise KeyError(f"Unknown plugin: {plugin_id}")
-        return plugin.run(context, args)
+        try:
+            return plugin.run(context, args)
+        except Exception as exc:
+            raise PluginExecutionError(str(exc)) from exc
 
 
 _REGISTRY = PluginRegistry()